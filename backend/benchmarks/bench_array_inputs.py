@@ -0,0 +1,83 @@
+"""
+Array Input Benchmark
+
+Compares passing ndarrays / pandas Series directly to the analyzers against
+the old `.tolist()` round trip that list-only APIs required.
+
+Usage:
+    python backend/benchmarks/bench_array_inputs.py [n_points]
+"""
+
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from market_correlation import MarketCorrelation  # noqa: E402
+from supply_demand import SupplyDemandAnalyzer  # noqa: E402
+from utils.validators import validate_list_of_finite_numbers  # noqa: E402
+
+
+def _best_of(fn: Callable[[], object], repeat: int = 5) -> float:
+    """Return the best wall time of several runs in milliseconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main(n_points: int = 100_000) -> None:
+    rng = np.random.default_rng(42)
+    stock = pd.Series(100 + rng.standard_normal(n_points).cumsum())
+    index = pd.Series(1000 + rng.standard_normal(n_points).cumsum())
+    volumes = rng.integers(100, 10_000, n_points).astype(np.float64)
+    price_volume = np.column_stack([np.round(stock.to_numpy(), 1), volumes])
+
+    correlation = MarketCorrelation()
+    supply_demand = SupplyDemandAnalyzer()
+
+    cases = [
+        (
+            "calculate_correlation",
+            lambda: correlation.calculate_correlation(stock.tolist(), index.tolist()),
+            lambda: correlation.calculate_correlation(stock, index),
+        ),
+        (
+            "calculate_beta",
+            lambda: correlation.calculate_beta(stock.tolist(), index.tolist()),
+            lambda: correlation.calculate_beta(stock, index),
+        ),
+        (
+            "detect_trend",
+            lambda: correlation.detect_trend(stock.tolist()),
+            lambda: correlation.detect_trend(stock),
+        ),
+        (
+            "calculate_volume_by_price",
+            lambda: supply_demand.calculate_volume_by_price([tuple(row) for row in price_volume.tolist()]),
+            lambda: supply_demand.calculate_volume_by_price(price_volume),
+        ),
+        (
+            "validate_list_of_finite_numbers",
+            lambda: validate_list_of_finite_numbers(stock.tolist()),
+            lambda: validate_list_of_finite_numbers(stock),
+        ),
+    ]
+
+    print(f"n_points={n_points}")
+    print(f"{'operation':<34}{'tolist (ms)':>12}{'native (ms)':>13}{'speedup':>9}")
+    for name, via_list, native in cases:
+        list_ms = _best_of(via_list)
+        native_ms = _best_of(native)
+        print(f"{name:<34}{list_ms:>12.2f}{native_ms:>13.2f}{list_ms / native_ms:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
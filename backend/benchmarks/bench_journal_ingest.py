@@ -0,0 +1,94 @@
+"""
+Journal Ingestion Benchmark
+
+Reports rows per second for loading a historical journal one add_entry
+call at a time versus the chunked bulk APIs (add_entries,
+load_from_records and load_from_csv).
+
+Usage:
+    python backend/benchmarks/bench_journal_ingest.py [n_rows]
+"""
+
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from trade_journal_analyzer import JournalEntry, TradeJournalAnalyzer  # noqa: E402
+from trade_journal_analyzer.models import TradeStatus  # noqa: E402
+
+
+def _best_of(fn: Callable[[], object], repeat: int = 3) -> float:
+    """Return the best wall time of several runs in seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _entries(n: int) -> List[JournalEntry]:
+    rng = random.Random(42)
+    base = datetime(2020, 1, 6, 9, 0)
+    symbols = [str(code) for code in range(1300, 1800)]
+    statuses = [TradeStatus.CLOSED, TradeStatus.CLOSED, TradeStatus.OPEN]
+    entries = []
+    for i in range(n):
+        profit = rng.uniform(-500, 500)
+        entries.append(JournalEntry(
+            f"t{i}", base + timedelta(minutes=i), rng.choice(symbols), 100.0, 100.0 + profit / 100,
+            profit, profit / 100, rng.choice(["RSI", "MACD", "MANUAL"]), "PRICE", rng.choice(statuses),
+        ))
+    return entries
+
+
+def _add_one_by_one(entries: List[JournalEntry]) -> None:
+    analyzer = TradeJournalAnalyzer()
+    for entry in entries:
+        analyzer.add_entry(entry)
+
+
+def main(n: int = 200_000) -> None:
+    entries = _entries(n)
+    records = [
+        {
+            "id": e.id, "timestamp": e.timestamp, "symbol": e.symbol, "entry_price": e.entry_price,
+            "exit_price": e.exit_price, "profit": e.profit, "profit_percent": e.profit_percent,
+            "signal_type": e.signal_type, "indicator": e.indicator, "status": e.status.value,
+        }
+        for e in entries
+    ]
+
+    fd, path = tempfile.mkstemp(suffix=".csv")
+    try:
+        with os.fdopen(fd, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=list(records[0]))
+            writer.writeheader()
+            writer.writerows(dict(r, timestamp=r["timestamp"].isoformat()) for r in records)
+
+        cases = [
+            ("add_entry loop", lambda: _add_one_by_one(entries)),
+            ("add_entries", lambda: TradeJournalAnalyzer().add_entries(entries)),
+            ("load_from_records", lambda: TradeJournalAnalyzer().load_from_records(records)),
+            ("load_from_csv", lambda: TradeJournalAnalyzer().load_from_csv(path)),
+        ]
+
+        print(f"n_rows={n}")
+        print(f"{'method':<22}{'seconds':>10}{'rows/s':>14}")
+        for name, fn in cases:
+            seconds = _best_of(fn)
+            print(f"{name:<22}{seconds:>10.3f}{n / seconds:>14,.0f}")
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,52 @@
+"""
+Journal Restart Benchmark
+
+Reports the time to bring a journal back after a restart: replaying every
+entry through add_entry versus TradeJournalAnalyzer.open warm-starting
+from the on-disk JournalLog (memory-mapped segments + aggregate snapshot).
+Also reports append throughput into the log.
+
+Usage:
+    python backend/benchmarks/bench_journal_restart.py [n_rows]
+"""
+
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from trade_journal_analyzer import TradeJournalAnalyzer  # noqa: E402
+from bench_journal_ingest import _add_one_by_one, _best_of, _entries  # noqa: E402
+
+
+def main(n: int = 200_000) -> None:
+    entries = _entries(n)
+    root = Path(tempfile.mkdtemp())
+    try:
+        path = root / "journal"
+        start = time.perf_counter()
+        with TradeJournalAnalyzer.open(path) as analyzer:
+            for entry in entries:
+                analyzer.add_entry(entry)
+        append_seconds = time.perf_counter() - start
+
+        cases = [
+            ("add_entry replay", lambda: _add_one_by_one(entries)),
+            ("warm open", lambda: TradeJournalAnalyzer.open(path)),
+        ]
+
+        print(f"n_rows={n}")
+        print(f"{'method':<22}{'seconds':>10}{'rows/s':>14}")
+        print(f"{'logged add_entry':<22}{append_seconds:>10.3f}{n / append_seconds:>14,.0f}")
+        for name, fn in cases:
+            seconds = _best_of(fn)
+            print(f"{name:<22}{seconds:>10.3f}{n / seconds:>14,.0f}")
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,98 @@
+"""
+Model Footprint Benchmark
+
+Compares memory and construction time of the slotted models against
+equivalent plain (__dict__-based) dataclasses, which is what the models
+were before they were slotted. Frozen variants pay for immutability with
+slower construction (dataclass frozen __init__ goes through
+object.__setattr__); use them only where hashing is needed.
+
+Usage:
+    python backend/benchmarks/bench_models.py [n_objects]
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+from dataclasses import field, fields, make_dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from supply_demand import BreakoutEvent, FrozenZone, Zone, ZoneType  # noqa: E402
+from trade_journal_analyzer import FrozenJournalEntry, JournalEntry  # noqa: E402
+from trade_journal_analyzer.models import TradeStatus  # noqa: E402
+
+
+def _measure(build: Callable[[int], object], n: int) -> List[float]:
+    """Return [milliseconds, bytes per object] for building n objects"""
+    elapsed = float("inf")
+    gc.disable()
+    try:
+        for _ in range(3):
+            start = time.perf_counter()
+            build(n)
+            elapsed = min(elapsed, time.perf_counter() - start)
+    finally:
+        gc.enable()
+
+    tracemalloc.start()
+    objects = build(n)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return [elapsed * 1000, current / n]
+
+
+def main(n: int = 200_000) -> None:
+    now = datetime(2026, 1, 5, 10, 0)
+    support = ZoneType.SUPPORT
+    closed = TradeStatus.CLOSED
+
+    plain_zone = make_dataclass("PlainZone", [(f.name, f.type) for f in fields(Zone)])
+    plain_entry = make_dataclass(
+        "PlainJournalEntry",
+        [(f.name, f.type) for f in fields(JournalEntry) if f.name != "notes"] + [("notes", str, field(default=""))],
+    )
+    plain_event = make_dataclass(
+        "PlainBreakoutEvent",
+        [(f.name, f.type) for f in fields(BreakoutEvent) if f.name != "timestamp"]
+        + [("timestamp", datetime, field(default_factory=datetime.now))],
+    )
+
+    def zones(cls):
+        return lambda k: [cls(100.0 + i, 1000, support, 0.5) for i in range(k)]
+
+    def entries(cls):
+        return lambda k: [cls(str(i), now, "7203", 100.0, 101.0, 1.0, 1.0, "RSI", "RSI", closed) for i in range(k)]
+
+    zone = Zone(100.0, 1000, support, 0.5)
+
+    def events(cls):
+        return lambda k: [cls("bullish", 101.0, zone, 5000, True) for _ in range(k)]
+
+    def stamped_events(cls):
+        return lambda k: [cls("bullish", 101.0, zone, 5000, True, now) for _ in range(k)]
+
+    cases = [
+        ("Zone", zones(plain_zone), zones(Zone)),
+        ("FrozenZone", zones(plain_zone), zones(FrozenZone)),
+        ("JournalEntry", entries(plain_entry), entries(JournalEntry)),
+        ("FrozenJournalEntry", entries(plain_entry), entries(FrozenJournalEntry)),
+        ("BreakoutEvent (default time)", events(plain_event), events(BreakoutEvent)),
+        ("BreakoutEvent (bar time)", stamped_events(plain_event), stamped_events(BreakoutEvent)),
+    ]
+
+    print(f"n_objects={n}")
+    print(f"{'model':<30}{'plain ms':>10}{'slotted ms':>12}{'plain B':>10}{'slotted B':>11}")
+    for name, plain, slotted in cases:
+        plain_ms, plain_bytes = _measure(plain, n)
+        slotted_ms, slotted_bytes = _measure(slotted, n)
+        print(f"{name:<30}{plain_ms:>10.1f}{slotted_ms:>12.1f}{plain_bytes:>10.0f}{slotted_bytes:>11.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -5,7 +5,8 @@ A module for analyzing market correlation and generating composite signals.
 """
 
 from .analyzer import MarketCorrelation
+from .ewm import EwmCorrelation, simple_returns
 from .models import MarketTrend
 
-__all__ = ["MarketCorrelation", "MarketTrend"]
+__all__ = ["MarketCorrelation", "MarketTrend", "EwmCorrelation", "simple_returns"]
 __version__ = "0.1.0"
@@ -7,8 +7,10 @@ Optimized with NumPy for high-performance calculations.
 
 import math
 import statistics
-from typing import List, Dict, Any
+from typing import Dict, Any, Mapping, Sequence, Tuple, Union
 from .models import MarketTrend
+from .ewm import EwmCorrelation, simple_returns, DEFAULT_EWM_HALF_LIFE
+from utils.validators import as_finite_float_array, NonNumericValueError, NonFiniteValueError
 
 try:
     import numpy as np
@@ -24,48 +26,122 @@ TREND_DETECTION_THRESHOLD = 0.0005  # 0.05% change per step
 CORR_LOW = 0.4
 CORR_HIGH = 0.6
 
+# Composite signal decision table
+# (Signal, Trend, Low correlation) -> (Recommendation, Confidence, Reasoning)
+COMPOSITE_RULES: Dict[Tuple[str, MarketTrend, bool], Tuple[str, str, str]] = {
+    ("buy", MarketTrend.BULLISH, False): ("buy", "high", "Bullish market supporting signal"),
+    ("buy", MarketTrend.BULLISH, True): ("buy", "high", "Low correlation - strong individual strength"),
+    ("buy", MarketTrend.BEARISH, False): ("wait", "low", "Bearish market override"),
+    ("buy", MarketTrend.BEARISH, True): ("cautious_buy", "low", "Individual strength despite bearish market"),
+    ("sell", MarketTrend.BEARISH, False): ("sell", "high", "Bearish market supporting signal"),
+    ("sell", MarketTrend.BEARISH, True): ("sell", "high", "Bearish market supporting signal"),
+    ("sell", MarketTrend.BULLISH, False): ("wait", "low", "Bullish market override"),
+    ("sell", MarketTrend.BULLISH, True): ("cautious_sell", "low", "Individual weakness despite bullish market"),
+}
+COMPOSITE_DEFAULT_CONFIDENCE = "medium"
+COMPOSITE_DEFAULT_REASONING = "No market alignment override"
+
+# Integer codes used by the vectorized decision table
+_SIGNAL_CODES = {"buy": 0, "sell": 1}
+_SIGNAL_OTHER = 2
+_TRENDS_BY_CODE = (MarketTrend.BEARISH, MarketTrend.NEUTRAL, MarketTrend.BULLISH)
+
+
+def _build_composite_tables() -> Tuple[Any, Any, Any]:
+    """Flatten COMPOSITE_RULES into lookup arrays indexed by
+    signal_code * 6 + trend_code * 2 + is_low_correlation.
+
+    An empty recommendation marks a pass-through of the individual signal.
+    """
+    recs, confs, reasons = [], [], []
+    for sig in ("buy", "sell", None):
+        for trend in _TRENDS_BY_CODE:
+            for low in (False, True):
+                rule = COMPOSITE_RULES.get((sig, trend, low)) if sig else None
+                if rule is None:
+                    rule = ("", COMPOSITE_DEFAULT_CONFIDENCE, COMPOSITE_DEFAULT_REASONING)
+                recs.append(rule[0])
+                confs.append(rule[1])
+                reasons.append(rule[2])
+    return np.array(recs), np.array(confs), np.array(reasons)
+
+
+if HAS_NUMPY:
+    _REC_TABLE, _CONF_TABLE, _REASON_TABLE = _build_composite_tables()
+    _TREND_NAMES = np.array([str(t) for t in _TRENDS_BY_CODE])
+
+
+def _as_price_matrix(price_matrix: Any) -> "np.ndarray":
+    """Return a (N, T) float64 view of a price matrix"""
+    if not HAS_NUMPY:
+        raise ImportError("NumPy is required for batch analysis")
+    prices = np.asarray(price_matrix, dtype=np.float64)
+    if prices.ndim != 2:
+        raise ValueError(f"price_matrix must be 2-D (symbols x bars), got {prices.ndim} dimensions")
+    return prices
+
+
+def _is_sequence(values: Any) -> bool:
+    """Check for a sized, non-string sequence (list, ndarray, Series, ...)"""
+    return hasattr(values, "__len__") and not isinstance(values, (str, bytes, dict))
+
 
 class MarketCorrelation:
     """Analyzes market correlation and generates composite signals"""
 
-    def calculate_correlation(self, stock_prices: List[float], index_prices: List[float]) -> float:
-        """Calculate Pearson correlation coefficient"""
+    def calculate_correlation(self, stock_prices: Sequence[float], index_prices: Sequence[float]) -> float:
+        """Calculate Pearson correlation coefficient
+
+        Accepts lists, ndarrays, pandas Series or any other array-like;
+        float64 arrays are used without copying.
+        """
         # Comprehensive input validation
-        if not isinstance(stock_prices, list) or not isinstance(index_prices, list):
-            raise ValueError("Both arguments must be lists")
+        if not _is_sequence(stock_prices) or not _is_sequence(index_prices):
+            raise ValueError("Both arguments must be array-like sequences of numbers")
         if len(stock_prices) != len(index_prices):
             raise ValueError("Price series must have the same length")
         if len(stock_prices) < 2:
             raise ValueError("at least 2 data points are required for correlation calculation")
         
-        # Validate all values are finite numbers
-        all_prices = stock_prices + index_prices
-        for i, p in enumerate(all_prices):
-            if not isinstance(p, (int, float)):
-                raise ValueError(f"All prices must be numbers, got {type(p).__name__} at index {i}")
-            if math.isnan(p) or math.isinf(p):
-                raise ValueError(f"All prices must be finite numbers, got {p} at index {i}")
+        # Validate all values are finite numbers, converting each series once
+        stock_arr = self._as_finite_prices(stock_prices, 0)
+        index_arr = self._as_finite_prices(index_prices, len(stock_prices))
 
         if HAS_NUMPY:
-            return float(np.corrcoef(stock_prices, index_prices)[0, 1])
-        
+            return float(np.corrcoef(stock_arr, index_arr)[0, 1])
+
         # Fallback to pure Python
-        stock_mean = statistics.mean(stock_prices)
-        index_mean = statistics.mean(index_prices)
-        numerator = sum((s - stock_mean) * (i - index_mean) for s, i in zip(stock_prices, index_prices))
-        stock_std = math.sqrt(sum((s - stock_mean) ** 2 for s in stock_prices))
-        index_std = math.sqrt(sum((i - index_mean) ** 2 for i in index_prices))
+        stock_mean = statistics.mean(stock_arr)
+        index_mean = statistics.mean(index_arr)
+        numerator = sum((s - stock_mean) * (i - index_mean) for s, i in zip(stock_arr, index_arr))
+        stock_std = math.sqrt(sum((s - stock_mean) ** 2 for s in stock_arr))
+        index_std = math.sqrt(sum((i - index_mean) ** 2 for i in index_arr))
 
         return numerator / (stock_std * index_std) if stock_std * index_std != 0 else 0.0
 
-    def calculate_beta(self, stock_prices: List[float], index_prices: List[float]) -> float:
+    @staticmethod
+    def _as_finite_prices(prices: Sequence[float], offset: int) -> Any:
+        """Convert a price series with the shared validator, reporting indexes
+        relative to the combined stock + index series"""
+        try:
+            return as_finite_float_array(prices, "prices")
+        except NonNumericValueError as e:
+            raise ValueError(
+                f"All prices must be numbers, got {type(e.value).__name__} at index {offset + e.index}"
+            ) from None
+        except NonFiniteValueError as e:
+            raise ValueError(
+                f"All prices must be finite numbers, got {e.value} at index {offset + e.index}"
+            ) from None
+
+    def calculate_beta(self, stock_prices: Sequence[float], index_prices: Sequence[float]) -> float:
         """Calculate beta value (stock sensitivity to market) using NumPy if available"""
         if len(stock_prices) != len(index_prices) or len(stock_prices) < 2:
             return 1.0
 
         if HAS_NUMPY:
-            s_arr = np.array(stock_prices)
-            i_arr = np.array(index_prices)
+            s_arr = np.asarray(stock_prices, dtype=np.float64)
+            i_arr = np.asarray(index_prices, dtype=np.float64)
             s_returns = np.diff(s_arr) / s_arr[:-1]
             i_returns = np.diff(i_arr) / i_arr[:-1]
             
@@ -85,13 +161,70 @@ class MarketCorrelation:
         except (statistics.StatisticsError, ZeroDivisionError):
             return 1.0
 
-    def detect_trend(self, prices: List[float]) -> MarketTrend:
+    def fit_ewm(
+        self,
+        stock_prices: Any,
+        index_prices: Union[Mapping[str, Sequence[float]], Any],
+        half_life: float = DEFAULT_EWM_HALF_LIFE
+    ) -> EwmCorrelation:
+        """Fit exponentially weighted correlation/beta from price histories
+
+        Args:
+            stock_prices: Prices (T,) for one stock or (T, N) for a universe
+            index_prices: Mapping of index name to prices (T,), or a (T, K) matrix
+            half_life: Half-life of the weights in bars
+
+        Returns:
+            Fitted EwmCorrelation tracker; keep calling update() on it per bar
+        """
+        if not HAS_NUMPY:
+            raise ImportError("NumPy is required for fit_ewm")
+
+        index_names = None
+        if isinstance(index_prices, Mapping):
+            index_names = list(index_prices.keys())
+            index_prices = np.column_stack(
+                [np.asarray(p, dtype=np.float64) for p in index_prices.values()]
+            )
+
+        tracker = EwmCorrelation(half_life=half_life, index_names=index_names)
+        return tracker.fit(simple_returns(stock_prices), simple_returns(index_prices))
+
+    def calculate_ewm_correlation(
+        self,
+        stock_prices: Sequence[float],
+        index_prices: Sequence[float],
+        half_life: float = DEFAULT_EWM_HALF_LIFE
+    ) -> float:
+        """Calculate exponentially weighted correlation of returns
+
+        Recent bars weigh more, so the value reacts to regime changes faster
+        than calculate_correlation.
+        """
+        if len(stock_prices) != len(index_prices) or len(stock_prices) < 3:
+            return 0.0
+        corr = float(self.fit_ewm(stock_prices, index_prices, half_life).correlation[0, 0])
+        return corr if math.isfinite(corr) else 0.0
+
+    def calculate_ewm_beta(
+        self,
+        stock_prices: Sequence[float],
+        index_prices: Sequence[float],
+        half_life: float = DEFAULT_EWM_HALF_LIFE
+    ) -> float:
+        """Calculate exponentially weighted beta of returns"""
+        if len(stock_prices) != len(index_prices) or len(stock_prices) < 3:
+            return 1.0
+        beta = float(self.fit_ewm(stock_prices, index_prices, half_life).beta[0, 0])
+        return beta if math.isfinite(beta) else 1.0
+
+    def detect_trend(self, prices: Sequence[float]) -> MarketTrend:
         """Detect market trend using linear regression slope"""
         if len(prices) < MIN_DATA_POINTS:
             return MarketTrend.NEUTRAL
 
         if HAS_NUMPY:
-            y = np.array(prices)
+            y = np.asarray(prices, dtype=np.float64)
             x = np.arange(len(y))
             slope, _ = np.polyfit(x, y, 1)
             normalized_slope = slope / np.mean(y)
@@ -111,31 +244,97 @@ class MarketCorrelation:
             return MarketTrend.BEARISH
         return MarketTrend.NEUTRAL
 
+    def detect_trends(self, price_matrix: Any) -> "np.ndarray":
+        """Detect trends for many series at once
+
+        Args:
+            price_matrix: Prices of shape (N, T), one row per symbol
+
+        Returns:
+            int8 array of MarketTrend values (-1, 0, 1) per row
+        """
+        prices = _as_price_matrix(price_matrix)
+        n_series, n_points = prices.shape
+        if n_points < MIN_DATA_POINTS:
+            return np.zeros(n_series, dtype=np.int8)
+
+        # Closed-form least-squares slope for every row
+        x = np.arange(n_points, dtype=np.float64)
+        x -= x.mean()
+        means = prices.mean(axis=1)
+        slopes = (prices @ x) / (x @ x)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            normalized = slopes / means
+
+        trends = np.zeros(n_series, dtype=np.int8)
+        trends[normalized > TREND_DETECTION_THRESHOLD] = MarketTrend.BULLISH.value
+        trends[normalized < -TREND_DETECTION_THRESHOLD] = MarketTrend.BEARISH.value
+        return trends
+
+    def calculate_correlations(self, price_matrix: Any, index_prices: Sequence[float]) -> "np.ndarray":
+        """Calculate Pearson correlation of every row against one index
+
+        Args:
+            price_matrix: Prices of shape (N, T)
+            index_prices: Index prices of shape (T,)
+
+        Returns:
+            float64 array of correlations (NaN for constant rows)
+        """
+        prices = _as_price_matrix(price_matrix)
+        index = np.asarray(index_prices, dtype=np.float64)
+        if index.shape != (prices.shape[1],):
+            raise ValueError("Price series must have the same length")
+
+        centered = prices - prices.mean(axis=1, keepdims=True)
+        index_centered = index - index.mean()
+        denom = np.sqrt(np.einsum("nt,nt->n", centered, centered) * (index_centered @ index_centered))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return (centered @ index_centered) / denom
+
+    def calculate_betas(self, price_matrix: Any, index_prices: Sequence[float]) -> "np.ndarray":
+        """Calculate beta of every row against one index
+
+        Args:
+            price_matrix: Prices of shape (N, T)
+            index_prices: Index prices of shape (T,)
+
+        Returns:
+            float64 array of betas (1.0 where beta is undefined, as in calculate_beta)
+        """
+        prices = _as_price_matrix(price_matrix)
+        index = np.asarray(index_prices, dtype=np.float64)
+        n_series, n_points = prices.shape
+        if index.shape != (n_points,) or n_points < 3:
+            return np.ones(n_series)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            s_returns = np.diff(prices, axis=1) / prices[:, :-1]
+            i_returns = np.diff(index) / index[:-1]
+            i_centered = i_returns - i_returns.mean()
+            variance = (i_centered @ i_centered) / (n_points - 2)
+            covariance = ((s_returns - s_returns.mean(axis=1, keepdims=True)) @ i_centered) / (n_points - 2)
+            betas = covariance / variance
+
+        return np.where(np.isfinite(betas), betas, 1.0) if variance != 0 else np.ones(n_series)
+
     def generate_composite_signal(
         self,
         market_trend: MarketTrend,
         individual_signal: str,
         correlation: float
     ) -> Dict[str, Any]:
-        """Generate composite trading signal using a rule-based decision logic"""
-        sig = individual_signal.lower()
-        
-        # Decision Table Logic
-        # (Signal, Trend) -> (Recommendation, Confidence, Reasoning)
-        RULES = {
-            ("buy", MarketTrend.BULLISH): ("buy", "high", "Bullish market supporting signal"),
-            ("buy", MarketTrend.BEARISH): ("cautious_buy" if correlation < CORR_LOW else "wait", "low", 
-                                          "Individual strength despite bearish market" if correlation < CORR_LOW else "Bearish market override"),
-            ("sell", MarketTrend.BEARISH): ("sell", "high", "Bearish market supporting signal"),
-            ("sell", MarketTrend.BULLISH): ("cautious_sell" if correlation < CORR_LOW else "wait", "low",
-                                           "Individual weakness despite bullish market" if correlation < CORR_LOW else "Bullish market override"),
-        }
+        """Generate composite trading signal using a rule-based decision logic
 
-        rec, conf, reason = RULES.get((sig, market_trend), (sig, "medium", "No market alignment override"))
+        correlation may be the equal-weighted value from calculate_correlation
+        or the fresher calculate_ewm_correlation.
+        """
+        sig = individual_signal.lower()
 
-        # Stock-specific catalyst detection
-        if sig == "buy" and market_trend == MarketTrend.BULLISH and correlation < CORR_LOW:
-            reason = "Low correlation - strong individual strength"
+        rec, conf, reason = COMPOSITE_RULES.get(
+            (sig, market_trend, correlation < CORR_LOW),
+            (sig, COMPOSITE_DEFAULT_CONFIDENCE, COMPOSITE_DEFAULT_REASONING),
+        )
 
         return {
             "recommendation": rec,
@@ -144,4 +343,69 @@ class MarketCorrelation:
             "market_trend": str(market_trend),
             "individual_signal": sig,
             "correlation": correlation
-        }
\ No newline at end of file
+        }
+
+    def generate_composite_signals(
+        self,
+        market_trends: Union[Sequence[MarketTrend], Sequence[int]],
+        individual_signals: Sequence[str],
+        correlations: Sequence[float]
+    ) -> "np.ndarray":
+        """Generate composite signals for a whole watchlist in one vectorized pass
+
+        Args:
+            market_trends: MarketTrend members or their integer values (-1, 0, 1)
+            individual_signals: Individual signal per symbol ("buy", "sell", ...)
+            correlations: Correlation with the market per symbol, e.g.
+                EwmCorrelation.correlation_with("TOPIX")
+
+        Returns:
+            Structured array with the same fields as generate_composite_signal
+        """
+        if not HAS_NUMPY:
+            raise ImportError("NumPy is required for generate_composite_signals")
+
+        n = len(individual_signals)
+        if len(market_trends) != n or len(correlations) != n:
+            raise ValueError("All input sequences must have the same length")
+
+        trend_values = np.asarray(market_trends)
+        if trend_values.dtype == object:
+            trend_values = np.fromiter(
+                (t.value if isinstance(t, MarketTrend) else t for t in market_trends),
+                dtype=np.int64, count=n
+            )
+        trend_codes = trend_values.astype(np.int64) + 1
+        if n and (trend_codes.min() < 0 or trend_codes.max() > 2):
+            raise ValueError("market_trends must be MarketTrend members or -1, 0, 1")
+
+        # Lower-case and encode each distinct signal once
+        uniques, inverse = np.unique(np.asarray(individual_signals, dtype=str), return_inverse=True)
+        lowered = np.char.lower(uniques)
+        unique_codes = np.array([_SIGNAL_CODES.get(u, _SIGNAL_OTHER) for u in lowered.tolist()], dtype=np.int64)
+        signals = lowered[inverse]
+        signal_codes = unique_codes[inverse]
+
+        corr = np.asarray(correlations, dtype=np.float64)
+        index = signal_codes * 6 + trend_codes * 2 + (corr < CORR_LOW)
+
+        recs = _REC_TABLE[index]
+        recs = np.where(recs == "", signals, recs)
+
+        sig_width = max(signals.dtype.itemsize // 4, 1)
+        rec_width = max(sig_width, _REC_TABLE.dtype.itemsize // 4)
+        result = np.empty(n, dtype=[
+            ("recommendation", f"U{rec_width}"),
+            ("confidence", _CONF_TABLE.dtype),
+            ("reasoning", _REASON_TABLE.dtype),
+            ("market_trend", _TREND_NAMES.dtype),
+            ("individual_signal", f"U{sig_width}"),
+            ("correlation", np.float64),
+        ])
+        result["recommendation"] = recs
+        result["confidence"] = _CONF_TABLE[index]
+        result["reasoning"] = _REASON_TABLE[index]
+        result["market_trend"] = _TREND_NAMES[trend_codes]
+        result["individual_signal"] = signals
+        result["correlation"] = corr
+        return result
@@ -0,0 +1,209 @@
+"""
+Exponentially Weighted Correlation
+
+Tracks exponentially weighted (EW) correlation and beta of many stocks
+against several market indices at once. State is kept as decayed sums, so
+each new bar costs O(N * K) and a full history is folded in one vectorized
+pass.
+"""
+
+from typing import Any, List, Optional, Sequence
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# Default half-life in bars
+DEFAULT_EWM_HALF_LIFE = 20.0
+
+
+def simple_returns(prices: Any) -> "np.ndarray":
+    """Convert a price series (T,) or price matrix (T, N) to simple returns
+
+    Args:
+        prices: Prices ordered oldest first
+
+    Returns:
+        Returns array with one row fewer than prices
+    """
+    p = np.asarray(prices, dtype=np.float64)
+    return np.diff(p, axis=0) / p[:-1]
+
+
+def _as_matrix(values: Any, name: str) -> "np.ndarray":
+    """Return a (T, M) float64 view of a (T,) or (T, M) array-like"""
+    arr = np.asarray(values, dtype=np.float64)
+    if arr.ndim == 1:
+        arr = arr[:, np.newaxis]
+    if arr.ndim != 2:
+        raise ValueError(f"{name} must be 1-D or 2-D, got {arr.ndim} dimensions")
+    if not np.isfinite(arr).all():
+        raise ValueError(f"{name} must contain only finite values")
+    return arr
+
+
+class EwmCorrelation:
+    """Exponentially weighted correlation and beta of N stocks against K indices
+
+    Example:
+        tracker = EwmCorrelation(half_life=20, index_names=["TOPIX", "N225", "SPX"])
+        tracker.fit(stock_returns, index_returns)  # (T, N), (T, K)
+        tracker.update(latest_stock_returns, latest_index_returns)  # (N,), (K,)
+        tracker.correlation_with("TOPIX")  # (N,)
+    """
+
+    def __init__(
+        self,
+        half_life: float = DEFAULT_EWM_HALF_LIFE,
+        index_names: Optional[Sequence[str]] = None
+    ):
+        """Initialize an empty tracker
+
+        Args:
+            half_life: Number of bars after which an observation's weight halves
+            index_names: Optional names of the index columns
+        """
+        if not HAS_NUMPY:
+            raise ImportError("NumPy is required for EwmCorrelation")
+        if half_life <= 0:
+            raise ValueError(f"half_life must be positive, got {half_life}")
+
+        self.half_life = half_life
+        self.decay = 0.5 ** (1.0 / half_life)
+        self.index_names: Optional[List[str]] = list(index_names) if index_names is not None else None
+        self._count = 0
+        self._weight = 0.0
+        self._sx: Optional["np.ndarray"] = None
+        self._sy: Optional["np.ndarray"] = None
+        self._sxx: Optional["np.ndarray"] = None
+        self._syy: Optional["np.ndarray"] = None
+        self._sxy: Optional["np.ndarray"] = None
+
+    @property
+    def count(self) -> int:
+        """Number of bars observed"""
+        return self._count
+
+    def _ensure_state(self, n_stocks: int, n_indices: int) -> None:
+        """Allocate state on first use and check shapes afterwards"""
+        if self._sx is None:
+            if self.index_names is not None and len(self.index_names) != n_indices:
+                raise ValueError(
+                    f"Expected {len(self.index_names)} index columns, got {n_indices}"
+                )
+            self._sx = np.zeros(n_stocks)
+            self._sy = np.zeros(n_indices)
+            self._sxx = np.zeros(n_stocks)
+            self._syy = np.zeros(n_indices)
+            self._sxy = np.zeros((n_stocks, n_indices))
+        elif self._sxy.shape != (n_stocks, n_indices):
+            raise ValueError(
+                f"Expected {self._sxy.shape[0]} stocks and {self._sxy.shape[1]} indices, "
+                f"got {n_stocks} and {n_indices}"
+            )
+
+    def update(self, stock_returns: Any, index_returns: Any) -> None:
+        """Fold in one bar of returns in O(N * K)
+
+        Args:
+            stock_returns: Returns of each stock for the bar, shape (N,)
+            index_returns: Returns of each index for the bar, shape (K,)
+        """
+        x = _as_matrix(stock_returns, "stock_returns")[:, 0]
+        y = _as_matrix(index_returns, "index_returns")[:, 0]
+        self._ensure_state(len(x), len(y))
+
+        d = self.decay
+        self._weight = d * self._weight + 1.0
+        self._sx *= d
+        self._sx += x
+        self._sy *= d
+        self._sy += y
+        self._sxx *= d
+        self._sxx += x * x
+        self._syy *= d
+        self._syy += y * y
+        self._sxy *= d
+        self._sxy += np.outer(x, y)
+        self._count += 1
+
+    def fit(self, stock_returns: Any, index_returns: Any) -> "EwmCorrelation":
+        """Fold in a history of returns in one vectorized pass
+
+        Equivalent to calling update() for every row in order.
+
+        Args:
+            stock_returns: Returns matrix (T, N) or series (T,), oldest first
+            index_returns: Returns matrix (T, K) or series (T,), oldest first
+
+        Returns:
+            self, for chaining
+        """
+        x = _as_matrix(stock_returns, "stock_returns")
+        y = _as_matrix(index_returns, "index_returns")
+        if len(x) != len(y):
+            raise ValueError(f"Return histories must have the same length: {len(x)} vs {len(y)}")
+        self._ensure_state(x.shape[1], y.shape[1])
+
+        n = len(x)
+        if n == 0:
+            return self
+
+        weights = self.decay ** np.arange(n - 1, -1, -1, dtype=np.float64)
+        carry = self.decay ** n
+        wx = x * weights[:, np.newaxis]
+
+        self._weight = carry * self._weight + weights.sum()
+        self._sx = carry * self._sx + wx.sum(axis=0)
+        self._sy = carry * self._sy + weights @ y
+        self._sxx = carry * self._sxx + np.einsum("tn,tn->n", wx, x)
+        self._syy = carry * self._syy + weights @ (y * y)
+        self._sxy = carry * self._sxy + wx.T @ y
+        self._count += n
+        return self
+
+    def _moments(self):
+        """Return EW covariance (N, K) and variances (N,), (K,)"""
+        if self._sxy is None or self._weight == 0:
+            raise ValueError("No observations have been added")
+        w = self._weight
+        mx = self._sx / w
+        my = self._sy / w
+        cov = self._sxy / w - np.outer(mx, my)
+        var_x = np.maximum(self._sxx / w - mx * mx, 0.0)
+        var_y = np.maximum(self._syy / w - my * my, 0.0)
+        return cov, var_x, var_y
+
+    @property
+    def correlation(self) -> "np.ndarray":
+        """Current EW correlation matrix (N, K); NaN where a variance is zero"""
+        cov, var_x, var_y = self._moments()
+        denom = np.sqrt(np.outer(var_x, var_y))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = np.where(denom > 0, cov / denom, np.nan)
+        return np.clip(corr, -1.0, 1.0)
+
+    @property
+    def beta(self) -> "np.ndarray":
+        """Current EW beta matrix (N, K); NaN where the index variance is zero"""
+        cov, _, var_y = self._moments()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(var_y > 0, cov / var_y, np.nan)
+
+    def _index_column(self, index: Any) -> int:
+        """Resolve an index name or column number"""
+        if isinstance(index, str):
+            if self.index_names is None or index not in self.index_names:
+                raise KeyError(f"Unknown index: {index}")
+            return self.index_names.index(index)
+        return int(index)
+
+    def correlation_with(self, index: Any = 0) -> "np.ndarray":
+        """EW correlation of every stock with one index, shape (N,)"""
+        return self.correlation[:, self._index_column(index)]
+
+    def beta_with(self, index: Any = 0) -> "np.ndarray":
+        """EW beta of every stock against one index, shape (N,)"""
+        return self.beta[:, self._index_column(index)]
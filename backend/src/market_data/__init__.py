@@ -0,0 +1,14 @@
+"""
+Market Data
+
+OHLCV bars, timeframe resampling and price history storage shared by the
+analyzers.
+"""
+
+from .bars import Bars, OHLCV_FIELDS
+from .resample import OhlcvResampler, resample_bars, TIMEFRAME_SECONDS
+from .store import PriceHistoryStore
+
+__all__ = ["Bars", "OHLCV_FIELDS", "OhlcvResampler", "resample_bars", "TIMEFRAME_SECONDS",
+           "PriceHistoryStore"]
+__version__ = "0.1.0"
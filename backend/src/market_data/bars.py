@@ -0,0 +1,97 @@
+"""
+OHLCV Bars
+
+Columnar OHLCV container shared by the resampler, the price history store
+and the analyzers. Each column is its own contiguous array, so analyzers
+receive views (e.g. bars.close) without copying.
+"""
+
+from typing import Any, Dict, Optional, Tuple, Union
+
+import numpy as np
+
+# Column names in storage order
+OHLCV_FIELDS = ("timestamp", "open", "high", "low", "close", "volume")
+# Timestamps are epoch seconds of the bar open
+TIMESTAMP_DTYPE = np.int64
+PRICE_DTYPE = np.float64
+
+
+class Bars:
+    """OHLCV bars as parallel column arrays, oldest first"""
+
+    def __init__(
+        self,
+        timestamp: Any,
+        open: Any,
+        high: Any,
+        low: Any,
+        close: Any,
+        volume: Any
+    ):
+        """Wrap column arrays (converted without copying when already typed)
+
+        Args:
+            timestamp: Bar open times in epoch seconds, non-decreasing
+            open: Opening prices
+            high: High prices
+            low: Low prices
+            close: Closing prices
+            volume: Volume per bar
+        """
+        self.timestamp = np.asarray(timestamp, dtype=TIMESTAMP_DTYPE)
+        self.open = np.asarray(open, dtype=PRICE_DTYPE)
+        self.high = np.asarray(high, dtype=PRICE_DTYPE)
+        self.low = np.asarray(low, dtype=PRICE_DTYPE)
+        self.close = np.asarray(close, dtype=PRICE_DTYPE)
+        self.volume = np.asarray(volume, dtype=PRICE_DTYPE)
+        n = len(self.timestamp)
+        if any(len(column) != n for column in self.columns().values()):
+            raise ValueError("All OHLCV columns must have the same length")
+
+    @classmethod
+    def empty(cls) -> "Bars":
+        """Return a Bars with no rows"""
+        return cls(*(np.empty(0) for _ in OHLCV_FIELDS))
+
+    @classmethod
+    def from_ticks(cls, timestamps: Any, prices: Any, volumes: Any) -> "Bars":
+        """Treat each tick as a one-trade bar (open = high = low = close)"""
+        prices = np.asarray(prices, dtype=PRICE_DTYPE)
+        return cls(np.floor(np.asarray(timestamps, dtype=np.float64)), prices, prices, prices, prices, volumes)
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Return the columns by name"""
+        return {field: getattr(self, field) for field in OHLCV_FIELDS}
+
+    def __len__(self) -> int:
+        """Return the number of bars"""
+        return len(self.timestamp)
+
+    def __getitem__(self, key: Union[slice, np.ndarray]) -> "Bars":
+        """Slice rows (basic slices return views)"""
+        return Bars(*(column[key] for column in self.columns().values()))
+
+    def __repr__(self) -> str:
+        return f"Bars({len(self)} rows)"
+
+    def between(self, start: Optional[int] = None, end: Optional[int] = None) -> "Bars":
+        """Return a view of bars with start <= timestamp < end
+
+        Args:
+            start: First epoch second to include (default: first bar)
+            end: Epoch second to stop before (default: after the last bar)
+        """
+        lo = 0 if start is None else int(np.searchsorted(self.timestamp, start, side="left"))
+        hi = len(self) if end is None else int(np.searchsorted(self.timestamp, end, side="left"))
+        return self[lo:hi]
+
+    def price_volume(self) -> np.ndarray:
+        """Return (close, volume) pairs as an (n, 2) array for volume profiles"""
+        return np.column_stack([self.close, self.volume])
+
+    def last(self) -> Optional[Tuple[int, float, float, float, float, float]]:
+        """Return the most recent bar as a tuple, or None when empty"""
+        if len(self) == 0:
+            return None
+        return tuple(column[-1].item() for column in self.columns().values())
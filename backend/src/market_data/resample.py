@@ -0,0 +1,229 @@
+"""
+OHLCV Resampling
+
+Turns a tick or bar stream into coarser OHLCV timeframes (5m, 1h, 1d, ...)
+with segment reductions (np.*.reduceat) over sorted timestamps. The
+OhlcvResampler keeps every timeframe's closed bars in growable column
+buffers, so analyzers share the same precomputed arrays and each new batch
+only touches the rows it adds.
+"""
+
+from typing import Any, Dict, Iterable, Optional, Union
+
+import numpy as np
+
+from .bars import Bars, OHLCV_FIELDS, PRICE_DTYPE, TIMESTAMP_DTYPE
+
+# Supported timeframe names and their length in seconds
+TIMEFRAME_SECONDS = {
+    "1m": 60,
+    "5m": 5 * 60,
+    "15m": 15 * 60,
+    "30m": 30 * 60,
+    "1h": 60 * 60,
+    "4h": 4 * 60 * 60,
+    "1d": 24 * 60 * 60,
+}
+DEFAULT_TIMEFRAMES = ("5m", "1h", "1d")
+_INITIAL_CAPACITY = 256
+
+
+def timeframe_seconds(timeframe: Union[str, int]) -> int:
+    """Return the length of a timeframe name (e.g. "5m") or of a number of seconds"""
+    if isinstance(timeframe, str):
+        if timeframe not in TIMEFRAME_SECONDS:
+            raise ValueError(f"Unknown timeframe: {timeframe}")
+        return TIMEFRAME_SECONDS[timeframe]
+    if timeframe <= 0:
+        raise ValueError(f"Timeframe must be positive, got {timeframe}")
+    return int(timeframe)
+
+
+def resample_bars(bars: Bars, timeframe: Union[str, int], utc_offset: int = 0) -> Bars:
+    """Aggregate bars (or ticks via Bars.from_ticks) into a coarser timeframe
+
+    Bars are bucketed by floor((timestamp + utc_offset) / period); each
+    bucket's open/close are its first/last rows, high/low/volume come from
+    maximum/minimum/add.reduceat over the bucket boundaries.
+
+    Args:
+        bars: Input bars, timestamps non-decreasing
+        timeframe: Timeframe name or period in seconds
+        utc_offset: Seconds added before bucketing, e.g. 9 * 3600 so daily
+            bars start at midnight JST
+
+    Returns:
+        Bars stamped with each bucket's start time (epoch seconds)
+    """
+    period = timeframe_seconds(timeframe)
+    n = len(bars)
+    if n == 0:
+        return Bars.empty()
+    timestamps = bars.timestamp
+    if n > 1 and np.any(np.diff(timestamps) < 0):
+        raise ValueError("Bar timestamps must be non-decreasing")
+
+    keys = (timestamps + utc_offset) // period
+    starts = np.concatenate([[0], np.flatnonzero(np.diff(keys)) + 1])
+    ends = np.concatenate([starts[1:], [n]]) - 1
+    return Bars(
+        keys[starts] * period - utc_offset,
+        bars.open[starts],
+        np.maximum.reduceat(bars.high, starts),
+        np.minimum.reduceat(bars.low, starts),
+        bars.close[ends],
+        np.add.reduceat(bars.volume, starts),
+    )
+
+
+class _BarBuffer:
+    """Append-only OHLCV columns with amortized doubling"""
+
+    def __init__(self):
+        self._columns = {
+            field: np.empty(_INITIAL_CAPACITY, dtype=TIMESTAMP_DTYPE if field == "timestamp" else PRICE_DTYPE)
+            for field in OHLCV_FIELDS
+        }
+        self._size = 0
+
+    def append(self, bars: Bars) -> None:
+        """Copy bars onto the end of the buffer"""
+        count = len(bars)
+        if count == 0:
+            return
+        needed = self._size + count
+        capacity = len(self._columns["timestamp"])
+        if needed > capacity:
+            capacity = max(2 * capacity, needed)
+            for field, column in self._columns.items():
+                grown = np.empty(capacity, dtype=column.dtype)
+                grown[:self._size] = column[:self._size]
+                self._columns[field] = grown
+        for field, values in bars.columns().items():
+            self._columns[field][self._size:needed] = values
+        self._size = needed
+
+    def view(self) -> Bars:
+        """Return the filled rows as views (no copy)"""
+        return Bars(*(column[:self._size] for column in self._columns.values()))
+
+
+class OhlcvResampler:
+    """Incrementally resamples a tick/bar stream into several timeframes
+
+    Example:
+        resampler = OhlcvResampler(("5m", "1h", "1d"), utc_offset=9 * 3600)
+        resampler.add_bars(minute_bars)
+        closes = resampler.bars("1h").close  # feed detect_trend / calculate_beta
+    """
+
+    def __init__(self, timeframes: Iterable[Union[str, int]] = DEFAULT_TIMEFRAMES, utc_offset: int = 0):
+        """Initialize empty timeframes
+
+        Args:
+            timeframes: Timeframe names (see TIMEFRAME_SECONDS) or periods in seconds
+            utc_offset: Seconds added before bucketing (see resample_bars)
+        """
+        self.utc_offset = utc_offset
+        self._periods = {timeframe: timeframe_seconds(timeframe) for timeframe in timeframes}
+        if not self._periods:
+            raise ValueError("At least one timeframe is required")
+        self._closed = {timeframe: _BarBuffer() for timeframe in self._periods}
+        # Single-row Bars still accumulating input, per timeframe
+        self._forming: Dict[Union[str, int], Optional[Bars]] = {timeframe: None for timeframe in self._periods}
+        self._last_timestamp: Optional[int] = None
+
+    @property
+    def timeframes(self):
+        """Configured timeframes"""
+        return list(self._periods)
+
+    def add_ticks(self, timestamps: Any, prices: Any, volumes: Any) -> Dict[Union[str, int], Bars]:
+        """Add trades (epoch-second timestamps, non-decreasing)
+
+        Returns:
+            Newly closed bars per timeframe (see add_bars)
+        """
+        return self.add_bars(Bars.from_ticks(timestamps, prices, volumes))
+
+    def add_bars(self, bars: Bars) -> Dict[Union[str, int], Bars]:
+        """Fold a batch of finer bars into every timeframe
+
+        Each timeframe is resampled from the batch in one vectorized pass;
+        the first new bucket is merged into the bar still forming from
+        earlier input. Every bucket except the newest is closed.
+
+        Args:
+            bars: Bars or ticks, not older than anything added before or
+                the latest advance() time
+
+        Returns:
+            Newly closed bars per timeframe (views into the cache)
+        """
+        if len(bars) == 0:
+            return {timeframe: Bars.empty() for timeframe in self._periods}
+        if self._last_timestamp is not None and bars.timestamp[0] < self._last_timestamp:
+            raise ValueError("Bars must not be older than previously added data or the last advance() time")
+        self._last_timestamp = int(bars.timestamp[-1])
+
+        closed = {}
+        for timeframe, period in self._periods.items():
+            new = resample_bars(bars, period, self.utc_offset)
+            buffer = self._closed[timeframe]
+            before = len(buffer.view())
+            forming = self._forming[timeframe]
+            if forming is not None:
+                if new.timestamp[0] == forming.timestamp[0]:
+                    new.open[0] = forming.open[0]
+                    new.high[0] = max(new.high[0], forming.high[0])
+                    new.low[0] = min(new.low[0], forming.low[0])
+                    new.volume[0] += forming.volume[0]
+                else:
+                    buffer.append(forming)
+            buffer.append(new[:-1])
+            self._forming[timeframe] = new[-1:]
+            closed[timeframe] = buffer.view()[before:]
+        return closed
+
+    def advance(self, timestamp: int) -> Dict[Union[str, int], Bars]:
+        """Close forming bars whose period has ended by timestamp
+
+        Use when the clock moves on without new trades (e.g. at the close).
+        Later input must not be older than timestamp, so no data can land
+        in a bar that was closed here.
+
+        Returns:
+            Newly closed bars per timeframe
+        """
+        if self._last_timestamp is None or timestamp > self._last_timestamp:
+            self._last_timestamp = int(timestamp)
+        closed = {}
+        for timeframe, period in self._periods.items():
+            forming = self._forming[timeframe]
+            if forming is not None and forming.timestamp[0] + period <= timestamp:
+                self._closed[timeframe].append(forming)
+                self._forming[timeframe] = None
+                closed[timeframe] = forming
+            else:
+                closed[timeframe] = Bars.empty()
+        return closed
+
+    def bars(self, timeframe: Union[str, int], include_partial: bool = False) -> Bars:
+        """Return a timeframe's bars, oldest first
+
+        Closed bars are returned as views into the cache. With
+        include_partial, the bar still forming is appended (which copies).
+
+        Args:
+            timeframe: One of the configured timeframes
+            include_partial: Include the bar that has not closed yet
+        """
+        if timeframe not in self._periods:
+            raise KeyError(f"Timeframe not configured: {timeframe}")
+        closed = self._closed[timeframe].view()
+        forming = self._forming[timeframe]
+        if not include_partial or forming is None:
+            return closed
+        return Bars(*(np.concatenate([closed_column, forming_column])
+                      for closed_column, forming_column in zip(closed.columns().values(),
+                                                                forming.columns().values())))
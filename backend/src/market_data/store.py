@@ -0,0 +1,217 @@
+"""
+Price History Store
+
+Append-only columnar storage for OHLCV bars. Each symbol has one raw file
+per column (int64 timestamps, float64 prices/volume) under its own
+directory, plus a small JSON index with row counts and time ranges. Reads
+memory-map the column files, so a date range comes back as zero-copy NumPy
+views instead of a parse.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+
+from utils.durable_files import append_file, fsync_directory, map_column, write_json
+
+from .bars import Bars, OHLCV_FIELDS, PRICE_DTYPE, TIMESTAMP_DTYPE
+
+INDEX_FILE = "index.json"
+_INDEX_TMP = Path(INDEX_FILE).with_suffix(".tmp").name
+STORE_VERSION = "1.0"
+_COLUMN_DTYPES = {field: np.dtype(TIMESTAMP_DTYPE if field == "timestamp" else PRICE_DTYPE)
+                  for field in OHLCV_FIELDS}
+
+
+class PriceHistoryStore:
+    """Memory-mapped, append-only OHLCV history per symbol
+
+    Column files are written and fsynced before the index is replaced,
+    and only rows recorded in the index are read, so an interrupted or
+    power-lost append never exposes partial rows; the next append
+    truncates them.
+
+    Example:
+        store = PriceHistoryStore("data/prices")
+        store.append("7203", bars)
+        store.append_many({"6758": sony_bars, "9984": softbank_bars})  # one index commit
+        closes = store.load("7203", start=ts_2020, end=ts_2021).close  # memmap view
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        """Open (or create) a store directory
+
+        Args:
+            root: Directory holding the index and per-symbol column files
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._index: Dict[str, Dict[str, Any]] = self._read_index()
+        self._maps: Dict[str, Bars] = {}
+
+    def _read_index(self) -> Dict[str, Dict[str, Any]]:
+        """Load the symbol index, or start an empty one"""
+        path = self.root / INDEX_FILE
+        if not path.exists():
+            return {}
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if "symbols" not in data:
+            raise ValueError("Invalid store index: missing 'symbols' key")
+        return data["symbols"]
+
+    def _write_index(self) -> None:
+        """Durably replace the index file (write, fsync, rename, fsync directory)"""
+        write_json(self.root / INDEX_FILE, {"version": STORE_VERSION, "symbols": self._index})
+
+    def _symbol_dir(self, symbol: str) -> Path:
+        """Directory of a symbol's column files"""
+        if (not symbol or "/" in symbol or "\\" in symbol
+                or symbol in (".", "..", INDEX_FILE, _INDEX_TMP)):
+            raise ValueError(f"Invalid symbol for storage: {symbol!r}")
+        return self.root / symbol
+
+    def symbols(self) -> List[str]:
+        """Return stored symbols in sorted order"""
+        return sorted(self._index)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._index
+
+    def row_count(self, symbol: str) -> int:
+        """Number of stored bars for a symbol (0 if unknown)"""
+        return self._index.get(symbol, {}).get("rows", 0)
+
+    def time_range(self, symbol: str) -> Optional[Tuple[int, int]]:
+        """(first, last) bar timestamps of a symbol, or None if empty"""
+        entry = self._index.get(symbol)
+        if not entry or not entry["rows"]:
+            return None
+        return entry["first"], entry["last"]
+
+    def append(self, symbol: str, bars: Bars) -> None:
+        """Append bars to a symbol's history
+
+        Args:
+            symbol: Stock symbol
+            bars: Bars with timestamps not older than the stored history
+
+        Raises:
+            ValueError: If bars are unsorted or older than stored data
+        """
+        self.append_many({symbol: bars})
+
+    def append_many(self, bars_by_symbol: Mapping[str, Bars]) -> None:
+        """Append bars to several symbols' histories with one index commit
+
+        Every batch is validated before anything is written, then all
+        column files are written and fsynced and the index is replaced
+        once, so updating a universe costs one index write rather than one
+        per symbol. A crash before the index commit leaves every symbol at
+        its previous rows.
+
+        Args:
+            bars_by_symbol: New bars per symbol (see append)
+
+        Raises:
+            ValueError: If any batch is unsorted, older than stored data or
+                has an invalid symbol; nothing is appended then
+        """
+        batch = [(symbol, bars, self._check_append(symbol, bars))
+                 for symbol, bars in bars_by_symbol.items() if len(bars)]
+        if not batch:
+            return
+
+        created = False
+        for symbol, bars, entry in batch:
+            directory = self._symbol_dir(symbol)
+            if not directory.exists():
+                directory.mkdir()
+                created = True
+            for field, values in bars.columns().items():
+                dtype = _COLUMN_DTYPES[field]
+                # Drops rows left behind by an append that never reached the index
+                append_file(directory / f"{field}.bin", entry["rows"] * dtype.itemsize,
+                            np.ascontiguousarray(values, dtype=dtype).tobytes())
+            if not entry["rows"]:
+                fsync_directory(directory)
+        if created:
+            fsync_directory(self.root)
+
+        for symbol, bars, entry in batch:
+            self._index[symbol] = {
+                "rows": entry["rows"] + len(bars),
+                "first": entry.get("first", int(bars.timestamp[0])),
+                "last": int(bars.timestamp[-1]),
+            }
+            self._maps.pop(symbol, None)
+        self._write_index()
+
+    def _check_append(self, symbol: str, bars: Bars) -> Dict[str, Any]:
+        """Validate an append and return the symbol's current index entry"""
+        self._symbol_dir(symbol)
+        timestamps = bars.timestamp
+        if len(bars) > 1 and np.any(np.diff(timestamps) < 0):
+            raise ValueError("Bar timestamps must be non-decreasing")
+        entry = self._index.get(symbol, {"rows": 0})
+        if entry["rows"] and timestamps[0] < entry["last"]:
+            raise ValueError(
+                f"Cannot append bars starting at {int(timestamps[0])} before stored last bar {entry['last']}"
+            )
+        return entry
+
+    def load(self, symbol: str, start: Optional[int] = None, end: Optional[int] = None) -> Bars:
+        """Return a symbol's bars with start <= timestamp < end
+
+        Columns are read-only memory-mapped views; nothing is copied until
+        a caller writes or converts them.
+
+        Args:
+            symbol: Stock symbol
+            start: First epoch second to include (default: first bar)
+            end: Epoch second to stop before (default: after the last bar)
+
+        Raises:
+            KeyError: If the symbol is not stored
+        """
+        if symbol not in self._index:
+            raise KeyError(f"Symbol not in store: {symbol}")
+        bars = self._maps.get(symbol)
+        if bars is None:
+            bars = self._map(symbol)
+            self._maps[symbol] = bars
+        return bars.between(start, end)
+
+    def _map(self, symbol: str) -> Bars:
+        """Memory-map every column of a symbol"""
+        rows = self._index[symbol]["rows"]
+        if rows == 0:
+            return Bars.empty()
+        directory = str(self._symbol_dir(symbol))
+        return Bars(*(map_column(os.path.join(directory, f"{field}.bin"), _COLUMN_DTYPES[field], rows)
+                      for field in OHLCV_FIELDS))
+
+    def load_many(
+        self,
+        symbols: Iterable[str],
+        start: Optional[int] = None,
+        end: Optional[int] = None
+    ) -> Dict[str, Bars]:
+        """Load a date range for several symbols, skipping unknown ones"""
+        return {symbol: self.load(symbol, start, end) for symbol in symbols if symbol in self._index}
+
+    def price_volume_source(
+        self,
+        start: Optional[int] = None,
+        end: Optional[int] = None
+    ) -> Callable[[str], Optional[Tuple[np.ndarray, np.ndarray]]]:
+        """Return a (close, volume) source for UniverseAnalyticsRunner.run"""
+        def fetch(symbol: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+            if symbol not in self._index:
+                return None
+            bars = self.load(symbol, start, end)
+            return bars.close, bars.volume
+        return fetch
@@ -5,7 +5,21 @@ A module for analyzing supply and demand zones in stock prices.
 """
 
 from .analyzer import SupplyDemandAnalyzer
-from .models import Zone, ZoneType, BreakoutEvent
+from .models import Zone, FrozenZone, ZoneType, BreakoutEvent
+from .profile import VolumeProfile
+from .zones import ZoneTable, ZoneIndex, UniverseZones
+from .breakout import BreakoutDetector
 
-__all__ = ["SupplyDemandAnalyzer", "Zone", "ZoneType", "BreakoutEvent"]
+__all__ = [
+    "SupplyDemandAnalyzer",
+    "Zone",
+    "FrozenZone",
+    "ZoneType",
+    "BreakoutEvent",
+    "VolumeProfile",
+    "ZoneTable",
+    "ZoneIndex",
+    "UniverseZones",
+    "BreakoutDetector",
+]
 __version__ = "0.1.0"
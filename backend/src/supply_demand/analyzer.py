@@ -5,8 +5,20 @@ Analyzes supply and demand zones from volume-by-price data.
 Optimized with NumPy for high-performance calculations.
 """
 
-from typing import List, Dict, Tuple, Optional
+from datetime import datetime
+from typing import Any, List, Dict, Tuple, Optional, Sequence, Union
 from .models import Zone, ZoneType, BreakoutEvent
+from .profile import VolumeProfile, binned_volume_profile, grouped_volume_profile
+from .zones import (
+    cluster_levels,
+    ZoneTable,
+    ZoneIndex,
+    UniverseZones,
+    ZONE_DTYPE,
+    SUPPORT_CODE,
+    RESISTANCE_CODE,
+    BREAKOUT_VOLUME_SURGE_MULTIPLIER,
+)
 
 try:
     import numpy as np
@@ -18,29 +30,55 @@ except ImportError:
 ZONE_STRENGTH_DEFAULT = 0.5
 ZONE_VOLUME_THRESHOLD_MULTIPLIER = 0.5  # 50% of average volume
 
-# Constants for breakout detection
-BREAKOUT_VOLUME_SURGE_MULTIPLIER = 1.5  # 50% volume surge for confirmation
+# (price levels, volumes) arrays produced by calculate_volume_profile
+PriceLevels = Tuple["np.ndarray", "np.ndarray"]
+
+
+def _split_price_volume(data: Any) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Return price and volume columns of (price, volume) data as float64 arrays
+
+    Two-dimensional float64 inputs are sliced into views, so no data is copied.
+    """
+    arr = np.asarray(data, dtype=np.float64)
+    if arr.ndim != 2 or arr.shape[1] != 2:
+        raise ValueError(f"data must be (price, volume) pairs, got shape {arr.shape}")
+    return arr[:, 0], arr[:, 1]
+
+
+def _profile_arrays(volume_by_price: Any) -> PriceLevels:
+    """Return (levels, volumes) float64 arrays from any supported profile form"""
+    if isinstance(volume_by_price, VolumeProfile):
+        return volume_by_price.levels()
+    if isinstance(volume_by_price, tuple):
+        return (np.asarray(volume_by_price[0], dtype=np.float64),
+                np.asarray(volume_by_price[1], dtype=np.float64))
+    count = len(volume_by_price)
+    return (np.fromiter(volume_by_price.keys(), dtype=np.float64, count=count),
+            np.fromiter(volume_by_price.values(), dtype=np.float64, count=count))
 
 
 class SupplyDemandAnalyzer:
     """Analyzes supply and demand zones"""
 
-    def calculate_volume_by_price(self, data: List[Tuple[float, int]]) -> Dict[float, float]:
+    def calculate_volume_by_price(
+        self,
+        data: Union[Sequence[Tuple[float, int]], Any]
+    ) -> Dict[float, float]:
         """Calculate volume distribution by price levels
 
         Args:
-            data: List of (price, volume) tuples
+            data: List of (price, volume) tuples, or an (n, 2) array-like
+                such as an ndarray or DataFrame (columns are used without copying)
 
         Returns:
             Dictionary mapping price to total volume
         """
-        if not data:
+        if len(data) == 0:
             return {}
 
         if HAS_NUMPY:
-            prices = np.array([d[0] for d in data])
-            volumes = np.array([d[1] for d in data])
-            
+            prices, volumes = _split_price_volume(data)
+
             # Group by price and sum volumes efficiently
             unique_prices, indices = np.unique(prices, return_inverse=True)
             total_volumes = np.bincount(indices, weights=volumes)
@@ -53,88 +91,335 @@ class SupplyDemandAnalyzer:
             volume_by_price[price] = volume_by_price.get(price, 0) + volume
         return volume_by_price
 
+    def calculate_volume_profile(
+        self,
+        data: Union[Sequence[Tuple[float, int]], Any],
+        tick_size: Optional[float] = None,
+        bins: Optional[int] = None
+    ) -> PriceLevels:
+        """Calculate a volume profile as arrays, optionally binned by price
+
+        With tick_size or bins, prices are bucketed with floor indexing and
+        np.bincount in O(n), which keeps tick data from producing one level
+        per distinct price. Without either, exact prices are grouped as in
+        calculate_volume_by_price.
+
+        Args:
+            data: List of (price, volume) tuples or an (n, 2) array-like
+            tick_size: Bin width in price units
+            bins: Number of equal-width bins over the price range
+
+        Returns:
+            (levels, volumes) arrays ordered by price, ready for identify_levels
+        """
+        if not HAS_NUMPY:
+            raise ImportError("NumPy is required for calculate_volume_profile")
+        if len(data) == 0:
+            return np.empty(0), np.empty(0)
+
+        prices, volumes = _split_price_volume(data)
+        if tick_size is None and bins is None:
+            levels, indices = np.unique(prices, return_inverse=True)
+            return levels, np.bincount(indices, weights=volumes)
+        return binned_volume_profile(prices, volumes, tick_size=tick_size, bins=bins)
+
     def identify_levels(
         self,
-        volume_by_price: Dict[float, float],
+        volume_by_price: Union[Dict[float, float], PriceLevels, VolumeProfile],
         current_price: float
     ) -> List[Zone]:
         """Identify support and resistance levels from volume profile
 
         Args:
-            volume_by_price: Dictionary of price to volume
+            volume_by_price: Dictionary of price to volume, (levels, volumes)
+                arrays from calculate_volume_profile, or a live VolumeProfile
             current_price: Current market price
 
         Returns:
             List of identified zones
         """
+        if HAS_NUMPY:
+            return self._zone_table(*_profile_arrays(volume_by_price), current_price).to_zones()
+
         if not volume_by_price:
             return []
 
-        prices_list = list(volume_by_price.keys())
+        # Fallback to pure Python
         volumes_list = list(volume_by_price.values())
+        max_volume = max(volumes_list)
+        min_volume = min(volumes_list)
+        avg_volume = sum(volumes_list) / len(volumes_list)
 
-        if HAS_NUMPY:
-            prices = np.array(prices_list)
-            volumes = np.array(volumes_list)
-            
-            avg_volume = np.mean(volumes)
-            max_vol = np.max(volumes)
-            min_vol = np.min(volumes)
-            
-            # Vectorized filtering and strength calculation
-            mask = volumes >= avg_volume * ZONE_VOLUME_THRESHOLD_MULTIPLIER
-            filtered_prices = prices[mask]
-            filtered_volumes = volumes[mask]
-            
-            if max_vol > min_vol:
-                strengths = (filtered_volumes - min_vol) / (max_vol - min_vol)
-            else:
-                strengths = np.full(len(filtered_prices), ZONE_STRENGTH_DEFAULT)
-                
-            zones = []
-            for p, v, s in zip(filtered_prices, filtered_volumes, strengths):
-                zone_type = ZoneType.SUPPORT if p < current_price else ZoneType.RESISTANCE
-                zones.append(Zone(
-                    price=float(p),
-                    volume=int(v),
-                    zone_type=zone_type,
-                    strength=float(s)
-                ))
-        else:
-            # Fallback to pure Python
-            max_volume = max(volumes_list)
-            min_volume = min(volumes_list)
-            avg_volume = sum(volumes_list) / len(volumes_list)
-            
-            zones = []
-            threshold = avg_volume * ZONE_VOLUME_THRESHOLD_MULTIPLIER
-            
-            for price, volume in volume_by_price.items():
-                if volume < threshold:
-                    continue
-                    
-                zone_type = ZoneType.SUPPORT if price < current_price else ZoneType.RESISTANCE
-                strength = (volume - min_volume) / (max_volume - min_volume) if max_volume > min_volume else ZONE_STRENGTH_DEFAULT
-                
-                zones.append(Zone(
-                    price=price,
-                    volume=int(volume),
-                    zone_type=zone_type,
-                    strength=strength
-                ))
+        zones = []
+        threshold = avg_volume * ZONE_VOLUME_THRESHOLD_MULTIPLIER
+
+        for price, volume in volume_by_price.items():
+            if volume < threshold:
+                continue
+
+            zone_type = ZoneType.SUPPORT if price < current_price else ZoneType.RESISTANCE
+            strength = (volume - min_volume) / (max_volume - min_volume) if max_volume > min_volume else ZONE_STRENGTH_DEFAULT
+
+            zones.append(Zone(
+                price=price,
+                volume=int(volume),
+                zone_type=zone_type,
+                strength=strength
+            ))
 
         # Sort by strength (strongest first)
         zones.sort(key=lambda z: z.strength, reverse=True)
         return zones
 
+    def identify_zones(
+        self,
+        volume_by_price: Union[Dict[float, float], PriceLevels, VolumeProfile],
+        current_price: float,
+        top_k: Optional[int] = None
+    ) -> ZoneTable:
+        """Identify support and resistance levels as a columnar ZoneTable
+
+        Same rules as identify_levels, but zones stay in a structured array
+        sorted with np.argsort; with top_k only the k strongest zones are
+        selected via np.argpartition. Zone objects are created lazily when
+        the table is indexed or iterated.
+
+        Args:
+            volume_by_price: Dictionary, (levels, volumes) arrays or VolumeProfile
+            current_price: Current market price
+            top_k: Keep only the k strongest zones
+
+        Returns:
+            ZoneTable, strongest first
+        """
+        if not HAS_NUMPY:
+            raise ImportError("NumPy is required for identify_zones")
+        return self._zone_table(*_profile_arrays(volume_by_price), current_price, top_k)
+
+    @staticmethod
+    def _zone_table(
+        prices: "np.ndarray",
+        volumes: "np.ndarray",
+        current_price: float,
+        top_k: Optional[int] = None
+    ) -> ZoneTable:
+        """Filter levels and score strengths in vectorized form"""
+        if len(prices) == 0:
+            return ZoneTable.from_columns([], [], [], [], top_k)
+
+        avg_volume = np.mean(volumes)
+        max_vol = np.max(volumes)
+        min_vol = np.min(volumes)
+
+        # Vectorized filtering and strength calculation
+        mask = volumes >= avg_volume * ZONE_VOLUME_THRESHOLD_MULTIPLIER
+        filtered_prices = prices[mask]
+        filtered_volumes = volumes[mask]
+
+        if max_vol > min_vol:
+            strengths = (filtered_volumes - min_vol) / (max_vol - min_vol)
+        else:
+            strengths = np.full(len(filtered_prices), ZONE_STRENGTH_DEFAULT)
+
+        zone_types = np.where(filtered_prices < current_price, SUPPORT_CODE, RESISTANCE_CODE)
+        return ZoneTable.from_columns(filtered_prices, filtered_volumes, strengths, zone_types, top_k)
+
+    def merge_zones(
+        self,
+        volume_by_price: Union[Dict[float, float], PriceLevels, VolumeProfile],
+        current_price: float,
+        max_gap: Optional[float] = None,
+        top_k: Optional[int] = None
+    ) -> ZoneTable:
+        """Cluster nearby high-volume levels into price-range zones
+
+        Levels that pass the identify_levels volume filter are swept once in
+        price order; neighbours closer than max_gap join the same zone, so
+        100.0 / 100.1 / 100.2 become one range instead of three weak zones.
+        A zone's strength is its combined volume relative to the largest
+        zone, and its price is the volume-weighted center of the range.
+
+        Args:
+            volume_by_price: Dictionary, (levels, volumes) arrays or VolumeProfile
+            current_price: Current market price
+            max_gap: Largest price gap bridged inside a zone (default: one bin)
+            top_k: Keep only the k strongest zones
+
+        Returns:
+            ZoneTable whose lows/highs columns hold each zone's price range
+        """
+        if not HAS_NUMPY:
+            raise ImportError("NumPy is required for merge_zones")
+        prices, volumes = _profile_arrays(volume_by_price)
+        if len(prices) == 0:
+            return ZoneTable.from_columns([], [], [], [], top_k)
+
+        order = np.argsort(prices, kind="stable")
+        prices, volumes = prices[order], volumes[order]
+        threshold = np.mean(volumes) * ZONE_VOLUME_THRESHOLD_MULTIPLIER
+        centers, lows, highs, totals = cluster_levels(prices, volumes, max_gap, threshold)
+
+        max_total = totals.max() if len(totals) else 0.0
+        strengths = totals / max_total if max_total > 0 else np.full(len(totals), ZONE_STRENGTH_DEFAULT)
+        zone_types = np.where(centers < current_price, SUPPORT_CODE, RESISTANCE_CODE)
+        return ZoneTable.from_columns(centers, totals, strengths, zone_types, top_k, lows=lows, highs=highs)
+
+    def analyze_universe(
+        self,
+        symbol_ids: Any,
+        prices: Any,
+        volumes: Any,
+        current_prices: Any = None,
+        tick_size: Any = None,
+        top_k: Optional[int] = None
+    ) -> UniverseZones:
+        """Identify zones and nearest levels for many symbols in one pass
+
+        Takes columnar trades or bars (e.g. straight from a Parquet/Arrow
+        scan) instead of one (price, volume) list per symbol. All volume
+        profiles come from one grouped bincount over (symbol, bin) keys, and
+        the identify_zones rules (volume threshold, strength scaling,
+        support/resistance split) are applied per symbol with segment
+        reductions, so no Python loop runs per symbol.
+
+        Args:
+            symbol_ids: Symbol of each row. Integer ids are used directly as
+                symbol rows (e.g. dictionary-encoded columns); other labels
+                are factorized and sorted.
+            prices: Price of each row
+            volumes: Volume of each row
+            current_prices: Current price per symbol row (default: the
+                price of each symbol's last row)
+            tick_size: Bin width, one value or one per symbol row
+                (default: exact prices)
+            top_k: Keep only the k strongest zones per symbol
+
+        Returns:
+            UniverseZones with every symbol's zones and nearest support /
+            resistance prices (NaN where none exists)
+        """
+        if not HAS_NUMPY:
+            raise ImportError("NumPy is required for analyze_universe")
+
+        ids = np.asarray(symbol_ids)
+        prices = np.asarray(prices, dtype=np.float64)
+        volumes = np.asarray(volumes, dtype=np.float64)
+        if not (len(ids) == len(prices) == len(volumes)):
+            raise ValueError(
+                f"symbol_ids, prices and volumes must have the same length: "
+                f"{len(ids)}, {len(prices)}, {len(volumes)}"
+            )
+
+        if np.issubdtype(ids.dtype, np.integer):
+            if len(ids) and ids.min() < 0:
+                raise ValueError("Integer symbol_ids must be non-negative")
+            codes = ids.astype(np.int64, copy=False)
+            symbols = np.arange(int(codes.max()) + 1 if len(codes) else 0)
+        else:
+            symbols, codes = np.unique(ids, return_inverse=True)
+            codes = codes.astype(np.int64, copy=False)
+        n_symbols = len(symbols)
+
+        if current_prices is None:
+            last_row = np.full(n_symbols, -1)
+            np.maximum.at(last_row, codes, np.arange(len(codes)))
+            current = np.where(last_row >= 0, prices[last_row], np.nan)
+        else:
+            current = np.asarray(current_prices, dtype=np.float64)
+            if len(current) != n_symbols:
+                raise ValueError(f"Expected {n_symbols} current prices, got {len(current)}")
+
+        level_codes, levels, level_volumes = grouped_volume_profile(
+            codes, n_symbols, prices, volumes, tick_size
+        )
+        zone_codes, data = self._universe_zone_rows(
+            level_codes, levels, level_volumes, current, n_symbols, top_k
+        )
+
+        # Nearest levels follow ZoneIndex: strictly below / above the current price
+        supports = np.full(n_symbols, -np.inf)
+        resistances = np.full(n_symbols, np.inf)
+        below = data["price"] < current[zone_codes]
+        above = data["price"] > current[zone_codes]
+        np.maximum.at(supports, zone_codes[below], data["price"][below])
+        np.minimum.at(resistances, zone_codes[above], data["price"][above])
+        supports[np.isneginf(supports)] = np.nan
+        resistances[np.isposinf(resistances)] = np.nan
+
+        offsets = np.concatenate([[0], np.cumsum(np.bincount(zone_codes, minlength=n_symbols))])
+        return UniverseZones(symbols, ZoneTable(data), offsets, current, supports, resistances)
+
+    @staticmethod
+    def _universe_zone_rows(
+        level_codes: "np.ndarray",
+        levels: "np.ndarray",
+        level_volumes: "np.ndarray",
+        current: "np.ndarray",
+        n_symbols: int,
+        top_k: Optional[int]
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Apply the _zone_table rules per symbol to levels grouped by symbol
+
+        Returns:
+            (zone_codes, zone rows) ordered by symbol, strongest first
+        """
+        counts = np.bincount(level_codes, minlength=n_symbols)
+        present = np.flatnonzero(counts)
+        starts = np.concatenate([[0], np.cumsum(counts)[:-1]])[present]
+
+        avg_volume = np.zeros(n_symbols)
+        min_vol = np.zeros(n_symbols)
+        max_vol = np.zeros(n_symbols)
+        if len(present):
+            avg_volume[present] = np.add.reduceat(level_volumes, starts) / counts[present]
+            min_vol[present] = np.minimum.reduceat(level_volumes, starts)
+            max_vol[present] = np.maximum.reduceat(level_volumes, starts)
+
+        mask = level_volumes >= (avg_volume * ZONE_VOLUME_THRESHOLD_MULTIPLIER)[level_codes]
+        zone_codes = level_codes[mask]
+        zone_prices = levels[mask]
+        zone_volumes = level_volumes[mask]
+
+        low, high = min_vol[zone_codes], max_vol[zone_codes]
+        spread = high > low
+        strengths = np.full(len(zone_codes), ZONE_STRENGTH_DEFAULT)
+        strengths[spread] = (zone_volumes[spread] - low[spread]) / (high[spread] - low[spread])
+
+        # lexsort is stable, so ties keep price order as in identify_zones
+        order = np.lexsort((-strengths, zone_codes))
+        zone_codes = zone_codes[order]
+        if top_k is not None:
+            zone_starts = np.concatenate([[0], np.cumsum(np.bincount(zone_codes, minlength=n_symbols))[:-1]])
+            rank = np.arange(len(zone_codes)) - zone_starts[zone_codes]
+            keep = rank < top_k
+            order = order[keep]
+            zone_codes = zone_codes[keep]
+
+        data = np.empty(len(order), dtype=ZONE_DTYPE)
+        data["price"] = zone_prices[order]
+        data["low"] = data["price"]
+        data["high"] = data["price"]
+        data["volume"] = zone_volumes[order]
+        data["strength"] = strengths[order]
+        data["zone_type"] = np.where(data["price"] < current[zone_codes], SUPPORT_CODE, RESISTANCE_CODE)
+        return zone_codes, data
+
     def detect_breakout(
         self,
-        zones: List[Zone],
+        zones: Union[List[Zone], ZoneIndex],
         current_price: float,
         current_volume: int,
-        average_volume: int
+        average_volume: int,
+        timestamp: Optional[datetime] = None
     ) -> Optional[BreakoutEvent]:
-        """Detect breakout from support or resistance zone"""
+        """Detect breakout from support or resistance zone
+
+        Pass a ZoneIndex instead of a list to avoid the linear scan. Pass
+        the bar's timestamp to stamp the event with it; otherwise the event
+        calls datetime.now() when it is built.
+        """
+        if isinstance(zones, ZoneIndex):
+            return zones.detect_breakout(current_price, current_volume, average_volume, timestamp)
         if not zones:
             return None
 
@@ -148,7 +433,8 @@ class SupplyDemandAnalyzer:
                     price=current_price,
                     zone=zone,
                     volume=current_volume,
-                    is_confirmed=current_volume >= threshold
+                    is_confirmed=current_volume >= threshold,
+                    timestamp=timestamp
                 )
             
             # Support breakout (Bearish)
@@ -158,17 +444,26 @@ class SupplyDemandAnalyzer:
                     price=current_price,
                     zone=zone,
                     volume=current_volume,
-                    is_confirmed=current_volume >= threshold
+                    is_confirmed=current_volume >= threshold,
+                    timestamp=timestamp
                 )
 
         return None
 
-    def get_nearest_support(self, zones: List[Zone], current_price: float) -> Optional[Zone]:
+    def build_zone_index(self, zones: Union[List[Zone], ZoneTable]) -> ZoneIndex:
+        """Build a ZoneIndex for O(log n) nearest-level and breakout queries"""
+        return ZoneIndex(zones)
+
+    def get_nearest_support(self, zones: Union[List[Zone], ZoneIndex], current_price: float) -> Optional[Zone]:
         """Find nearest support zone below current price"""
+        if isinstance(zones, ZoneIndex):
+            return zones.nearest_support(current_price)
         supports = [z for z in zones if z.zone_type == ZoneType.SUPPORT and z.price < current_price]
         return max(supports, key=lambda z: z.price) if supports else None
 
-    def get_nearest_resistance(self, zones: List[Zone], current_price: float) -> Optional[Zone]:
+    def get_nearest_resistance(self, zones: Union[List[Zone], ZoneIndex], current_price: float) -> Optional[Zone]:
         """Find nearest resistance zone above current price"""
+        if isinstance(zones, ZoneIndex):
+            return zones.nearest_resistance(current_price)
         resistances = [z for z in zones if z.zone_type == ZoneType.RESISTANCE and z.price > current_price]
         return min(resistances, key=lambda z: z.price) if resistances else None
\ No newline at end of file
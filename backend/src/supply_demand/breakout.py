@@ -0,0 +1,230 @@
+"""
+Breakout Detector
+
+Stateful, per-symbol breakout detection. Rolling average volume and
+return volatility are maintained in O(1) per bar, so confirming a breakout
+no longer needs the caller to recompute averages over the full history.
+Every zone crossed since the previous bar is found with one bisect per
+side of a ZoneIndex and confirmed as a batch.
+"""
+
+import math
+from datetime import datetime
+from typing import Dict, List, Optional, Union
+
+from .models import BreakoutEvent, Zone
+from .zones import ZoneIndex, ZoneTable, BREAKOUT_VOLUME_SURGE_MULTIPLIER
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# Bars in the rolling volume/volatility window
+DEFAULT_BREAKOUT_WINDOW = 20
+
+
+class RollingWindow:
+    """Mean and standard deviation of the last `size` values in O(1) per push
+
+    Running sums are recomputed from the buffer each time it wraps around,
+    which bounds floating-point drift at O(1) amortized cost.
+    """
+
+    __slots__ = ("size", "_values", "_pos", "_count", "_sum", "_sum_sq")
+
+    def __init__(self, size: int):
+        if size < 1:
+            raise ValueError(f"Window size must be positive, got {size}")
+        self.size = size
+        self._values = [0.0] * size
+        self._pos = 0
+        self._count = 0
+        self._sum = 0.0
+        self._sum_sq = 0.0
+
+    def push(self, value: float) -> None:
+        """Add a value, evicting the oldest once the window is full"""
+        old = self._values[self._pos]
+        self._values[self._pos] = value
+        self._pos += 1
+        if self._count < self.size:
+            self._count += 1
+            self._sum += value
+            self._sum_sq += value * value
+        else:
+            self._sum += value - old
+            self._sum_sq += value * value - old * old
+        if self._pos == self.size:
+            self._pos = 0
+            self._sum = math.fsum(self._values)
+            self._sum_sq = math.fsum(v * v for v in self._values)
+
+    @property
+    def count(self) -> int:
+        """Number of values in the window"""
+        return self._count
+
+    @property
+    def mean(self) -> float:
+        """Mean of the window (0.0 when empty)"""
+        return self._sum / self._count if self._count else 0.0
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation of the window (0.0 when empty)"""
+        if not self._count:
+            return 0.0
+        mean = self._sum / self._count
+        return math.sqrt(max(self._sum_sq / self._count - mean * mean, 0.0))
+
+
+class _SymbolState:
+    """Rolling statistics and last close of one symbol"""
+
+    __slots__ = ("volumes", "returns", "last_close")
+
+    def __init__(self, window: int):
+        self.volumes = RollingWindow(window)
+        self.returns = RollingWindow(window)
+        self.last_close: Optional[float] = None
+
+
+class BreakoutDetector:
+    """Volume-confirmed breakout detection over streaming bars
+
+    Example:
+        detector = BreakoutDetector(window=20)
+        detector.set_zones("7203", analyzer.identify_zones(profile, price))
+        for close, volume in bars:
+            for event in detector.update("7203", close, volume):
+                alert(event)
+    """
+
+    def __init__(
+        self,
+        window: int = DEFAULT_BREAKOUT_WINDOW,
+        volume_multiplier: float = BREAKOUT_VOLUME_SURGE_MULTIPLIER,
+        min_penetration: float = 0.0
+    ):
+        """Initialize the detector
+
+        Args:
+            window: Bars in the rolling average volume / volatility window
+            volume_multiplier: Volume must reach average * multiplier to confirm
+            min_penetration: Minimum distance past the zone, in units of
+                rolling return volatility, for a confirmed breakout
+        """
+        if not HAS_NUMPY:
+            raise ImportError("NumPy is required for BreakoutDetector")
+        if window < 1:
+            raise ValueError(f"window must be positive, got {window}")
+        self.window = window
+        self.volume_multiplier = volume_multiplier
+        self.min_penetration = min_penetration
+        self._states: Dict[str, _SymbolState] = {}
+        self._indexes: Dict[str, ZoneIndex] = {}
+
+    def set_zones(self, symbol: str, zones: Union[ZoneIndex, ZoneTable, List[Zone]]) -> None:
+        """Replace the zones watched for a symbol (rolling statistics are kept)"""
+        self._indexes[symbol] = zones if isinstance(zones, ZoneIndex) else ZoneIndex(zones)
+
+    def average_volume(self, symbol: str) -> float:
+        """Rolling average volume of a symbol (0.0 before any bar)"""
+        state = self._states.get(symbol)
+        return state.volumes.mean if state else 0.0
+
+    def volatility(self, symbol: str) -> float:
+        """Rolling standard deviation of close-to-close returns"""
+        state = self._states.get(symbol)
+        return state.returns.std if state else 0.0
+
+    def update(
+        self,
+        symbol: str,
+        close: float,
+        volume: float,
+        timestamp: Optional[datetime] = None,
+        include_unconfirmed: bool = False
+    ) -> List[BreakoutEvent]:
+        """Process one closed bar
+
+        All zones crossed between the previous close and this close are
+        checked against the rolling statistics of the preceding bars, then
+        the bar is added to the window.
+
+        Args:
+            symbol: Stock symbol
+            close: Closing price of the bar
+            volume: Volume of the bar
+            timestamp: Bar time for the events (default: now)
+            include_unconfirmed: Also return crossings without volume confirmation
+
+        Returns:
+            Breakout events ordered by zone strength (strongest first), ties
+            broken by how far the close moved past the zone
+        """
+        state = self._states.get(symbol)
+        if state is None:
+            state = self._states[symbol] = _SymbolState(self.window)
+
+        events: List[BreakoutEvent] = []
+        previous = state.last_close
+        index = self._indexes.get(symbol)
+        if previous is not None and index is not None and close != previous:
+            events = self._evaluate(index, state, previous, close, volume, timestamp, include_unconfirmed)
+
+        if previous:
+            state.returns.push(close / previous - 1.0)
+        state.volumes.push(volume)
+        state.last_close = close
+        return events
+
+    def _evaluate(
+        self,
+        index: ZoneIndex,
+        state: _SymbolState,
+        previous: float,
+        close: float,
+        volume: float,
+        timestamp: Optional[datetime],
+        include_unconfirmed: bool
+    ) -> List[BreakoutEvent]:
+        """Confirm and rank every zone crossed by the move previous -> close"""
+        bullish_rows, bearish_rows = index.crossings(previous, close)
+        rows = bullish_rows if len(bullish_rows) else bearish_rows
+        if len(rows) == 0:
+            return []
+
+        zone_prices = index.table.prices[rows]
+        strengths = index.table.strengths[rows]
+        sigma = state.returns.std
+        with np.errstate(divide="ignore", invalid="ignore"):
+            penetration = np.abs(close - zone_prices) / np.abs(zone_prices)
+            if sigma > 0:
+                penetration = penetration / sigma
+            else:
+                penetration = np.where(penetration > 0, np.inf, 0.0)
+
+        volume_confirmed = state.volumes.count > 0 and volume >= state.volumes.mean * self.volume_multiplier
+        confirmed = np.full(len(rows), volume_confirmed) & (penetration >= self.min_penetration)
+        keep = np.ones(len(rows), dtype=bool) if include_unconfirmed else confirmed
+        if not keep.any():
+            return []
+
+        rows, strengths, penetration, confirmed = rows[keep], strengths[keep], penetration[keep], confirmed[keep]
+        order = np.lexsort((-penetration, -strengths))
+        direction = "bullish" if len(bullish_rows) else "bearish"
+        extra = {} if timestamp is None else {"timestamp": timestamp}
+        return [
+            BreakoutEvent(
+                direction=direction,
+                price=close,
+                zone=index.table[int(row)],
+                volume=volume,
+                is_confirmed=bool(is_confirmed),
+                **extra
+            )
+            for row, is_confirmed in zip(rows[order].tolist(), confirmed[order].tolist())
+        ]
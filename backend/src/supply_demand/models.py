@@ -1,13 +1,15 @@
 """
 Supply/Demand Models
 
-Defines data models for supply/demand analysis.
+Defines data models for supply/demand analysis. Models are slotted
+dataclasses (no per-instance __dict__); FrozenZone is an immutable,
+hashable variant of Zone.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Literal
+from typing import Literal, Optional
 
 
 class ZoneType(Enum):
@@ -20,28 +22,51 @@ class ZoneType(Enum):
         return self.value
 
 
-@dataclass
-class Zone:
+class _ZoneBase:
+    """Behaviour shared by Zone and FrozenZone"""
+
+    __slots__ = ()
+
+    def __str__(self) -> str:
+        """Return string representation"""
+        return f"{self.zone_type.value} @ {self.price:.2f} (strength: {self.strength:.2f})"
+
+
+@dataclass(slots=True)
+class Zone(_ZoneBase):
     """Represents a support or resistance zone"""
     price: float
     volume: int
     zone_type: ZoneType
     strength: float  # 0.0 to 1.0, higher is stronger
 
-    def __str__(self) -> str:
-        """Return string representation"""
-        return f"{self.zone_type.value} @ {self.price:.2f} (strength: {self.strength:.2f})"
+
+@dataclass(slots=True, frozen=True)
+class FrozenZone(_ZoneBase):
+    """Immutable, hashable Zone (e.g. for sets or dict keys)"""
+    price: float
+    volume: int
+    zone_type: ZoneType
+    strength: float  # 0.0 to 1.0, higher is stronger
 
 
-@dataclass
+@dataclass(slots=True)
 class BreakoutEvent:
-    """Represents a breakout event"""
+    """Represents a breakout event
+
+    timestamp defaults to the construction time (one datetime.now() call);
+    the breakout detectors take the bar's timestamp and pass it through.
+    """
     direction: Literal["bullish", "bearish"]
     price: float
     zone: Zone
     volume: int
     is_confirmed: bool  # True if volume confirms the breakout
-    timestamp: datetime = field(default_factory=datetime.now)  # Changed from float to datetime with default
+    timestamp: Optional[datetime] = None
+
+    def __post_init__(self) -> None:
+        if self.timestamp is None:
+            self.timestamp = datetime.now()
 
     def __str__(self) -> str:
         """Return string representation"""
@@ -0,0 +1,367 @@
+"""
+Volume Profile
+
+Price-binned volume profiles computed in O(n) with floor indexing and
+np.bincount instead of sorting exact prices (falling back to a sparse
+group-by when the price range is far wider than the data), plus a stateful VolumeProfile
+that is updated tick by tick for live supply/demand zones.
+"""
+
+import math
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, Optional, Tuple, Union
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# Guards floor() against prices sitting exactly on a bin edge, e.g. 100.1 / 0.1
+_BIN_EPSILON = 1e-9
+# Decimal places kept when converting bin indexes back to prices
+_PRICE_DECIMALS = 10
+# Largest decay exponent before stored volumes are rescaled
+_MAX_DECAY_EXPONENT = 50.0
+# Volumes at or below this are treated as empty (float residue after expiry)
+_EMPTY_VOLUME = 1e-9
+# Sum into a dense bincount while the key span is at most this many times
+# the number of prices; beyond that (outliers, tiny ticks) group the sparse
+# keys instead, so memory follows the data rather than the price range
+DENSE_SPAN_FACTOR = 4
+
+Timestamp = Union[float, datetime]
+
+
+def price_to_bin(prices: "np.ndarray", tick_size: float, origin: float = 0.0) -> "np.ndarray":
+    """Map prices to integer bin indexes of width tick_size starting at origin"""
+    return np.floor((prices - origin) / tick_size + _BIN_EPSILON).astype(np.int64)
+
+
+def bin_to_price(bins: "np.ndarray", tick_size: float, origin: float = 0.0) -> "np.ndarray":
+    """Return the lower-edge price of each bin index"""
+    return np.round(origin + bins * tick_size, _PRICE_DECIMALS)
+
+
+def sum_by_key(keys: "np.ndarray", volumes: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+    """Sum volumes per integer key
+
+    Returns:
+        (keys, totals) of keys with non-zero volume, in ascending key order
+    """
+    first = int(keys.min())
+    span = int(keys.max()) - first + 1
+    if span <= DENSE_SPAN_FACTOR * len(keys):
+        # Shift keys to start at zero so bincount only spans the occupied range
+        totals = np.bincount(keys - first, weights=volumes, minlength=span)
+        occupied = np.flatnonzero(totals)
+        return occupied + first, totals[occupied]
+    unique, inverse = np.unique(keys, return_inverse=True)
+    totals = np.bincount(inverse.ravel(), weights=volumes, minlength=len(unique))
+    occupied = np.flatnonzero(totals)
+    return unique[occupied], totals[occupied]
+
+
+def binned_volume_profile(
+    prices: "np.ndarray",
+    volumes: "np.ndarray",
+    tick_size: Optional[float] = None,
+    bins: Optional[int] = None
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Sum volume into price bins
+
+    Exactly one of tick_size or bins must be given. With tick_size, levels
+    snap to multiples of the tick; with bins, the price range is split into
+    that many equal-width bins starting at the minimum price.
+
+    Args:
+        prices: Trade or bar prices
+        volumes: Volume per price
+        tick_size: Bin width in price units
+        bins: Number of equal-width bins over the price range
+
+    Returns:
+        (levels, volumes) arrays for non-empty bins, ordered by price;
+        each level is the lower edge of its bin
+    """
+    if not HAS_NUMPY:
+        raise ImportError("NumPy is required for binned volume profiles")
+    if (tick_size is None) == (bins is None):
+        raise ValueError("Specify exactly one of tick_size or bins")
+
+    prices = np.asarray(prices, dtype=np.float64)
+    volumes = np.asarray(volumes, dtype=np.float64)
+    if len(prices) == 0:
+        return np.empty(0), np.empty(0)
+
+    if bins is not None:
+        if bins < 1:
+            raise ValueError(f"bins must be positive, got {bins}")
+        origin = float(prices.min())
+        width = (float(prices.max()) - origin) / bins
+        tick_size = width if width > 0 else 1.0
+        keys = np.minimum(price_to_bin(prices, tick_size, origin), bins - 1)
+    else:
+        if tick_size <= 0:
+            raise ValueError(f"tick_size must be positive, got {tick_size}")
+        origin = 0.0
+        keys = price_to_bin(prices, tick_size)
+
+    occupied, totals = sum_by_key(keys, volumes)
+    return bin_to_price(occupied, tick_size, origin), totals
+
+
+def grouped_volume_profile(
+    codes: "np.ndarray",
+    n_groups: int,
+    prices: "np.ndarray",
+    volumes: "np.ndarray",
+    tick_size: Any = None
+) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Volume profiles of many symbols at once
+
+    With tick_size, every (symbol, bin) pair is mapped to one slot of a
+    single flat array: each symbol gets the contiguous key range between
+    its lowest and highest bin, and one np.bincount sums all volume. When
+    those ranges add up to far more slots than prices (outliers, tiny
+    ticks), or without tick_size, (symbol, key) pairs are grouped with one
+    lexsort instead.
+
+    Args:
+        codes: Symbol row (0 .. n_groups - 1) of each trade
+        n_groups: Number of symbols
+        prices: Trade or bar prices
+        volumes: Volume per price
+        tick_size: Bin width, either one value or one per symbol
+
+    Returns:
+        (level_codes, levels, volumes) ordered by symbol, then price
+    """
+    if len(prices) == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0), np.empty(0)
+
+    if tick_size is None:
+        return _group_sorted(codes, prices, volumes)
+
+    ticks = np.asarray(tick_size, dtype=np.float64)
+    if np.any(ticks <= 0):
+        raise ValueError("tick_size must be positive")
+    if ticks.ndim:
+        if len(ticks) != n_groups:
+            raise ValueError(f"Expected {n_groups} tick sizes, got {len(ticks)}")
+        keys = price_to_bin(prices, ticks[codes])
+    else:
+        keys = price_to_bin(prices, float(ticks))
+
+    first = np.full(n_groups, np.iinfo(np.int64).max)
+    last = np.full(n_groups, np.iinfo(np.int64).min)
+    np.minimum.at(first, codes, keys)
+    np.maximum.at(last, codes, keys)
+    widths = np.where(last >= first, last - first + 1, 0)
+    if widths.sum() > DENSE_SPAN_FACTOR * len(keys):
+        level_codes, level_keys, totals = _group_sorted(codes, keys, volumes)
+        occupied = np.flatnonzero(totals)
+        level_ticks = ticks[level_codes[occupied]] if ticks.ndim else float(ticks)
+        return level_codes[occupied], bin_to_price(level_keys[occupied], level_ticks), totals[occupied]
+    bases = np.concatenate([[0], np.cumsum(widths)[:-1]])
+
+    totals = np.bincount(bases[codes] + keys - first[codes], weights=volumes,
+                         minlength=int(widths.sum()))
+    occupied = np.flatnonzero(totals)
+    # Empty symbols share their base with the next symbol, so take the last match
+    level_codes = np.searchsorted(bases, occupied, side="right") - 1
+    level_ticks = ticks[level_codes] if ticks.ndim else float(ticks)
+    levels = bin_to_price(first[level_codes] + occupied - bases[level_codes], level_ticks)
+    return level_codes, levels, totals[occupied]
+
+
+def _group_sorted(
+    codes: "np.ndarray", keys: "np.ndarray", volumes: "np.ndarray"
+) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Sum volumes per (code, key) pair with one lexsort
+
+    Returns:
+        (codes, keys, volumes) per pair, ordered by code, then key
+    """
+    order = np.lexsort((keys, codes))
+    sorted_codes = codes[order]
+    sorted_keys = keys[order]
+    starts = np.flatnonzero(
+        (np.diff(sorted_codes) != 0) | (np.diff(sorted_keys) != 0)
+    ) + 1
+    starts = np.concatenate([[0], starts])
+    return sorted_codes[starts], sorted_keys[starts], np.add.reduceat(volumes[order], starts)
+
+
+def _to_seconds(timestamp: Optional[Timestamp]) -> float:
+    """Convert a timestamp to epoch seconds (None means now)"""
+    if timestamp is None:
+        return time.time()
+    if isinstance(timestamp, datetime):
+        return timestamp.timestamp()
+    return float(timestamp)
+
+
+class VolumeProfile:
+    """Incrementally maintained, price-binned volume profile
+
+    Ticks are added in O(1) into a sparse bin -> volume mapping, so memory
+    follows the number of occupied bins however far apart the prices are.
+    Old volume can expire after a sliding time window and/or decay
+    exponentially with a half-life; both are applied lazily so a tick never
+    touches every bin, and bins emptied by expiry are dropped. levels()
+    returns the current profile in O(bins log bins) for identify_levels.
+
+    Timestamps are epoch seconds or datetimes and are expected in
+    non-decreasing order.
+    """
+
+    def __init__(
+        self,
+        tick_size: float,
+        window: Optional[float] = None,
+        half_life: Optional[float] = None
+    ):
+        """Initialize an empty profile
+
+        Args:
+            tick_size: Bin width in price units
+            window: Expire volume older than this many seconds
+            half_life: Halve the weight of volume every this many seconds
+        """
+        if not HAS_NUMPY:
+            raise ImportError("NumPy is required for VolumeProfile")
+        if tick_size <= 0:
+            raise ValueError(f"tick_size must be positive, got {tick_size}")
+        if window is not None and window <= 0:
+            raise ValueError(f"window must be positive, got {window}")
+        if half_life is not None and half_life <= 0:
+            raise ValueError(f"half_life must be positive, got {half_life}")
+
+        self.tick_size = tick_size
+        self.window = window
+        self.half_life = half_life
+        self._decay_rate = math.log(2) / half_life if half_life else 0.0
+
+        self._bins: Dict[int, float] = {}
+        # Stored volumes are scaled by exp(rate * (t - _ref_time)) when decaying
+        self._ref_time: Optional[float] = None
+        self._now: Optional[float] = None
+        self._recent: Deque[Tuple[float, int, float]] = deque()
+
+    @property
+    def now(self) -> Optional[float]:
+        """Timestamp of the latest update (epoch seconds)"""
+        return self._now
+
+    @property
+    def total_volume(self) -> float:
+        """Total (decayed, unexpired) volume in the profile"""
+        return math.fsum(self._bins.values()) * self._decay_factor()
+
+    def add(self, price: float, volume: float, timestamp: Optional[Timestamp] = None) -> None:
+        """Add one tick or bar in O(1)
+
+        Args:
+            price: Trade price
+            volume: Traded volume
+            timestamp: Time of the trade (default: now)
+        """
+        t = _to_seconds(timestamp)
+        self.advance(t)
+        key = int(math.floor(price / self.tick_size + _BIN_EPSILON))
+        amount = volume * self._scale(t)
+        self._bins[key] = self._bins.get(key, 0.0) + amount
+        if self.window is not None:
+            self._recent.append((t, key, amount))
+
+    def add_many(self, prices: Any, volumes: Any, timestamps: Any = None) -> None:
+        """Add a batch of ticks with one vectorized scatter-add
+
+        Args:
+            prices: Trade prices
+            volumes: Traded volumes
+            timestamps: Epoch seconds per trade, non-decreasing (default: now)
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        volumes = np.asarray(volumes, dtype=np.float64)
+        if len(prices) == 0:
+            return
+        if timestamps is None:
+            times = np.full(len(prices), time.time())
+        else:
+            times = np.asarray(timestamps, dtype=np.float64)
+
+        self.advance(float(times[-1]))
+        keys = price_to_bin(prices, self.tick_size)
+        amounts = volumes * self._scale(times)
+        if self.window is not None:
+            live = times >= self._now - self.window
+            self._recent.extend(zip(times[live].tolist(), keys[live].tolist(), amounts[live].tolist()))
+            # Ticks already outside the window are never added
+            keys, amounts = keys[live], amounts[live]
+            if len(keys) == 0:
+                return
+        bins = self._bins
+        for key, amount in zip(*(column.tolist() for column in sum_by_key(keys, amounts))):
+            bins[key] = bins.get(key, 0.0) + amount
+
+    def advance(self, timestamp: Timestamp) -> None:
+        """Move the profile clock forward, expiring volume outside the window
+
+        Args:
+            timestamp: Current time
+        """
+        t = _to_seconds(timestamp)
+        if self._now is not None and t < self._now:
+            return
+        self._now = t
+        if self._ref_time is None:
+            self._ref_time = t
+        elif self._decay_rate and self._decay_rate * (t - self._ref_time) > _MAX_DECAY_EXPONENT:
+            self._rebase(t)
+
+        if self.window is not None:
+            cutoff = t - self.window
+            recent = self._recent
+            bins = self._bins
+            # Stored (scaled) volume below which an expired bin counts as empty
+            empty = _EMPTY_VOLUME / self._decay_factor()
+            while recent and recent[0][0] < cutoff:
+                _, key, amount = recent.popleft()
+                remaining = bins.get(key, 0.0) - amount
+                if remaining > empty:
+                    bins[key] = remaining
+                else:
+                    bins.pop(key, None)
+
+    def levels(self) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Return (levels, volumes) arrays of non-empty bins, ordered by price"""
+        n = len(self._bins)
+        keys = np.fromiter(self._bins.keys(), dtype=np.int64, count=n)
+        current = np.fromiter(self._bins.values(), dtype=np.float64, count=n) * self._decay_factor()
+        order = np.argsort(keys)
+        keys, current = keys[order], current[order]
+        occupied = current > _EMPTY_VOLUME
+        return bin_to_price(keys[occupied], self.tick_size), current[occupied]
+
+    def _decay_factor(self) -> float:
+        """Factor converting stored volumes to present-time units"""
+        if not self._decay_rate or self._now is None:
+            return 1.0
+        return math.exp(-self._decay_rate * (self._now - self._ref_time))
+
+    def _scale(self, t: Any) -> Any:
+        """Inflation applied to volume added at time t under decay"""
+        if not self._decay_rate:
+            return 1.0
+        return np.exp(self._decay_rate * (t - self._ref_time))
+
+    def _rebase(self, t: float) -> None:
+        """Move the decay reference time to t so stored values stay bounded"""
+        factor = math.exp(-self._decay_rate * (t - self._ref_time))
+        self._bins = {key: volume * factor for key, volume in self._bins.items()}
+        self._recent = deque((ts, key, amount * factor) for ts, key, amount in self._recent)
+        self._ref_time = t
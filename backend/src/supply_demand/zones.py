@@ -0,0 +1,480 @@
+"""
+Zone Table
+
+Columnar supply/demand zones backed by a NumPy structured array. Zones are
+kept as parallel columns (price, volume, strength, type) and only turned
+into Zone objects when a caller indexes or iterates the table. ZoneIndex
+answers nearest-level and breakout queries on a table in O(log n), and
+UniverseZones holds the zones of a whole universe in one table.
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Any, Iterator, List, Optional, Tuple, Union
+
+from .models import Zone, ZoneType, BreakoutEvent
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# zone_type column codes
+SUPPORT_CODE = 0
+RESISTANCE_CODE = 1
+_ZONE_TYPES = (ZoneType.SUPPORT, ZoneType.RESISTANCE)
+
+# Breakout direction codes
+BULLISH_CODE = 1
+BEARISH_CODE = -1
+NO_BREAKOUT_CODE = 0
+
+# Constants for breakout detection
+BREAKOUT_VOLUME_SURGE_MULTIPLIER = 1.5  # 50% volume surge for confirmation
+
+BREAKOUT_DTYPE = [
+    ("price", "f8"),
+    ("direction", "i1"),
+    ("zone_row", "i8"),
+    ("zone_price", "f8"),
+    ("is_confirmed", "?"),
+]
+
+# low/high span the price range of merged zones; both equal price otherwise
+ZONE_DTYPE = [
+    ("price", "f8"),
+    ("low", "f8"),
+    ("high", "f8"),
+    ("volume", "f8"),
+    ("strength", "f8"),
+    ("zone_type", "i1"),
+]
+
+
+def strongest_first(strengths: "np.ndarray", top_k: Optional[int] = None) -> "np.ndarray":
+    """Return indexes ordering strengths from strongest to weakest
+
+    With top_k, only the k strongest are selected (np.argpartition) and
+    sorted, which avoids a full sort when most zones are discarded. Ties
+    keep their original order (which of several zones tied at the k-th
+    place is kept is unspecified).
+    """
+    n = len(strengths)
+    if top_k is None or top_k >= n:
+        return np.argsort(-strengths, kind="stable")
+    if top_k <= 0:
+        return np.empty(0, dtype=np.intp)
+    candidates = np.argpartition(-strengths, top_k - 1)[:top_k]
+    # Restore original order before the stable sort so ties resolve as in a full sort
+    candidates.sort()
+    return candidates[np.argsort(-strengths[candidates], kind="stable")]
+
+
+def cluster_levels(
+    prices: "np.ndarray",
+    volumes: "np.ndarray",
+    max_gap: Optional[float] = None,
+    min_volume: float = 0.0
+) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Merge adjacent high-volume price levels into ranges in one linear sweep
+
+    Levels below min_volume are dropped; the remaining levels (sorted by
+    price) start a new cluster wherever the gap to the previous kept level
+    exceeds max_gap.
+
+    Args:
+        prices: Level prices, sorted ascending
+        volumes: Volume per level
+        max_gap: Largest price gap bridged within one cluster
+            (default: the smallest spacing between levels, i.e. one bin)
+        min_volume: Volume a level needs to join any cluster
+
+    Returns:
+        (centers, lows, highs, volumes) per cluster, ordered by price; the
+        center is the volume-weighted average price of the cluster
+    """
+    if max_gap is None:
+        spacing = np.diff(prices)
+        spacing = spacing[spacing > 0]
+        max_gap = float(spacing.min()) if len(spacing) else 0.0
+    # Tolerate float noise in binned prices (e.g. 100.1 - 100.0)
+    max_gap = max_gap * (1 + 1e-9)
+
+    keep = volumes >= min_volume
+    kept_prices = prices[keep]
+    kept_volumes = volumes[keep]
+    if len(kept_prices) == 0:
+        empty = np.empty(0)
+        return empty, empty, empty, empty
+
+    starts = np.concatenate([[0], np.flatnonzero(np.diff(kept_prices) > max_gap) + 1])
+    ends = np.concatenate([starts[1:], [len(kept_prices)]]) - 1
+
+    cluster_volumes = np.add.reduceat(kept_volumes, starts)
+    weighted = np.add.reduceat(kept_prices * kept_volumes, starts)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        centers = np.where(cluster_volumes > 0, weighted / cluster_volumes, kept_prices[starts])
+    return centers, kept_prices[starts], kept_prices[ends], cluster_volumes
+
+
+class ZoneTable:
+    """Columnar collection of zones, strongest first
+
+    Indexing or iterating yields Zone objects, so a ZoneTable can be passed
+    wherever a List[Zone] is expected; the columns are available as arrays
+    for vectorized consumers.
+    """
+
+    def __init__(self, data: "np.ndarray"):
+        """Wrap a structured array with ZONE_DTYPE fields (already ordered)"""
+        self.data = data
+
+    @classmethod
+    def from_columns(
+        cls,
+        prices: Any,
+        volumes: Any,
+        strengths: Any,
+        zone_types: Any,
+        top_k: Optional[int] = None,
+        lows: Any = None,
+        highs: Any = None
+    ) -> "ZoneTable":
+        """Build a table ordered by strength (strongest first)
+
+        Args:
+            prices: Zone prices
+            volumes: Zone volumes
+            strengths: Zone strengths (0.0 to 1.0)
+            zone_types: SUPPORT_CODE / RESISTANCE_CODE per zone
+            top_k: Keep only the k strongest zones
+            lows: Lower bound of each zone's price range (default: prices)
+            highs: Upper bound of each zone's price range (default: prices)
+        """
+        strengths = np.asarray(strengths, dtype=np.float64)
+        prices = np.asarray(prices, dtype=np.float64)
+        order = strongest_first(strengths, top_k)
+        data = np.empty(len(order), dtype=ZONE_DTYPE)
+        data["price"] = prices[order]
+        data["low"] = (prices if lows is None else np.asarray(lows, dtype=np.float64))[order]
+        data["high"] = (prices if highs is None else np.asarray(highs, dtype=np.float64))[order]
+        data["volume"] = np.asarray(volumes, dtype=np.float64)[order]
+        data["strength"] = strengths[order]
+        data["zone_type"] = np.asarray(zone_types)[order]
+        return cls(data)
+
+    @classmethod
+    def from_zones(cls, zones: List[Zone]) -> "ZoneTable":
+        """Build a table from Zone objects, keeping their order"""
+        data = np.empty(len(zones), dtype=ZONE_DTYPE)
+        data["price"] = [z.price for z in zones]
+        data["low"] = data["price"]
+        data["high"] = data["price"]
+        data["volume"] = [z.volume for z in zones]
+        data["strength"] = [z.strength for z in zones]
+        data["zone_type"] = [RESISTANCE_CODE if z.zone_type == ZoneType.RESISTANCE else SUPPORT_CODE
+                             for z in zones]
+        return cls(data)
+
+    @property
+    def prices(self) -> "np.ndarray":
+        """Zone prices"""
+        return self.data["price"]
+
+    @property
+    def lows(self) -> "np.ndarray":
+        """Lower bound of each zone's price range"""
+        return self.data["low"]
+
+    @property
+    def highs(self) -> "np.ndarray":
+        """Upper bound of each zone's price range"""
+        return self.data["high"]
+
+    @property
+    def volumes(self) -> "np.ndarray":
+        """Zone volumes"""
+        return self.data["volume"]
+
+    @property
+    def strengths(self) -> "np.ndarray":
+        """Zone strengths"""
+        return self.data["strength"]
+
+    @property
+    def zone_types(self) -> "np.ndarray":
+        """Zone type codes (SUPPORT_CODE / RESISTANCE_CODE)"""
+        return self.data["zone_type"]
+
+    def __len__(self) -> int:
+        """Return the number of zones"""
+        return len(self.data)
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[Zone, "ZoneTable"]:
+        """Return a Zone for an integer index or a ZoneTable for a slice"""
+        if isinstance(key, slice):
+            return ZoneTable(self.data[key])
+        row = self.data[key]
+        return Zone(
+            price=float(row["price"]),
+            volume=int(row["volume"]),
+            zone_type=_ZONE_TYPES[row["zone_type"]],
+            strength=float(row["strength"]),
+        )
+
+    def __iter__(self) -> Iterator[Zone]:
+        """Iterate zones as Zone objects, strongest first"""
+        data = self.data
+        for price, volume, zone_type, strength in zip(
+            data["price"].tolist(), data["volume"].tolist(),
+            data["zone_type"].tolist(), data["strength"].tolist()
+        ):
+            yield Zone(price=price, volume=int(volume), zone_type=_ZONE_TYPES[zone_type], strength=strength)
+
+    def __repr__(self) -> str:
+        """Return string representation"""
+        return f"ZoneTable({len(self)} zones)"
+
+    def top(self, k: int) -> "ZoneTable":
+        """Return the k strongest zones"""
+        return ZoneTable(self.data[:k])
+
+    def supports(self) -> "ZoneTable":
+        """Return only support zones"""
+        return ZoneTable(self.data[self.data["zone_type"] == SUPPORT_CODE])
+
+    def resistances(self) -> "ZoneTable":
+        """Return only resistance zones"""
+        return ZoneTable(self.data[self.data["zone_type"] == RESISTANCE_CODE])
+
+    def to_zones(self) -> List[Zone]:
+        """Materialize every row as a Zone object"""
+        return list(self)
+
+
+class UniverseZones:
+    """Zones of many symbols in one columnar table
+
+    All zones live in a single ZoneTable grouped by symbol (strongest first
+    within each symbol); offsets[i]:offsets[i + 1] is the slice belonging
+    to symbols[i]. Per-symbol summary columns are aligned with symbols.
+    """
+
+    def __init__(
+        self,
+        symbols: "np.ndarray",
+        zones: ZoneTable,
+        offsets: "np.ndarray",
+        current_prices: "np.ndarray",
+        nearest_support: "np.ndarray",
+        nearest_resistance: "np.ndarray"
+    ):
+        """Wrap precomputed columns (see SupplyDemandAnalyzer.analyze_universe)"""
+        self.symbols = symbols
+        self.zones = zones
+        self.offsets = offsets
+        self.current_prices = current_prices
+        self.nearest_support = nearest_support
+        self.nearest_resistance = nearest_resistance
+
+    @property
+    def zone_counts(self) -> "np.ndarray":
+        """Number of zones per symbol"""
+        return np.diff(self.offsets)
+
+    @property
+    def symbol_rows(self) -> "np.ndarray":
+        """Symbol row of every zone in the combined table"""
+        return np.repeat(np.arange(len(self.symbols)), self.zone_counts)
+
+    def __len__(self) -> int:
+        """Return the number of symbols"""
+        return len(self.symbols)
+
+    def __repr__(self) -> str:
+        return f"UniverseZones({len(self.symbols)} symbols, {len(self.zones)} zones)"
+
+    def row_of(self, symbol: Any) -> int:
+        """Return the row of a symbol label"""
+        matches = np.flatnonzero(self.symbols == symbol)
+        if len(matches) == 0:
+            raise KeyError(f"Unknown symbol: {symbol}")
+        return int(matches[0])
+
+    def zones_for(self, symbol: Any) -> ZoneTable:
+        """Zones of one symbol, strongest first
+
+        Args:
+            symbol: Symbol label (or row number when labels are row numbers)
+        """
+        row = self.row_of(symbol)
+        return ZoneTable(self.zones.data[self.offsets[row]:self.offsets[row + 1]])
+
+
+class ZoneIndex:
+    """Price-sorted index over a set of zones
+
+    Support and resistance prices are kept in sorted arrays so nearest-level
+    lookups are a bisect (O(log n)) and a batch of prices is answered with
+    one np.searchsorted. Breakout checks reproduce detect_breakout: the
+    first zone in table order that the price has crossed wins.
+    """
+
+    def __init__(self, zones: Union[ZoneTable, List[Zone]]):
+        """Build the index
+
+        Args:
+            zones: ZoneTable or list of zones (order defines breakout priority)
+        """
+        if not HAS_NUMPY:
+            raise ImportError("NumPy is required for ZoneIndex")
+        self.table = zones if isinstance(zones, ZoneTable) else ZoneTable.from_zones(list(zones))
+
+        prices = self.table.prices
+        types = self.table.zone_types
+        support_rows = np.flatnonzero(types == SUPPORT_CODE)
+        resistance_rows = np.flatnonzero(types == RESISTANCE_CODE)
+
+        # Stable sorts keep table order among equal prices
+        self._support_rows = support_rows[np.argsort(prices[support_rows], kind="stable")]
+        self._resistance_rows = resistance_rows[np.argsort(prices[resistance_rows], kind="stable")]
+        self._support_prices = prices[self._support_rows]
+        self._resistance_prices = prices[self._resistance_rows]
+        self._support_list = self._support_prices.tolist()
+        self._resistance_list = self._resistance_prices.tolist()
+
+        # Earliest table row among resistances below a price (prefix) and
+        # supports above a price (suffix), for breakout priority
+        self._resistance_first_row = np.minimum.accumulate(self._resistance_rows) \
+            if len(self._resistance_rows) else self._resistance_rows
+        self._support_first_row = np.minimum.accumulate(self._support_rows[::-1])[::-1] \
+            if len(self._support_rows) else self._support_rows
+
+    def __len__(self) -> int:
+        """Return the number of indexed zones"""
+        return len(self.table)
+
+    def nearest_support(self, current_price: float) -> Optional[Zone]:
+        """Find the highest support zone below current_price"""
+        pos = bisect_left(self._support_list, current_price) - 1
+        if pos < 0:
+            return None
+        # Among equal prices, return the first in table order as max() would
+        pos = bisect_left(self._support_list, self._support_list[pos])
+        return self.table[int(self._support_rows[pos])]
+
+    def nearest_resistance(self, current_price: float) -> Optional[Zone]:
+        """Find the lowest resistance zone above current_price"""
+        pos = bisect_right(self._resistance_list, current_price)
+        if pos >= len(self._resistance_list):
+            return None
+        return self.table[int(self._resistance_rows[pos])]
+
+    def nearest_levels(self, current_prices: Any) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Nearest support and resistance prices for many current prices
+
+        Args:
+            current_prices: Array of prices
+
+        Returns:
+            (support_prices, resistance_prices), NaN where none exists
+        """
+        current = np.asarray(current_prices, dtype=np.float64)
+        below = np.searchsorted(self._support_prices, current, side="left") - 1
+        above = np.searchsorted(self._resistance_prices, current, side="right")
+
+        supports = np.full(current.shape, np.nan)
+        has_support = below >= 0
+        supports[has_support] = self._support_prices[below[has_support]]
+
+        resistances = np.full(current.shape, np.nan)
+        has_resistance = above < len(self._resistance_prices)
+        resistances[has_resistance] = self._resistance_prices[above[has_resistance]]
+        return supports, resistances
+
+    def crossings(self, previous_price: float, current_price: float) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Zones crossed by a move from previous_price to current_price
+
+        A resistance is crossed upward when previous_price <= price <
+        current_price, a support downward when current_price < price <=
+        previous_price, matching detect_breakout's strict comparisons.
+
+        Returns:
+            (bullish_rows, bearish_rows) table rows, nearest zone first
+        """
+        if current_price > previous_price:
+            lo = bisect_left(self._resistance_list, previous_price)
+            hi = bisect_left(self._resistance_list, current_price)
+            return self._resistance_rows[lo:hi], self._support_rows[:0]
+        lo = bisect_right(self._support_list, current_price)
+        hi = bisect_right(self._support_list, previous_price)
+        return self._resistance_rows[:0], self._support_rows[lo:hi][::-1]
+
+    def detect_breakouts(
+        self,
+        current_prices: Any,
+        current_volumes: Any,
+        average_volume: Any
+    ) -> "np.ndarray":
+        """Check many prices for breakouts in one vectorized call
+
+        Args:
+            current_prices: Array of prices
+            current_volumes: Volume per price
+            average_volume: Average volume (scalar or per price)
+
+        Returns:
+            Structured array with BREAKOUT_DTYPE fields; direction is
+            NO_BREAKOUT_CODE and zone_row -1 where nothing was crossed
+        """
+        current = np.asarray(current_prices, dtype=np.float64)
+        volumes = np.asarray(current_volumes, dtype=np.float64)
+        no_row = len(self.table)
+
+        # Resistances strictly below the price form a prefix of the sorted array
+        n_below = np.searchsorted(self._resistance_prices, current, side="left")
+        bullish_row = np.full(current.shape, no_row, dtype=np.int64)
+        crossed = n_below > 0
+        bullish_row[crossed] = self._resistance_first_row[n_below[crossed] - 1]
+
+        # Supports strictly above the price form a suffix
+        start_above = np.searchsorted(self._support_prices, current, side="right")
+        bearish_row = np.full(current.shape, no_row, dtype=np.int64)
+        crossed = start_above < len(self._support_prices)
+        bearish_row[crossed] = self._support_first_row[start_above[crossed]]
+
+        row = np.minimum(bullish_row, bearish_row)
+        hit = row < no_row
+
+        result = np.zeros(current.shape, dtype=BREAKOUT_DTYPE)
+        result["price"] = current
+        result["direction"] = np.where(
+            ~hit, NO_BREAKOUT_CODE, np.where(bullish_row <= bearish_row, BULLISH_CODE, BEARISH_CODE)
+        )
+        result["zone_row"] = np.where(hit, row, -1)
+        result["zone_price"] = np.nan
+        result["zone_price"][hit] = self.table.prices[row[hit]]
+        threshold = np.asarray(average_volume, dtype=np.float64) * BREAKOUT_VOLUME_SURGE_MULTIPLIER
+        result["is_confirmed"] = hit & (volumes >= threshold)
+        return result
+
+    def detect_breakout(
+        self,
+        current_price: float,
+        current_volume: int,
+        average_volume: int,
+        timestamp: Optional[datetime] = None
+    ) -> Optional[BreakoutEvent]:
+        """Single-price breakout check returning a BreakoutEvent like the analyzer"""
+        row = self.detect_breakouts([current_price], [current_volume], average_volume)[0]
+        if row["direction"] == NO_BREAKOUT_CODE:
+            return None
+        return BreakoutEvent(
+            direction="bullish" if row["direction"] == BULLISH_CODE else "bearish",
+            price=current_price,
+            zone=self.table[int(row["zone_row"])],
+            volume=current_volume,
+            is_confirmed=bool(row["is_confirmed"]),
+            timestamp=timestamp
+        )
@@ -6,7 +6,8 @@ Includes psychology analysis for emotional trading detection.
 """
 
 from .analyzer import TradeJournalAnalyzer
-from .models import JournalEntry, TradePattern, BiasAlert, TradeStatus
+from .streaming import StreamingBiasDetector
+from .models import JournalEntry, FrozenJournalEntry, TradePattern, BiasAlert, TradeStatus
 from .psychology_analyzer import (
     TradingPsychologyAnalyzer,
     EmotionType,
@@ -20,7 +21,9 @@ from .psychology_analyzer import (
 
 __all__ = [
     "TradeJournalAnalyzer",
+    "StreamingBiasDetector",
     "JournalEntry",
+    "FrozenJournalEntry",
     "TradePattern",
     "BiasAlert",
     "TradeStatus",
@@ -0,0 +1,191 @@
+"""
+Journal Aggregates
+
+Running totals that TradeJournalAnalyzer updates on every added entry:
+closed and winning trade counts plus trade counts and profit sums per
+hour, symbol, signal type and indicator. Win rate is then O(1) and
+per-group reports cost O(groups) instead of a pass over the journal.
+"""
+
+from typing import Any, Dict, Mapping, Sequence, Tuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# Grouping dimensions, in the order add() takes their keys
+DIMENSIONS = ("hour", "symbol", "signal_type", "indicator")
+
+# Per-group running totals, in the shape the pattern builders consume
+GroupStats = Dict[str, Any]
+
+
+def _new_group() -> GroupStats:
+    return {"trades": 0, "wins": 0, "total_profit": 0.0, "total_profit_percent": 0.0}
+
+
+def closed_group_sums(
+    keys: "np.ndarray",
+    n_groups: int,
+    closed: "np.ndarray",
+    profits: "np.ndarray",
+    profit_percents: "np.ndarray"
+) -> Dict[str, "np.ndarray"]:
+    """Trade/win counts and profit sums per group code over closed entries
+
+    Each entry's code is combined with its closed/win flags into one key,
+    so three bincounts cover every measure without filtering (and copying)
+    the columns.
+
+    Args:
+        keys: Group code (0 .. n_groups - 1) per entry
+        n_groups: Number of possible codes
+        closed: Boolean closed flag per entry
+        profits: Profit per entry
+        profit_percents: Profit percent per entry
+
+    Returns:
+        Arrays "trades", "wins", "total_profit", "total_profit_percent"
+        indexed by code
+    """
+    flags = closed.view(np.int8) * 2 + (profits > 0)
+    combined = keys.astype(np.intp) * 4 + flags
+    size = 4 * n_groups
+    counts = np.bincount(combined, minlength=size).reshape(n_groups, 4)
+    profit_sums = np.bincount(combined, weights=profits, minlength=size).reshape(n_groups, 4)
+    percent_sums = np.bincount(combined, weights=profit_percents, minlength=size).reshape(n_groups, 4)
+    # Flag columns 2 and 3 are the closed entries (losing, winning)
+    return {
+        "trades": counts[:, 2] + counts[:, 3],
+        "wins": counts[:, 3],
+        "total_profit": profit_sums[:, 2] + profit_sums[:, 3],
+        "total_profit_percent": percent_sums[:, 2] + percent_sums[:, 3],
+    }
+
+
+class JournalAggregates:
+    """Incrementally maintained journal totals
+
+    One group table per dimension in DIMENSIONS (hour of day, symbol,
+    signal type, indicator), all updated by the same add() call, so every
+    per-dimension report reads the journal zero times. Only closed trades
+    are counted, matching calculate_win_rate and the pattern analyses.
+    Groups appear in order of their first closed trade.
+    """
+
+    def __init__(self):
+        self.closed = 0
+        self.wins = 0
+        self.groups: Dict[str, Dict[Any, GroupStats]] = {dimension: {} for dimension in DIMENSIONS}
+
+    @property
+    def by_hour(self) -> Dict[int, GroupStats]:
+        return self.groups["hour"]
+
+    @property
+    def by_symbol(self) -> Dict[str, GroupStats]:
+        return self.groups["symbol"]
+
+    @property
+    def win_rate(self) -> float:
+        """Win rate of closed trades as a percentage (0-100)"""
+        return self.wins / self.closed * 100 if self.closed else 0.0
+
+    def to_state(self) -> Dict[str, Any]:
+        """Totals as JSON-serializable data (groups as [key, stats] pairs, in order)"""
+        return {
+            "closed": self.closed,
+            "wins": self.wins,
+            "groups": {
+                dimension: [[key, dict(stats)] for key, stats in groups.items()]
+                for dimension, groups in self.groups.items()
+            },
+        }
+
+    @classmethod
+    def from_state(cls, state: Mapping[str, Any]) -> "JournalAggregates":
+        """Rebuild aggregates from to_state() output"""
+        aggregates = cls()
+        aggregates.closed = state["closed"]
+        aggregates.wins = state["wins"]
+        for dimension in DIMENSIONS:
+            aggregates.groups[dimension] = {key: dict(stats) for key, stats in state["groups"][dimension]}
+        return aggregates
+
+    def add(self, keys: Sequence[Any], is_closed: bool, profit: float, profit_percent: float) -> None:
+        """Fold one entry into every dimension in O(len(DIMENSIONS))
+
+        Args:
+            keys: The entry's group key per dimension, in DIMENSIONS order
+            is_closed: Whether the trade is closed
+            profit: Profit of the trade
+            profit_percent: Profit percent of the trade
+        """
+        if not is_closed:
+            return
+        # NumPy/pandas scalars would leak np.int64/np.float64 into to_state()
+        profit = float(profit)
+        profit_percent = float(profit_percent)
+        win = bool(profit > 0)
+        self.closed += 1
+        self.wins += win
+        for groups, key in zip(self.groups.values(), keys):
+            stats = groups.get(key)
+            if stats is None:
+                stats = groups[key] = _new_group()
+            stats["trades"] += 1
+            stats["wins"] += win
+            stats["total_profit"] += profit
+            stats["total_profit_percent"] += profit_percent
+
+    def add_columns(
+        self,
+        keys: Mapping[str, Tuple["np.ndarray", Sequence[Any]]],
+        closed: "np.ndarray",
+        profits: "np.ndarray",
+        profit_percents: "np.ndarray"
+    ) -> None:
+        """Fold a batch of entries in with one vectorized group-by per dimension
+
+        Args:
+            keys: Per dimension, (code per entry, label per code)
+            closed: Boolean closed flag per entry
+            profits: Profit per entry
+            profit_percents: Profit percent per entry
+        """
+        if not HAS_NUMPY:
+            raise ImportError("NumPy is required for JournalAggregates.add_columns")
+        if len(closed) == 0:
+            return
+        self.closed += int(np.count_nonzero(closed))
+        self.wins += int(np.count_nonzero(closed & (profits > 0)))
+
+        for dimension in DIMENSIONS:
+            codes, labels = keys[dimension]
+            sums = closed_group_sums(codes, len(labels), closed, profits, profit_percents)
+            self._merge(self.groups[dimension], sums, codes[closed], labels)
+
+    @staticmethod
+    def _merge(
+        groups: Dict[Any, GroupStats],
+        sums: Dict[str, "np.ndarray"],
+        closed_keys: "np.ndarray",
+        labels: Sequence[Any]
+    ) -> None:
+        """Add per-code sums into groups, new groups in first-appearance order"""
+        present = np.flatnonzero(sums["trades"])
+        if len(present) > 1:
+            first_seen = np.full(len(sums["trades"]), len(closed_keys))
+            np.minimum.at(first_seen, closed_keys, np.arange(len(closed_keys)))
+            present = present[np.argsort(first_seen[present], kind="stable")]
+        # tolist() hands back Python ints/floats, keeping to_state() JSON-encodable
+        columns = {name: values[present].tolist() for name, values in sums.items()}
+        for i, code in enumerate(present.tolist()):
+            key = labels[code]
+            stats = groups.get(key)
+            if stats is None:
+                stats = groups[key] = _new_group()
+            for name in ("trades", "wins", "total_profit", "total_profit_percent"):
+                stats[name] += columns[name][i]
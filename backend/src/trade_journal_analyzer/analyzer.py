@@ -2,13 +2,50 @@
 Trade Journal Analyzer
 
 Analyzes trading journals to extract patterns and detect biases.
+With NumPy, entries are kept in a columnar JournalStore; otherwise a
+plain list of entries is used. Win rate and per-hour, per-symbol,
+per-signal and per-indicator totals are maintained incrementally as
+entries arrive, so pattern extraction reads those totals instead of
+passing over the journal once per dimension. Historical journals are
+loaded in vectorized chunks through the add_entries / load_from_* APIs.
+Analyses accept start / end / symbols filters, answered from a
+timestamp index and per-symbol posting lists in time proportional to
+the number of matching entries. TradeJournalAnalyzer.open persists the
+journal to an append-only JournalLog and warm-starts from its segments
+and aggregate snapshot.
 """
 
+import bisect
 import logging
-from datetime import timedelta
-from typing import List, Dict, Any
-from collections import defaultdict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Dict, Any, FrozenSet, Iterable, Iterator, Mapping, Optional, Union
 from .models import JournalEntry, TradePattern, BiasAlert
+from .aggregates import JournalAggregates
+from .memo import VersionedCache
+from .ingest import (
+    DEFAULT_INGEST_CHUNK_SIZE,
+    Columns,
+    arrow_to_columns,
+    chunked,
+    csv_to_columns,
+    entries_to_columns,
+    entry_from_record,
+    read_csv_records,
+    records_to_columns,
+)
+
+try:
+    import numpy as np
+    from .store import (
+        JournalStore, CLOSED_CODE, NS_PER_DAY, NS_PER_HOUR, NS_PER_MICROSECOND, NS_PER_SECOND, datetime_to_ns
+    )
+    from .timeline import LossScan, loss_runs, scan_loss_runs
+    from .cube import CUBE_DIMENSIONS, WEEKDAYS, mine_cube
+    from .journal_log import JournalLog
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -19,6 +56,16 @@ OVERTRADING_MAX_TIME_SPAN_DAYS = 1
 OVERTRADING_THRESHOLD_TRADES_PER_DAY = 20
 LOSS_SEQUENCE_TIME_WINDOW_SECONDS = 1800  # 30 minutes
 LOSS_SEQUENCE_MIN_LENGTH = 2
+OVERTRADING_RECOMMENDATIONS = (
+    "Reduce trading frequency",
+    "Focus on quality over quantity",
+    "Take breaks between trades",
+)
+CHASING_LOSSES_RECOMMENDATIONS = (
+    "Stop trading after a loss",
+    "Take a break to reset emotions",
+    "Review your strategy before re-entering",
+)
 
 # Constants for pattern analysis
 DEFAULT_MIN_TRADES_FOR_PATTERN = 3
@@ -28,17 +75,116 @@ MEDIUM_WIN_RATE_THRESHOLD = 60
 MIN_CONFIDENCE_FOR_RECOMMENDATION = 0.5
 MAX_CONFIDENCE_TRADE_DIVISOR = 10
 SECONDS_PER_DAY = 86400
+HOURS = tuple(range(24))
+EPOCH_WEEKDAY = 3  # 1970-01-01 was a Thursday
+DEFAULT_MAX_PATTERN_DIMENSIONS = 2
+
+
+def _unfiltered(start: Optional[datetime], end: Optional[datetime], symbols: Optional[Iterable[str]]) -> bool:
+    """Whether no start / end / symbols filter was given"""
+    return start is None and end is None and symbols is None
+
+
+def _symbol_set(symbols: Iterable[str]) -> FrozenSet[str]:
+    """Symbols filter as a set (a single symbol string is accepted too)"""
+    return frozenset([symbols] if isinstance(symbols, str) else symbols)
 
 
 class TradeJournalAnalyzer:
     """Analyzes trading journals for patterns and biases"""
 
-    def __init__(self):
-        """Initialize an empty analyzer"""
+    def __init__(self, columnar: Optional[bool] = None):
+        """Initialize an empty analyzer
+
+        Args:
+            columnar: Store entries in NumPy columns (default: when NumPy
+                is installed) instead of a list of JournalEntry objects
+        """
+        if columnar is None:
+            columnar = HAS_NUMPY
+        if columnar and not HAS_NUMPY:
+            raise ImportError("NumPy is required for the columnar journal store")
+        self.columnar = columnar
         self._entries: List[JournalEntry] = []
-        self._patterns_cache: Dict[str, List[TradePattern]] = {}
-        self._cache_timestamp: float = 0
+        # List backend only: entry timestamps in order, and the matching list positions
+        self._sorted_times: List[datetime] = []
+        self._time_order: List[int] = []
+        self._symbol_positions: Dict[str, List[int]] = {}
+        self._store: Optional["JournalStore"] = JournalStore() if columnar else None
+        self._aggregates = JournalAggregates()
+        self._patterns_cache = VersionedCache()
         self._entries_version: int = 0
+        self._loss_scan = LossScan() if columnar else None
+        self._log: Optional["JournalLog"] = None
+
+    @classmethod
+    def open(cls, path: Union[str, Path], **log_options: int) -> "TradeJournalAnalyzer":
+        """Open a persistent analyzer backed by a JournalLog directory
+
+        Stored rows are copied from the memory-mapped segments into the
+        columnar store, and the aggregates are restored from the latest
+        snapshot plus one vectorized pass over the rows written after it,
+        so nothing is replayed through add_entry. Entries added afterwards
+        are appended to the log (fsynced every sync_rows rows), and a new
+        snapshot is written every snapshot_rows committed rows and on
+        close().
+
+        Args:
+            path: Journal directory (created if missing)
+            **log_options: sync_rows, segment_rows and snapshot_rows for
+                the JournalLog
+
+        Returns:
+            Analyzer holding every committed row of the journal
+        """
+        if not HAS_NUMPY:
+            raise ImportError("NumPy is required for TradeJournalAnalyzer.open")
+        log = JournalLog(path, **log_options)
+        analyzer = cls(columnar=True)
+        analyzer._restore(log)
+        analyzer._log = log
+        return analyzer
+
+    def _restore(self, log: "JournalLog") -> None:
+        """Load a log's segments and aggregate snapshot into an empty analyzer"""
+        store = self._store
+        # Prime the store dictionaries so the stored codes can be used as-is
+        store.symbols.encode_many(log.dictionaries["symbol"].values)
+        store.signal_types.encode_many(log.dictionaries["signal_type"].values)
+        store.indicators.encode_many(log.dictionaries["indicator"].values)
+        for columns in log.segments():
+            store.extend(columns)
+
+        covered = 0
+        snapshot = log.read_snapshot()
+        if snapshot is not None:
+            covered, state = snapshot
+            self._aggregates = JournalAggregates.from_state(state)
+        self._aggregate_rows(covered)
+        self._finish_batch(len(store))
+
+    def flush(self) -> None:
+        """Make every added entry durable (no-op without a journal log)"""
+        if self._log is not None:
+            self._log.flush()
+
+    def close(self) -> None:
+        """Flush the journal log and snapshot the aggregates"""
+        if self._log is not None:
+            self._log.write_snapshot(self._aggregates.to_state())
+            self._log.close()
+            self._log = None
+
+    def __enter__(self) -> "TradeJournalAnalyzer":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _checkpoint(self) -> None:
+        """Snapshot the aggregates once enough rows were committed since the last one"""
+        if self._log.snapshot_due:
+            self._log.write_snapshot(self._aggregates.to_state())
 
     def add_entry(self, entry: JournalEntry) -> None:
         """Add a journal entry
@@ -46,39 +192,311 @@ class TradeJournalAnalyzer:
         Args:
             entry: Journal entry to add
         """
-        logger.debug(f"Adding journal entry: {entry.id}")
-        self._entries.append(entry)
+        logger.debug("Adding journal entry: %s", entry.id)
+        if self._store is not None:
+            self._store.append(entry)
+        else:
+            self._append_entry(entry)
+        self._aggregate(entry)
         self._entries_version += 1
+        if self._log is not None:
+            self._log.append(entry)
+            self._checkpoint()
+
+    def add_entries(
+        self, entries: Iterable[JournalEntry], chunk_size: int = DEFAULT_INGEST_CHUNK_SIZE
+    ) -> int:
+        """Add many journal entries at once
 
-    def calculate_win_rate(self) -> float:
-        """Calculate overall win rate
+        Entries are converted to columns chunk by chunk and appended to the
+        store with one array write per column, and the pattern cache is
+        invalidated once for the whole batch.
+
+        Args:
+            entries: Journal entries to add
+            chunk_size: Entries converted per vectorized chunk
 
         Returns:
-            Win rate as percentage (0-100)
+            Number of entries added
+        """
+        if self._store is None:
+            return self._append_batch(entries)
+        return self._ingest(entries_to_columns(chunk) for chunk in chunked(entries, chunk_size))
+
+    def load_from_records(
+        self, records: Iterable[Mapping[str, Any]], chunk_size: int = DEFAULT_INGEST_CHUNK_SIZE
+    ) -> int:
+        """Add entries from records such as dicts or CSV rows
+
+        Records use the JournalEntry field names ("notes" is optional).
+        Timestamps may be datetimes or ISO 8601 strings, numbers may be
+        strings and status may be a TradeStatus or its value ("CLOSED").
+
+        Args:
+            records: Mappings with one journal entry each
+            chunk_size: Records converted per vectorized chunk
+
+        Returns:
+            Number of entries added
+        """
+        if self._store is None:
+            return self._append_batch(entry_from_record(record) for record in records)
+        return self._ingest(records_to_columns(chunk) for chunk in chunked(records, chunk_size))
+
+    def load_from_csv(self, path: str, chunk_size: int = DEFAULT_INGEST_CHUNK_SIZE) -> int:
+        """Add entries from a CSV file whose header row names the fields
+
+        Args:
+            path: CSV file path
+            chunk_size: Rows converted per vectorized chunk
+
+        Returns:
+            Number of entries added
+        """
+        if self._store is None:
+            return self.load_from_records(read_csv_records(path), chunk_size)
+        return self._ingest(csv_to_columns(path, chunk_size))
+
+    def load_from_arrow(self, table: Any, chunk_size: int = DEFAULT_INGEST_CHUNK_SIZE) -> int:
+        """Add entries from a pyarrow Table or RecordBatch
+
+        Requires pyarrow. Columns are converted batch by batch without
+        building a Python object per row (except for the string columns).
+
+        Args:
+            table: Table or RecordBatch with the JournalEntry column names
+            chunk_size: Rows per converted batch
+
+        Returns:
+            Number of entries added
+        """
+        if self._store is None:
+            return self.load_from_records(table.to_pylist(), chunk_size)
+        return self._ingest(arrow_to_columns(table, chunk_size))
+
+    def _append_batch(self, entries: Iterable[JournalEntry]) -> int:
+        """Append entries to the list backend, invalidating caches once"""
+        count = len(self._entries)
+        try:
+            for entry in entries:
+                self._append_entry(entry)
+                self._aggregate(entry)
+        finally:
+            added = len(self._entries) - count
+            self._finish_batch(added)
+        return added
+
+    def _ingest(self, batches: Iterator[Columns]) -> int:
+        """Append column batches to the store, invalidating caches once"""
+        store = self._store
+        count = len(store)
+        try:
+            for columns in batches:
+                start = store.extend(columns)
+                self._aggregate_rows(start)
+                if self._log is not None:
+                    self._log.append_columns(columns)
+        finally:
+            added = len(store) - count
+            self._finish_batch(added)
+        if self._log is not None:
+            self._checkpoint()
+        return added
+
+    def _aggregate_rows(self, start: int) -> None:
+        """Fold store rows from start onwards into the running totals"""
+        store = self._store
+        self._aggregates.add_columns(
+            {
+                "hour": (store.local_timestamps[start:] // NS_PER_HOUR % 24, HOURS),
+                "symbol": (store.symbol_codes[start:], store.symbols.values),
+                "signal_type": (store.signal_codes[start:], store.signal_types.values),
+                "indicator": (store.indicator_codes[start:], store.indicators.values),
+            },
+            store.statuses[start:] == CLOSED_CODE,
+            store.profits[start:],
+            store.profit_percents[start:],
+        )
+
+    def _append_entry(self, entry: JournalEntry) -> None:
+        """Append to the list backend, keeping the time order (insort for late arrivals)"""
+        position = len(self._entries)
+        self._entries.append(entry)
+        self._symbol_positions.setdefault(entry.symbol, []).append(position)
+        times = self._sorted_times
+        if not times or entry.timestamp >= times[-1]:
+            times.append(entry.timestamp)
+            self._time_order.append(position)
+        else:
+            slot = bisect.bisect_right(times, entry.timestamp)
+            times.insert(slot, entry.timestamp)
+            self._time_order.insert(slot, position)
+
+    def _aggregate(self, entry: JournalEntry) -> None:
+        """Fold one entry into the running totals of every dimension"""
+        self._aggregates.add(
+            (entry.timestamp.hour, entry.symbol, entry.signal_type, entry.indicator),
+            entry.is_closed, entry.profit, entry.profit_percent
+        )
+
+    def _finish_batch(self, added: int) -> None:
+        """Bump the entries version once for a bulk load"""
+        if added:
+            self._entries_version += 1
+            logger.debug("Loaded %d journal entries", added)
+
+    def __len__(self) -> int:
+        """Return the number of journal entries"""
+        return len(self._store) if self._store is not None else len(self._entries)
+
+    def get_entries(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        symbols: Optional[Iterable[str]] = None
+    ) -> List[JournalEntry]:
+        """Return entries in insertion order (materialized from columns)
+
+        Args:
+            start: Only entries at or after this time
+            end: Only entries before this time
+            symbols: Only entries for these symbols
+
+        Returns:
+            Matching entries
+        """
+        if self._store is not None:
+            if _unfiltered(start, end, symbols):
+                return self._store.entries(range(len(self._store)))
+            return self._store.entries(self._select_rows(start, end, symbols))
+        if _unfiltered(start, end, symbols):
+            return list(self._entries)
+        return [self._entries[position] for position in self._select_positions(start, end, symbols)]
+
+    def _select_rows(
+        self, start: Optional[datetime], end: Optional[datetime], symbols: Optional[Iterable[str]]
+    ) -> "np.ndarray":
+        """Store rows matching the filters, in insertion order
+
+        Reads whichever index gives fewer candidates (the time range of
+        the timestamp index or the symbols' posting lists) and checks the
+        other filter on those candidates only.
+        """
+        store = self._store
+        index = store.time_index
+        start_ns = None if start is None else datetime_to_ns(start)
+        end_ns = None if end is None else datetime_to_ns(end)
+        lo, hi = index.between(start_ns, end_ns)
+        if symbols is None:
+            return np.sort(index.rows[lo:hi])
+
+        codes = [code for code in map(store.symbols.code_of, _symbol_set(symbols)) if code >= 0]
+        posted = store.symbol_rows.rows_for(codes)
+        if start is None and end is None:
+            return posted
+        if len(posted) <= hi - lo:
+            times = store.timestamps[posted]
+            in_range = np.ones(len(posted), dtype=bool)
+            if start_ns is not None:
+                in_range &= times >= start_ns
+            if end_ns is not None:
+                in_range &= times < end_ns
+            return posted[in_range]
+        rows = np.sort(index.rows[lo:hi])
+        return rows[np.isin(store.symbol_codes[rows], codes)]
+
+    def _select_positions(
+        self, start: Optional[datetime], end: Optional[datetime], symbols: Optional[Iterable[str]]
+    ) -> List[int]:
+        """List backend counterpart of _select_rows"""
+        lo = 0 if start is None else bisect.bisect_left(self._sorted_times, start)
+        hi = len(self._sorted_times) if end is None else bisect.bisect_left(self._sorted_times, end)
+        hi = max(lo, hi)
+        if symbols is None:
+            return sorted(self._time_order[lo:hi])
+
+        wanted = _symbol_set(symbols)
+        posted = [position for symbol in wanted for position in self._symbol_positions.get(symbol, ())]
+        if start is None and end is None:
+            return sorted(posted)
+        if len(posted) <= hi - lo:
+            return sorted(
+                position for position in posted
+                if (start is None or self._entries[position].timestamp >= start)
+                and (end is None or self._entries[position].timestamp < end)
+            )
+        return sorted(position for position in self._time_order[lo:hi] if self._entries[position].symbol in wanted)
+
+    def _scope(
+        self, start: Optional[datetime], end: Optional[datetime], symbols: Optional[Iterable[str]]
+    ) -> "TradeJournalAnalyzer":
+        """Analyzer over the entries matching the filters
+
+        Built from the secondary indexes in time proportional to the number
+        of matching entries, and cached until the journal changes so that
+        repeated scoped reports also reuse the scope's own caches.
         """
-        closed_trades = [e for e in self._entries if e.is_closed]
+        symbol_key = None if symbols is None else _symbol_set(symbols)
+
+        def build() -> "TradeJournalAnalyzer":
+            scoped = TradeJournalAnalyzer(columnar=self.columnar)
+            if self._store is not None:
+                rows = self._select_rows(start, end, symbol_key)
+                if len(rows):
+                    scoped._ingest(iter([self._store.take(rows)]))
+            else:
+                scoped._append_batch(self._entries[p] for p in self._select_positions(start, end, symbol_key))
+            return scoped
+
+        return self._patterns_cache.get_or_compute(("scope", start, end, symbol_key), self._entries_version, build)
 
-        if not closed_trades:
-            return 0.0
+    def calculate_win_rate(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        symbols: Optional[Iterable[str]] = None
+    ) -> float:
+        """Calculate overall win rate from the running totals in O(1)
 
-        winners = [e for e in closed_trades if e.is_profitable]
-        return (len(winners) / len(closed_trades)) * 100
+        Args:
+            start: Only entries at or after this time
+            end: Only entries before this time
+            symbols: Only entries for these symbols
 
-    def detect_biases(self) -> List[BiasAlert]:
+        Returns:
+            Win rate as percentage (0-100)
+        """
+        if not _unfiltered(start, end, symbols):
+            return self._scope(start, end, symbols).calculate_win_rate()
+        return self._aggregates.win_rate
+
+    def detect_biases(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        symbols: Optional[Iterable[str]] = None
+    ) -> List[BiasAlert]:
         """Detect psychological biases in trading behavior
 
+        Args:
+            start: Only entries at or after this time
+            end: Only entries before this time
+            symbols: Only entries for these symbols
+
         Returns:
             List of bias alerts
         """
-        logger.info(f"Analyzing {len(self._entries)} entries for biases")
+        if not _unfiltered(start, end, symbols):
+            return self._scope(start, end, symbols).detect_biases()
+        logger.info("Analyzing %d entries for biases", len(self))
         alerts = []
 
         # Detect overtrading (too many trades in short period)
-        if len(self._entries) >= OVERTRADING_MIN_ENTRIES:
+        if len(self) >= OVERTRADING_MIN_ENTRIES:
             # Check if entries are clustered in time
             time_span = self._get_time_span()
             if time_span and time_span < timedelta(days=OVERTRADING_MAX_TIME_SPAN_DAYS):
-                trades_per_day = len(self._entries) / max(
+                trades_per_day = len(self) / max(
                     time_span.total_seconds() / SECONDS_PER_DAY, 1
                 )
                 if trades_per_day > OVERTRADING_THRESHOLD_TRADES_PER_DAY:
@@ -86,114 +504,214 @@ class TradeJournalAnalyzer:
                         BiasAlert(
                             bias_type="overtrading",
                             severity="high",
-                            message=f"Overtrading detected: {len(self._entries)} trades in {time_span.days + 1} days",
-                            recommendations=[
-                                "Reduce trading frequency",
-                                "Focus on quality over quantity",
-                                "Take breaks between trades",
-                            ],
+                            message=f"Overtrading detected: {len(self)} trades in {time_span.days + 1} days",
+                            recommendations=list(OVERTRADING_RECOMMENDATIONS),
                         )
                     )
 
         # Detect chasing losses (quick re-entries after losses)
-        loss_sequences = self._find_loss_sequences()
-        if loss_sequences:
+        loss_sequence_count = self._count_loss_sequences()
+        if loss_sequence_count:
             alerts.append(
                 BiasAlert(
                     bias_type="chasing_losses",
                     severity="medium",
-                    message=f"Chasing losses detected: {len(loss_sequences)} instances",
-                    recommendations=[
-                        "Stop trading after a loss",
-                        "Take a break to reset emotions",
-                        "Review your strategy before re-entering",
-                    ],
+                    message=f"Chasing losses detected: {loss_sequence_count} instances",
+                    recommendations=list(CHASING_LOSSES_RECOMMENDATIONS),
                 )
             )
 
         return alerts
 
     def extract_patterns(
-        self, min_trades: int = DEFAULT_MIN_TRADES_FOR_PATTERN
+        self,
+        min_trades: int = DEFAULT_MIN_TRADES_FOR_PATTERN,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        symbols: Optional[Iterable[str]] = None
     ) -> List[TradePattern]:
         """Extract trading patterns from journal with caching
 
+        Results are cached per min_trades until the next entry is added.
+
         Args:
             min_trades: Minimum number of trades to consider a pattern
+            start: Only entries at or after this time
+            end: Only entries before this time
+            symbols: Only entries for these symbols
 
         Returns:
             List of discovered patterns
         """
-        if len(self._entries) < min_trades:
-            logger.debug(f"Not enough entries ({len(self._entries)}) for pattern detection")
+        if not _unfiltered(start, end, symbols):
+            return self._scope(start, end, symbols).extract_patterns(min_trades)
+        if len(self) < min_trades:
+            logger.debug("Not enough entries (%d) for pattern detection", len(self))
             return []
 
-        logger.info(f"Extracting patterns from {len(self._entries)} entries")
+        logger.info("Extracting patterns from %d entries", len(self))
 
-        # Check cache (valid for 60 seconds)
-        import time
+        def rank() -> List[TradePattern]:
+            # Sort by win rate
+            return sorted(self.iter_patterns(min_trades), key=lambda p: p.win_rate, reverse=True)
 
-        cache_key = f"{min_trades}_{len(self._entries)}_{self._entries_version}"
-        current_time = time.time()
+        return self._patterns_cache.get_or_compute(("all", min_trades), self._entries_version, rank)
 
-        cached = self._patterns_cache.get(cache_key)
-        if cached is not None and current_time - self._cache_timestamp < 60:
-            return cached
+    def iter_patterns(
+        self,
+        min_trades: int = DEFAULT_MIN_TRADES_FOR_PATTERN,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        symbols: Optional[Iterable[str]] = None
+    ) -> Iterator[TradePattern]:
+        """Yield patterns one analysis at a time, unranked
 
-        patterns = []
+        Time-of-day patterns come first, then symbol, then signal type and
+        indicator patterns. Each analysis is cached on its own, so a caller
+        that stops early has only paid for the analyses it consumed, and a
+        later extract_patterns call reuses them.
+
+        Args:
+            min_trades: Minimum number of trades to consider a pattern
+            start: Only entries at or after this time
+            end: Only entries before this time
+            symbols: Only entries for these symbols
+
+        Yields:
+            Discovered patterns
+        """
+        if not _unfiltered(start, end, symbols):
+            yield from self._scope(start, end, symbols).iter_patterns(min_trades)
+            return
+        if len(self) < min_trades:
+            return
+        analyses = (
+            ("time", self._analyze_time_patterns),
+            ("symbol", self._analyze_symbol_patterns),
+            ("signal", self._analyze_signal_patterns),
+        )
+        for name, analyze in analyses:
+            yield from self._patterns_cache.get_or_compute(
+                (name, min_trades), self._entries_version, lambda: analyze(min_trades)
+            )
 
-        # Analyze by time of day
-        time_patterns = self._analyze_time_patterns(min_trades)
-        patterns.extend(time_patterns)
+    def mine_patterns(
+        self,
+        min_trades: int = DEFAULT_MIN_TRADES_FOR_PATTERN,
+        max_dimensions: int = DEFAULT_MAX_PATTERN_DIMENSIONS,
+        min_win_rate: float = MIN_WIN_RATE_FOR_PATTERN,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        symbols: Optional[Iterable[str]] = None
+    ) -> List[TradePattern]:
+        """Mine winning patterns over combinations of journal dimensions
 
-        # Analyze by symbol
-        symbol_patterns = self._analyze_symbol_patterns(min_trades)
-        patterns.extend(symbol_patterns)
+        Closed trades are grouped by every combination of up to
+        max_dimensions of symbol, signal type, indicator, weekday and hour
+        (e.g. "7203 + 09:00-10" or "RSI signal + Monday"). Combinations
+        are pruned level by level on min_trades, so the work grows with the
+        number of frequent cells rather than with every possible
+        combination. Results are cached until the next entry is added.
+        Requires NumPy.
 
-        # Sort by win rate
-        patterns.sort(key=lambda p: p.win_rate, reverse=True)
+        Args:
+            min_trades: Minimum number of trades in a pattern
+            max_dimensions: Largest number of dimensions combined
+            min_win_rate: Only patterns with a higher win rate are returned
+            start: Only entries at or after this time
+            end: Only entries before this time
+            symbols: Only entries for these symbols
+
+        Returns:
+            Patterns sorted by win rate, then number of trades
+        """
+        if not HAS_NUMPY:
+            raise ImportError("NumPy is required for mine_patterns")
+        if not _unfiltered(start, end, symbols):
+            return self._scope(start, end, symbols).mine_patterns(min_trades, max_dimensions, min_win_rate)
+        return self._patterns_cache.get_or_compute(
+            ("cube", min_trades, max_dimensions, min_win_rate),
+            self._entries_version,
+            lambda: self._mine_patterns(min_trades, max_dimensions, min_win_rate),
+        )
 
-        # Cache results
-        self._patterns_cache[cache_key] = patterns
-        self._cache_timestamp = current_time
+    def _mine_patterns(self, min_trades: int, max_dimensions: int, min_win_rate: float) -> List[TradePattern]:
+        """Uncached mine_patterns"""
+        if self._store is not None:
+            store = self._store
+        else:
+            store = JournalStore()
+            if self._entries:
+                store.extend(entries_to_columns(self._entries))
+
+        closed = np.flatnonzero(store.statuses == CLOSED_CODE)
+        timestamps = store.local_timestamps[closed]
+        columns = {
+            "symbol": (store.symbol_codes[closed], store.symbols.values),
+            "signal_type": (store.signal_codes[closed], store.signal_types.values),
+            "indicator": (store.indicator_codes[closed], store.indicators.values),
+            "weekday": ((timestamps // NS_PER_DAY + EPOCH_WEEKDAY) % 7, WEEKDAYS),
+            "hour": (timestamps // NS_PER_HOUR % 24, HOURS),
+        }
+        cells = mine_cube(
+            {name: columns[name] for name in CUBE_DIMENSIONS},
+            store.profits[closed] > 0,
+            store.profit_percents[closed],
+            min_trades,
+            max_dimensions,
+        )
 
+        patterns = [
+            self._make_pattern(
+                {"trades": cell.trades, "wins": cell.wins, "total_profit_percent": cell.total_profit_percent},
+                " + ".join(self._describe_factor(name, value) for name, value in cell.factors.items()),
+                cell.factors,
+            )
+            for cell in cells
+            if cell.win_rate > min_win_rate
+        ]
+        patterns.sort(key=lambda p: (p.win_rate, p.total_trades), reverse=True)
         return patterns
 
-    def get_performance_by_symbol(self) -> Dict[str, Dict[str, Any]]:
-        """Calculate performance metrics by symbol
+    @staticmethod
+    def _describe_factor(dimension: str, value: Any) -> str:
+        """Human-readable form of one pattern factor"""
+        if dimension == "hour":
+            return f"{value:02d}:00-{(value + 1) % 24:02d}"
+        if dimension == "signal_type":
+            return f"{value} signal"
+        if dimension == "indicator":
+            return f"{value} indicator"
+        return str(value)
+
+    def get_performance_by_symbol(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        symbols: Optional[Iterable[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Calculate performance metrics by symbol in O(symbols)
+
+        Args:
+            start: Only entries at or after this time
+            end: Only entries before this time
+            symbols: Only entries for these symbols
 
         Returns:
             Dictionary mapping symbol to performance metrics
         """
-        symbol_stats: Dict[str, Dict[str, Any]] = defaultdict(
-            lambda: {"trades": [], "total_profit": 0.0, "wins": 0, "losses": 0}
-        )
-
-        for entry in self._entries:
-            if entry.is_closed:
-                stats = symbol_stats[entry.symbol]
-                stats["trades"].append(entry)
-                stats["total_profit"] += entry.profit
-                if entry.is_profitable:
-                    stats["wins"] += 1
-                else:
-                    stats["losses"] += 1
-
-        # Calculate win rates
-        result = {}
-        for symbol, stats in symbol_stats.items():
-            if stats["trades"]:
-                result[symbol] = {
-                    "total_trades": len(stats["trades"]),
-                    "total_profit": stats["total_profit"],
-                    "win_rate": (stats["wins"] / len(stats["trades"])) * 100
-                    if len(stats["trades"]) > 0
-                    else 0,
-                    "wins": stats["wins"],
-                    "losses": stats["losses"],
-                }
-
-        return result
+        if not _unfiltered(start, end, symbols):
+            return self._scope(start, end, symbols).get_performance_by_symbol()
+        return {
+            symbol: {
+                "total_trades": stats["trades"],
+                "total_profit": stats["total_profit"],
+                "win_rate": (stats["wins"] / stats["trades"]) * 100,
+                "wins": stats["wins"],
+                "losses": stats["trades"] - stats["wins"],
+            }
+            for symbol, stats in self._aggregates.by_symbol.items()
+        }
 
     def generate_recommendations(
         self, patterns: List[TradePattern]
@@ -228,12 +746,39 @@ class TradeJournalAnalyzer:
         return recommendations
 
     def _get_time_span(self) -> timedelta:
-        """Get time span of all entries"""
-        if not self._entries:
+        """Get time span of all entries in O(1) from the ends of the time order"""
+        if not len(self):
             return timedelta(0)
 
-        timestamps = [e.timestamp for e in self._entries]
-        return max(timestamps) - min(timestamps)
+        if self._store is not None:
+            index = self._store.time_index
+            return timedelta(microseconds=(index.last - index.first) // NS_PER_MICROSECOND)
+
+        return self._sorted_times[-1] - self._sorted_times[0]
+
+    def _is_loss(self, rows: "np.ndarray") -> "np.ndarray":
+        """Closed-loss flag of the given store rows"""
+        store = self._store
+        return (store.statuses[rows] == CLOSED_CODE) & (store.profits[rows] <= 0)
+
+    def _count_loss_sequences(self) -> int:
+        """Count loss sequences, scanning only entries added since the last call
+
+        With the columnar store the scan resumes where it stopped as long
+        as entries arrived in time order, so repeated bias checks on a
+        growing journal cost O(new entries).
+        """
+        if self._store is None:
+            return len(self._find_loss_sequences())
+        self._loss_scan = scan_loss_runs(
+            self._loss_scan,
+            self._store.time_index,
+            self._is_loss,
+            LOSS_SEQUENCE_TIME_WINDOW_SECONDS * NS_PER_SECOND,
+            LOSS_SEQUENCE_MIN_LENGTH,
+        )
+        scan = self._loss_scan
+        return scan.completed + (scan.run_length >= LOSS_SEQUENCE_MIN_LENGTH)
 
     def _find_loss_sequences(self) -> List[List[JournalEntry]]:
         """Find sequences of losses in quick succession
@@ -241,10 +786,21 @@ class TradeJournalAnalyzer:
         Returns:
             List of loss sequences
         """
+        if self._store is not None:
+            # Vectorized run-length pass over the time-ordered rows
+            index = self._store.time_index
+            rows = index.rows
+            starts, stops = loss_runs(
+                index.times, self._is_loss(rows), LOSS_SEQUENCE_TIME_WINDOW_SECONDS * NS_PER_SECOND
+            )
+            long_runs = stops - starts >= LOSS_SEQUENCE_MIN_LENGTH
+            return [self._store.entries(rows[start:stop])
+                    for start, stop in zip(starts[long_runs].tolist(), stops[long_runs].tolist())]
+
         sequences = []
 
-        # Sort entries by timestamp
-        sorted_entries = sorted(self._entries, key=lambda e: e.timestamp)
+        # Entries are kept in timestamp order as they are added
+        sorted_entries = [self._entries[position] for position in self._time_order]
 
         # Find sequences: loss within 30 minutes followed by another trade
         current_sequence: List[JournalEntry] = []
@@ -277,94 +833,64 @@ class TradeJournalAnalyzer:
 
     def _analyze_time_patterns(self, min_trades: int) -> List[TradePattern]:
         """Analyze patterns by time of day"""
-        # Group entries by hour
-        hourly_stats: Dict[int, Dict[str, Any]] = defaultdict(
-            lambda: {
-                "trades": 0,
-                "wins": 0,
-                "total_profit": 0.0,
-                "total_profit_percent": 0.0,
-            }
-        )
-
-        for entry in self._entries:
-            if entry.is_closed:
-                hour = entry.timestamp.hour
-                stats = hourly_stats[hour]
-                stats["trades"] += 1
-                stats["total_profit"] += entry.profit
-                stats["total_profit_percent"] += entry.profit_percent
-                if entry.is_profitable:
-                    stats["wins"] += 1
-
-        # Create patterns for high-performing hours
         patterns = []
-        for hour, stats in hourly_stats.items():
-            if stats["trades"] >= min_trades:
-                win_rate = (stats["wins"] / stats["trades"]) * 100
-                if win_rate > MIN_WIN_RATE_FOR_PATTERN:
-                    hour_name = f"{hour:02d}:00-{(hour + 1) % 24:02d}"
-
-                    # Determine time period
-                    if 6 <= hour < 12:
-                        period = "Morning"
-                    elif 12 <= hour < 17:
-                        period = "Afternoon"
-                    else:
-                        period = "Evening"
-
-                    patterns.append(
-                        TradePattern(
-                            description=f"{period} trades ({hour_name})",
-                            win_rate=win_rate,
-                            total_trades=stats["trades"],
-                            avg_profit_percent=stats["total_profit_percent"]
-                            / stats["trades"],
-                            confidence=min(
-                                stats["trades"] / MAX_CONFIDENCE_TRADE_DIVISOR, 1.0
-                            ),
-                            factors={"time_period": period, "hour_range": hour_name},
-                        )
-                    )
+        for hour, stats in self._aggregates.by_hour.items():
+            hour_name = f"{hour:02d}:00-{(hour + 1) % 24:02d}"
+
+            # Determine time period
+            if 6 <= hour < 12:
+                period = "Morning"
+            elif 12 <= hour < 17:
+                period = "Afternoon"
+            else:
+                period = "Evening"
+
+            pattern = self._winning_pattern(
+                stats, min_trades, f"{period} trades ({hour_name})",
+                {"time_period": period, "hour_range": hour_name}
+            )
+            if pattern is not None:
+                patterns.append(pattern)
 
         return patterns
 
     def _analyze_symbol_patterns(self, min_trades: int) -> List[TradePattern]:
         """Analyze patterns by symbol"""
-        symbol_stats: Dict[str, Dict[str, Any]] = defaultdict(
-            lambda: {
-                "trades": [],
-                "wins": 0,
-                "total_profit": 0.0,
-                "total_profit_percent": 0.0,
-            }
-        )
-
-        for entry in self._entries:
-            if entry.is_closed:
-                stats = symbol_stats[entry.symbol]
-                stats["trades"].append(entry)
-                stats["total_profit"] += entry.profit
-                stats["total_profit_percent"] += entry.profit_percent
-                if entry.is_profitable:
-                    stats["wins"] += 1
-
+        return [
+            self._make_pattern(stats, f"{symbol} trading", {"symbol": symbol})
+            for symbol, stats in self._aggregates.by_symbol.items()
+            if stats["trades"] >= min_trades
+        ]
+
+    def _analyze_signal_patterns(self, min_trades: int) -> List[TradePattern]:
+        """Analyze patterns by signal type and by indicator"""
         patterns = []
-        for symbol, stats in symbol_stats.items():
-            if len(stats["trades"]) >= min_trades:
-                win_rate = (stats["wins"] / len(stats["trades"])) * 100
-                patterns.append(
-                    TradePattern(
-                        description=f"{symbol} trading",
-                        win_rate=win_rate,
-                        total_trades=len(stats["trades"]),
-                        avg_profit_percent=stats["total_profit_percent"]
-                        / len(stats["trades"]),
-                        confidence=min(
-                            len(stats["trades"]) / MAX_CONFIDENCE_TRADE_DIVISOR, 1.0
-                        ),
-                        factors={"symbol": symbol},
-                    )
+        for dimension, label in (("signal_type", "signal"), ("indicator", "indicator")):
+            for value, stats in self._aggregates.groups[dimension].items():
+                pattern = self._winning_pattern(
+                    stats, min_trades, f"{value} {label} trades", {dimension: value}
                 )
-
+                if pattern is not None:
+                    patterns.append(pattern)
         return patterns
+
+    @classmethod
+    def _winning_pattern(
+        cls, stats: Dict[str, Any], min_trades: int, description: str, factors: Dict[str, Any]
+    ) -> Optional[TradePattern]:
+        """Pattern for a group with enough trades and a winning record, else None"""
+        if stats["trades"] < min_trades or stats["wins"] / stats["trades"] * 100 <= MIN_WIN_RATE_FOR_PATTERN:
+            return None
+        return cls._make_pattern(stats, description, factors)
+
+    @staticmethod
+    def _make_pattern(stats: Dict[str, Any], description: str, factors: Dict[str, Any]) -> TradePattern:
+        """Build a TradePattern from a group's running totals"""
+        return TradePattern(
+            description=description,
+            win_rate=(stats["wins"] / stats["trades"]) * 100,
+            total_trades=stats["trades"],
+            avg_profit_percent=stats["total_profit_percent"] / stats["trades"],
+            confidence=min(stats["trades"] / MAX_CONFIDENCE_TRADE_DIVISOR, 1.0),
+            factors=factors,
+        )
@@ -0,0 +1,146 @@
+"""
+Pattern Cube
+
+Mines win-rate and profit aggregates over combinations of journal
+dimensions (e.g. symbol x hour, signal type x weekday) level by level,
+Apriori style. A combination can only reach min_trades if every one of
+its sub-combinations does, so each level only counts the rows whose
+sub-cells all survived the previous level, and a combination of
+dimensions is skipped entirely when any of its subsets produced no
+frequent cell. Cells are counted with a dense bincount while the key
+space is small and with a sparse np.unique group-by otherwise.
+"""
+
+from dataclasses import dataclass
+from itertools import combinations
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+# Dimensions mined by TradeJournalAnalyzer.mine_patterns, in output order
+CUBE_DIMENSIONS = ("symbol", "signal_type", "indicator", "weekday", "hour")
+
+WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+# Count with a dense bincount while the key space is at most this many
+# times the number of rows; beyond that, group the sparse keys instead
+DENSE_KEY_SPACE_FACTOR = 4
+
+# Per dimension: (code per row, label per code)
+DimensionColumns = Mapping[str, Tuple["np.ndarray", Sequence[Any]]]
+
+
+@dataclass(slots=True)
+class CubeCell:
+    """Totals for one combination of dimension values"""
+    dimensions: Tuple[str, ...]
+    values: Tuple[Any, ...]
+    trades: int
+    wins: int
+    total_profit_percent: float
+
+    @property
+    def win_rate(self) -> float:
+        """Win rate as a percentage (0-100)"""
+        return self.wins / self.trades * 100
+
+    @property
+    def avg_profit_percent(self) -> float:
+        return self.total_profit_percent / self.trades
+
+    @property
+    def factors(self) -> Dict[str, Any]:
+        """Dimension -> value mapping of the cell"""
+        return dict(zip(self.dimensions, self.values))
+
+
+def _group(
+    keys: "np.ndarray", space: int, wins: "np.ndarray", profit_percents: "np.ndarray"
+) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Group rows by key
+
+    Returns:
+        (group keys, trade counts, win counts, profit percent sums, group
+        index of each row)
+    """
+    if space <= DENSE_KEY_SPACE_FACTOR * len(keys):
+        group_keys = np.arange(space)
+        row_groups = keys
+    else:
+        group_keys, row_groups = np.unique(keys, return_inverse=True)
+        space = len(group_keys)
+    counts = np.bincount(row_groups, minlength=space)
+    win_counts = np.bincount(row_groups, weights=wins, minlength=space)
+    percent_sums = np.bincount(row_groups, weights=profit_percents, minlength=space)
+    return group_keys, counts, win_counts, percent_sums, row_groups
+
+
+def mine_cube(
+    columns: DimensionColumns,
+    wins: "np.ndarray",
+    profit_percents: "np.ndarray",
+    min_trades: int,
+    max_dimensions: int = 2
+) -> List[CubeCell]:
+    """Find every cell of up to max_dimensions dimensions with min_trades trades
+
+    Args:
+        columns: Per dimension, (code per trade, label per code); the
+            order of the mapping sets the order of dimensions in a cell
+        wins: Boolean win flag per trade
+        profit_percents: Profit percent per trade
+        min_trades: Minimum trades in a cell (support threshold)
+        max_dimensions: Largest number of dimensions combined in a cell
+
+    Returns:
+        Cells ordered by number of dimensions, then dimension order
+    """
+    if min_trades < 1:
+        raise ValueError(f"min_trades must be positive, got {min_trades}")
+    wins = np.asarray(wins, dtype=np.float64)
+    profit_percents = np.asarray(profit_percents, dtype=np.float64)
+    names = list(columns)
+    codes = {name: np.asarray(columns[name][0], dtype=np.int64) for name in names}
+    sizes = {name: max(len(columns[name][1]), 1) for name in names}
+
+    cells: List[CubeCell] = []
+    # Per surviving combination: mask of the rows that fall in a frequent cell
+    survivors: Dict[Tuple[str, ...], "np.ndarray"] = {(): np.ones(len(wins), dtype=bool)}
+    for size in range(1, min(max_dimensions, len(names)) + 1):
+        level: Dict[Tuple[str, ...], "np.ndarray"] = {}
+        for combo in combinations(names, size):
+            subsets = list(combinations(combo, size - 1))
+            if any(subset not in survivors for subset in subsets):
+                continue
+            mask = survivors[subsets[0]]
+            for subset in subsets[1:]:
+                mask = mask & survivors[subset]
+            rows = np.flatnonzero(mask)
+            if len(rows) < min_trades:
+                continue
+
+            shape = tuple(sizes[name] for name in combo)
+            keys = np.ravel_multi_index(tuple(codes[name][rows] for name in combo), shape)
+            group_keys, counts, win_counts, percent_sums, row_groups = _group(
+                keys, int(np.prod(shape)), wins[rows], profit_percents[rows]
+            )
+            frequent = counts >= min_trades
+            if not frequent.any():
+                continue
+
+            selected = np.flatnonzero(frequent)
+            value_codes = np.unravel_index(group_keys[selected], shape)
+            labels = [[columns[name][1][code] for code in dim_codes.tolist()]
+                      for name, dim_codes in zip(combo, value_codes)]
+            for i, (trades, wins_i, percent) in enumerate(zip(
+                counts[selected].tolist(), win_counts[selected].tolist(), percent_sums[selected].tolist()
+            )):
+                cells.append(CubeCell(combo, tuple(dim[i] for dim in labels), trades, int(wins_i), percent))
+
+            in_frequent = np.zeros(len(wins), dtype=bool)
+            in_frequent[rows] = frequent[row_groups]
+            level[combo] = in_frequent
+        if not level:
+            break
+        survivors = level
+    return cells
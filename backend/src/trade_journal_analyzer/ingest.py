@@ -0,0 +1,238 @@
+"""
+Journal Ingestion
+
+Converts batches of journal data (JournalEntry objects, record dicts, CSV
+rows or Arrow record batches) into the column layout JournalStore.extend
+accepts, so bulk loads cost a few array conversions per chunk instead of
+one add_entry call per row.
+"""
+
+import csv
+import warnings
+from datetime import datetime
+from itertools import islice
+from operator import attrgetter, itemgetter
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Sequence, Tuple
+
+from .models import JournalEntry, TradeStatus
+
+try:
+    import numpy as np
+    from .store import NAIVE_OFFSET, NS_PER_SECOND, STATUS_CODES, datetime_to_ns, utc_offset_seconds
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# Rows converted per vectorized chunk
+DEFAULT_INGEST_CHUNK_SIZE = 65_536
+
+# Record fields in JournalEntry order; notes is optional
+JOURNAL_FIELDS = (
+    "id", "timestamp", "symbol", "entry_price", "exit_price", "profit",
+    "profit_percent", "signal_type", "indicator", "status", "notes",
+)
+_REQUIRED_FIELDS = JOURNAL_FIELDS[:-1]
+_FLOAT_FIELDS = ("entry_price", "exit_price", "profit", "profit_percent")
+
+# Batch of columns keyed by JOURNAL_FIELDS, plus "utc_offset"
+Columns = Dict[str, Any]
+
+
+def chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Yield lists of up to size items"""
+    if size < 1:
+        raise ValueError(f"chunk_size must be positive, got {size}")
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _parse_timestamp(value: Any) -> datetime:
+    """Return a datetime for a datetime or ISO 8601 string"""
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(str(value))
+
+
+def _parse_status(value: Any) -> TradeStatus:
+    """Return a TradeStatus for a status or its value string"""
+    if isinstance(value, TradeStatus):
+        return value
+    try:
+        return TradeStatus(value)
+    except ValueError:
+        raise ValueError(f"Unknown trade status: {value!r}") from None
+
+
+def entry_from_record(record: Mapping[str, Any]) -> JournalEntry:
+    """Build a JournalEntry from a record, coercing CSV-style strings
+
+    Args:
+        record: Mapping with the JournalEntry field names
+
+    Returns:
+        JournalEntry
+    """
+    missing = [name for name in _REQUIRED_FIELDS if name not in record]
+    if missing:
+        raise ValueError(f"Journal record is missing fields: {', '.join(missing)}")
+    return JournalEntry(
+        id=str(record["id"]),
+        timestamp=_parse_timestamp(record["timestamp"]),
+        symbol=record["symbol"],
+        entry_price=float(record["entry_price"]),
+        exit_price=float(record["exit_price"]),
+        profit=float(record["profit"]),
+        profit_percent=float(record["profit_percent"]),
+        signal_type=record["signal_type"],
+        indicator=record["indicator"],
+        status=_parse_status(record["status"]),
+        notes=record.get("notes") or "",
+    )
+
+
+def encode_timestamps(values: Any) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Convert datetimes, datetime64 values or ISO strings to ns and UTC offsets
+
+    datetime64 values and ISO strings without a UTC offset are naive and
+    converted by NumPy in one call; anything else falls back to
+    datetime_to_ns / utc_offset_seconds per value.
+
+    Returns:
+        (nanoseconds, UTC offset seconds or NAIVE_OFFSET) per value
+    """
+    arr = np.asarray(values)
+    n = len(arr)
+    if arr.dtype.kind == "M":
+        return arr.astype("datetime64[ns]").view(np.int64), np.full(n, NAIVE_OFFSET, dtype=np.int32)
+    if arr.dtype.kind == "U":
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            try:
+                return arr.astype("datetime64[ns]").view(np.int64), np.full(n, NAIVE_OFFSET, dtype=np.int32)
+            except (ValueError, Warning):
+                pass
+    values = arr.tolist()
+    if not all(isinstance(value, datetime) for value in values):
+        values = [_parse_timestamp(value) for value in values]
+    return (
+        np.fromiter(map(datetime_to_ns, values), dtype=np.int64, count=n),
+        np.fromiter(map(utc_offset_seconds, values), dtype=np.int32, count=n),
+    )
+
+
+def status_codes(values: Sequence[Any]) -> "np.ndarray":
+    """Convert TradeStatus values or their value strings to status codes"""
+    lookup = dict(STATUS_CODES)
+    lookup.update({status.value: code for status, code in STATUS_CODES.items()})
+    try:
+        return np.fromiter(map(lookup.__getitem__, values), dtype=np.int8, count=len(values))
+    except KeyError:
+        unknown = next(value for value in values if value not in lookup)
+        raise ValueError(f"Unknown trade status: {unknown!r}") from None
+
+
+def _columns_from_lists(values: Mapping[str, Sequence[Any]]) -> Columns:
+    """Convert per-field value lists to typed columns"""
+    columns: Columns = {
+        "id": np.array([str(value) for value in values["id"]], dtype=object),
+        "status": status_codes(values["status"]),
+        "notes": np.array([value or "" for value in values["notes"]], dtype=object),
+    }
+    columns["timestamp"], columns["utc_offset"] = encode_timestamps(values["timestamp"])
+    for name in _FLOAT_FIELDS:
+        columns[name] = np.asarray(values[name], dtype=np.float64)
+    for name in ("symbol", "signal_type", "indicator"):
+        columns[name] = values[name]
+    return columns
+
+
+def entries_to_columns(entries: Sequence[JournalEntry]) -> Columns:
+    """Convert a chunk of JournalEntry objects to columns"""
+    return _columns_from_lists({name: list(map(attrgetter(name), entries)) for name in JOURNAL_FIELDS})
+
+
+def rows_to_columns(rows: Sequence[Sequence[Any]]) -> Columns:
+    """Convert a chunk of value tuples in JOURNAL_FIELDS order"""
+    return _columns_from_lists(dict(zip(JOURNAL_FIELDS, zip(*rows))))
+
+
+def records_to_columns(records: Sequence[Mapping[str, Any]]) -> Columns:
+    """Convert a chunk of records (mappings with JournalEntry field names)"""
+    try:
+        fields = list(zip(*map(itemgetter(*_REQUIRED_FIELDS), records)))
+    except KeyError as exc:
+        raise ValueError(f"Journal record is missing field: {exc.args[0]}") from None
+    values = dict(zip(_REQUIRED_FIELDS, fields))
+    values["notes"] = [record.get("notes") for record in records]
+    return _columns_from_lists(values)
+
+
+def read_csv_records(path: str) -> Iterator[Dict[str, str]]:
+    """Stream the rows of a journal CSV file (header row = field names)"""
+    with open(path, newline="", encoding="utf-8") as f:
+        yield from csv.DictReader(f)
+
+
+def csv_to_columns(path: str, chunk_size: int = DEFAULT_INGEST_CHUNK_SIZE) -> Iterator[Columns]:
+    """Yield columns for each chunk of rows of a journal CSV file
+
+    Rows are read as plain lists and transposed per chunk, which avoids
+    building a dict per row as csv.DictReader does.
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        missing = [name for name in _REQUIRED_FIELDS if name not in header]
+        if missing:
+            raise ValueError(f"Journal CSV is missing columns: {', '.join(missing)}")
+        positions = {name: header.index(name) for name in JOURNAL_FIELDS if name in header}
+        for chunk in chunked(reader, chunk_size):
+            if set(map(len, chunk)) != {len(header)}:
+                raise ValueError(f"Journal CSV rows must have {len(header)} fields")
+            transposed = list(zip(*chunk))
+            values = {name: transposed[position] for name, position in positions.items()}
+            values.setdefault("notes", [None] * len(chunk))
+            yield _columns_from_lists(values)
+
+
+def arrow_to_columns(table: Any, chunk_size: int = DEFAULT_INGEST_CHUNK_SIZE) -> Iterator[Columns]:
+    """Yield columns for each record batch of a pyarrow Table or RecordBatch
+
+    Timestamp columns are read as datetime64 without a Python object per
+    row; timezone-aware ones keep their UTC time and get each row's UTC
+    offset from the difference to their local wall-clock time.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError:
+        raise ImportError("pyarrow is required for load_from_arrow") from None
+
+    batches = table.to_batches(max_chunksize=chunk_size) if hasattr(table, "to_batches") else [table]
+    for batch in batches:
+        missing = [name for name in _REQUIRED_FIELDS if name not in batch.schema.names]
+        if missing:
+            raise ValueError(f"Arrow table is missing columns: {', '.join(missing)}")
+        values: Dict[str, Any] = {}
+        utc_offsets = None
+        for name in JOURNAL_FIELDS:
+            if name not in batch.schema.names:
+                values[name] = [None] * batch.num_rows
+                continue
+            column = batch.column(name)
+            values[name] = column.to_numpy(zero_copy_only=False)
+            if name == "timestamp" and pa.types.is_timestamp(column.type) and column.type.tz is not None:
+                utc = values[name].astype("datetime64[ns]").view(np.int64)
+                local = pc.local_timestamp(column).to_numpy(zero_copy_only=False)
+                local = local.astype("datetime64[ns]").view(np.int64)
+                utc_offsets = ((local - utc) // NS_PER_SECOND).astype(np.int32)
+        columns = _columns_from_lists(values)
+        if utc_offsets is not None:
+            columns["utc_offset"] = utc_offsets
+        yield columns
@@ -0,0 +1,281 @@
+"""
+Journal Log
+
+Append-only on-disk journal behind TradeJournalAnalyzer.open. Rows are
+stored in segmented columnar files: one raw file per numeric column
+(int64 timestamps, int32 UTC offsets, float64 prices and profits, int8
+status codes, int32 symbol / signal / indicator dictionary codes) and an offsets + UTF-8 data
+file pair for id and notes. A JSON manifest records the committed rows of
+each segment and the string dictionaries; it is replaced atomically after
+the column files are fsynced, so only committed rows are ever read and an
+interrupted flush is truncated by the next one.
+
+Appends are buffered and synced in batches of sync_rows, so a live
+journal pays one fsync round per batch rather than per trade. A snapshot
+of the aggregate totals is kept next to the segments; a warm start maps
+the segments and folds in only the rows written after the snapshot.
+"""
+
+import json
+from operator import attrgetter
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from utils.durable_files import append_file, map_column, write_json
+
+from .ingest import JOURNAL_FIELDS, Columns, rows_to_columns
+from .models import JournalEntry
+from .store import NAIVE_OFFSET, StringDictionary
+
+MANIFEST_FILE = "manifest.json"
+SNAPSHOT_FILE = "aggregates.json"
+LOG_VERSION = "1.0"
+
+# Buffered rows that trigger a flush (column writes + fsync + manifest)
+DEFAULT_SYNC_ROWS = 4096
+# Rows per segment directory
+DEFAULT_SEGMENT_ROWS = 1 << 20
+# Committed rows between aggregate snapshots
+DEFAULT_SNAPSHOT_ROWS = 100_000
+
+_FIXED_COLUMNS = {
+    "timestamp": np.dtype(np.int64),
+    "utc_offset": np.dtype(np.int32),
+    "entry_price": np.dtype(np.float64),
+    "exit_price": np.dtype(np.float64),
+    "profit": np.dtype(np.float64),
+    "profit_percent": np.dtype(np.float64),
+    "status": np.dtype(np.int8),
+    "symbol": np.dtype(np.int32),
+    "signal_type": np.dtype(np.int32),
+    "indicator": np.dtype(np.int32),
+}
+_DICTIONARY_COLUMNS = ("symbol", "signal_type", "indicator")
+_TEXT_COLUMNS = ("id", "notes")
+_OFFSET_DTYPE = np.dtype(np.int64)
+
+_entry_values = attrgetter(*JOURNAL_FIELDS)
+
+
+class JournalLog:
+    """Durable, append-only journal of trades in segmented column files
+
+    Example:
+        log = JournalLog("data/journal")
+        log.append(entry)            # buffered
+        log.flush()                  # durable
+        for columns in log.segments():
+            store.extend(columns)
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        sync_rows: int = DEFAULT_SYNC_ROWS,
+        segment_rows: int = DEFAULT_SEGMENT_ROWS,
+        snapshot_rows: int = DEFAULT_SNAPSHOT_ROWS
+    ):
+        """Open (or create) a journal directory
+
+        Args:
+            root: Directory holding the manifest, snapshot and segments
+            sync_rows: Buffered rows that trigger a flush
+            segment_rows: Maximum rows per segment
+            snapshot_rows: Committed rows between aggregate snapshots
+        """
+        for name, value in (("sync_rows", sync_rows), ("segment_rows", segment_rows),
+                            ("snapshot_rows", snapshot_rows)):
+            if value < 1:
+                raise ValueError(f"{name} must be positive, got {value}")
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.sync_rows = sync_rows
+        self.segment_rows = segment_rows
+        self.snapshot_rows = snapshot_rows
+        self.dictionaries = {name: StringDictionary() for name in _DICTIONARY_COLUMNS}
+        self._segments: List[Dict[str, Any]] = self._read_manifest()
+        self._rows = sum(segment["rows"] for segment in self._segments)
+        self._snapshot_at = self._read_snapshot_rows()
+        self._pending: List[Columns] = []
+        self._pending_entries: List[Tuple[Any, ...]] = []
+        self._pending_rows = 0
+
+    def _read_manifest(self) -> List[Dict[str, Any]]:
+        """Load segments and dictionaries, or start an empty log"""
+        path = self.root / MANIFEST_FILE
+        if not path.exists():
+            return []
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != LOG_VERSION:
+            raise ValueError(f"Unsupported journal log version: {data.get('version')!r}")
+        for name, values in data["dictionaries"].items():
+            for value in values:
+                self.dictionaries[name].encode(value)
+        return data["segments"]
+
+    def _write_manifest(self, segments: List[Dict[str, Any]]) -> None:
+        write_json(self.root / MANIFEST_FILE, {
+            "version": LOG_VERSION,
+            "segments": segments,
+            "dictionaries": {name: dictionary.values for name, dictionary in self.dictionaries.items()},
+        })
+
+    def _read_snapshot_rows(self) -> int:
+        snapshot = self.read_snapshot()
+        return snapshot[0] if snapshot is not None else 0
+
+    def __len__(self) -> int:
+        """Committed plus buffered rows"""
+        return self._rows + self._pending_rows
+
+    @property
+    def rows(self) -> int:
+        """Rows committed to disk"""
+        return self._rows
+
+    @property
+    def pending_rows(self) -> int:
+        """Rows buffered since the last flush"""
+        return self._pending_rows
+
+    @property
+    def snapshot_due(self) -> bool:
+        """Whether snapshot_rows rows were committed since the last snapshot"""
+        return self._rows - self._snapshot_at >= self.snapshot_rows
+
+    def append(self, entry: JournalEntry) -> None:
+        """Buffer one entry (its values are copied now), flushing every sync_rows rows"""
+        self._pending_entries.append(_entry_values(entry))
+        self._pending_rows += 1
+        if self._pending_rows >= self.sync_rows:
+            self.flush()
+
+    def append_columns(self, columns: Columns) -> None:
+        """Buffer a batch of rows in JournalStore.extend layout
+
+        The arrays are referenced, not copied, until the next flush.
+        """
+        n = len(columns["timestamp"])
+        if n == 0:
+            return
+        self._seal_entries()
+        self._pending.append(columns)
+        self._pending_rows += n
+        if self._pending_rows >= self.sync_rows:
+            self.flush()
+
+    def _seal_entries(self) -> None:
+        """Convert buffered single entries to a column batch, keeping order"""
+        if self._pending_entries:
+            self._pending.append(rows_to_columns(self._pending_entries))
+            self._pending_entries = []
+
+    def flush(self) -> None:
+        """Write buffered rows, fsync the column files and commit the manifest"""
+        self._seal_entries()
+        if not self._pending:
+            return
+        batches = self._pending
+        columns: Dict[str, np.ndarray] = {}
+        for name in (*_FIXED_COLUMNS, *_TEXT_COLUMNS):
+            if name == "utc_offset":
+                parts = [batch.get(name, np.full(len(batch["timestamp"]), NAIVE_OFFSET)) for batch in batches]
+            else:
+                parts = [batch[name] for batch in batches]
+            if name in _DICTIONARY_COLUMNS:
+                parts = [self.dictionaries[name].encode_many(part) for part in parts]
+            elif name in _TEXT_COLUMNS:
+                parts = [np.asarray(part, dtype=object) for part in parts]
+            else:
+                parts = [np.asarray(part, dtype=_FIXED_COLUMNS[name]) for part in parts]
+            columns[name] = parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+        n = len(columns["timestamp"])
+        # Segment records are only replaced once the manifest is committed
+        segments = [dict(segment, bytes=dict(segment["bytes"])) for segment in self._segments]
+        done = 0
+        while done < n:
+            if not segments or segments[-1]["rows"] >= self.segment_rows:
+                segments.append({
+                    "name": f"segment-{len(segments):06d}",
+                    "rows": 0,
+                    "bytes": {name: 0 for name in _TEXT_COLUMNS},
+                })
+            segment = segments[-1]
+            stop = min(n, done + self.segment_rows - segment["rows"])
+            self._write_segment(segment, {name: values[done:stop] for name, values in columns.items()})
+            done = stop
+        self._write_manifest(segments)
+        self._segments = segments
+        self._rows += n
+        self._pending = []
+        self._pending_rows = 0
+
+    def _write_segment(self, segment: Dict[str, Any], columns: Dict[str, np.ndarray]) -> None:
+        """Append rows to a segment's files (manifest not yet updated)"""
+        directory = self.root / segment["name"]
+        directory.mkdir(exist_ok=True)
+        rows = segment["rows"]
+        for name, dtype in _FIXED_COLUMNS.items():
+            append_file(directory / f"{name}.bin", rows * dtype.itemsize,
+                        np.ascontiguousarray(columns[name], dtype=dtype).tobytes())
+        for name in _TEXT_COLUMNS:
+            encoded = [value.encode("utf-8") for value in columns[name].tolist()]
+            ends = np.cumsum(np.fromiter(map(len, encoded), dtype=_OFFSET_DTYPE, count=len(encoded)))
+            ends += segment["bytes"][name]
+            append_file(directory / f"{name}.data", segment["bytes"][name], b"".join(encoded))
+            append_file(directory / f"{name}.offsets", rows * _OFFSET_DTYPE.itemsize, ends.tobytes())
+            segment["bytes"][name] = int(ends[-1])
+        segment["rows"] = rows + len(columns["timestamp"])
+
+    def segments(self) -> Iterator[Columns]:
+        """Yield the committed rows of each segment in JournalStore.extend layout
+
+        Numeric and dictionary-code columns are read-only memory-mapped
+        views; id and notes are decoded to object arrays.
+        """
+        for segment in self._segments:
+            rows = segment["rows"]
+            if rows == 0:
+                continue
+            directory = self.root / segment["name"]
+            columns: Columns = {
+                name: map_column(directory / f"{name}.bin", dtype, rows) for name, dtype in _FIXED_COLUMNS.items()
+            }
+            for name in _TEXT_COLUMNS:
+                ends = map_column(directory / f"{name}.offsets", _OFFSET_DTYPE, rows).tolist()
+                with open(directory / f"{name}.data", "rb") as f:
+                    data = f.read(segment["bytes"][name])
+                starts = [0] + ends[:-1]
+                values = np.empty(rows, dtype=object)
+                values[:] = [data[start:end].decode("utf-8") for start, end in zip(starts, ends)]
+                columns[name] = values
+            yield columns
+
+    def write_snapshot(self, state: Dict[str, Any]) -> None:
+        """Flush, then store aggregate totals covering every appended row
+
+        Args:
+            state: JournalAggregates.to_state() of all rows appended so far
+        """
+        self.flush()
+        write_json(self.root / SNAPSHOT_FILE, {"version": LOG_VERSION, "rows": self._rows, "aggregates": state})
+        self._snapshot_at = self._rows
+
+    def read_snapshot(self) -> Optional[Tuple[int, Dict[str, Any]]]:
+        """Return (rows covered, aggregate state), or None if there is no usable snapshot"""
+        path = self.root / SNAPSHOT_FILE
+        if not path.exists():
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != LOG_VERSION or data["rows"] > self._rows:
+            return None
+        return data["rows"], data["aggregates"]
+
+    def close(self) -> None:
+        """Flush buffered rows"""
+        self.flush()
@@ -0,0 +1,73 @@
+"""
+Versioned Result Cache
+
+Bounded LRU memo for analysis results that are valid for exactly one
+journal version. Results never expire on a clock; they are dropped as
+soon as the journal changes (a lookup with a newer version clears the
+cache) or when the least recently used entry must make room.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Default number of cached results per analyzer
+DEFAULT_MEMO_MAX_SIZE = 32
+
+
+class VersionedCache:
+    """LRU cache whose entries are tied to a data version"""
+
+    def __init__(self, max_size: int = DEFAULT_MEMO_MAX_SIZE):
+        """Initialize an empty cache
+
+        Args:
+            max_size: Maximum number of cached results
+        """
+        if max_size < 1:
+            raise ValueError(f"max_size must be positive, got {max_size}")
+        self.max_size = max_size
+        self.version: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+        self._results: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def _sync(self, version: int) -> None:
+        """Drop every result computed for another version"""
+        if version != self.version:
+            self._results.clear()
+            self.version = version
+
+    def get(self, key: Hashable, version: int) -> Optional[Any]:
+        """Return the result cached for key at version, or None"""
+        self._sync(version)
+        result = self._results.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self._results.move_to_end(key)
+        self.hits += 1
+        return result
+
+    def put(self, key: Hashable, version: int, result: Any) -> None:
+        """Cache a result, evicting the least recently used one if full"""
+        self._sync(version)
+        self._results[key] = result
+        self._results.move_to_end(key)
+        while len(self._results) > self.max_size:
+            self._results.popitem(last=False)
+
+    def get_or_compute(self, key: Hashable, version: int, compute: Callable[[], T]) -> T:
+        """Return the cached result for key, computing and caching it if missing"""
+        result = self.get(key, version)
+        if result is None:
+            result = compute()
+            self.put(key, version, result)
+        return result
+
+    def clear(self) -> None:
+        self._results.clear()
@@ -1,7 +1,9 @@
 """
 Trade Journal Models
 
-Defines data models for journal analysis.
+Defines data models for journal analysis. JournalEntry and TradePattern
+are slotted dataclasses (no per-instance __dict__); FrozenJournalEntry is
+an immutable, hashable variant of JournalEntry.
 """
 
 from dataclasses import dataclass
@@ -17,8 +19,24 @@ class TradeStatus(Enum):
     CANCELLED = "CANCELLED"
 
 
-@dataclass
-class JournalEntry:
+class _JournalEntryBase:
+    """Behaviour shared by JournalEntry and FrozenJournalEntry"""
+
+    __slots__ = ()
+
+    @property
+    def is_closed(self) -> bool:
+        """Check if trade is closed"""
+        return self.status == TradeStatus.CLOSED
+
+    @property
+    def is_profitable(self) -> bool:
+        """Check if trade is profitable"""
+        return self.profit > 0
+
+
+@dataclass(slots=True)
+class JournalEntry(_JournalEntryBase):
     """Represents a trading journal entry"""
     id: str
     timestamp: datetime
@@ -32,18 +50,24 @@ class JournalEntry:
     status: TradeStatus  # Changed from str to TradeStatus Enum
     notes: str = ""
 
-    @property
-    def is_closed(self) -> bool:
-        """Check if trade is closed"""
-        return self.status == TradeStatus.CLOSED
 
-    @property
-    def is_profitable(self) -> bool:
-        """Check if trade is profitable"""
-        return self.profit > 0
+@dataclass(slots=True, frozen=True)
+class FrozenJournalEntry(_JournalEntryBase):
+    """Immutable, hashable JournalEntry (e.g. for sets or dict keys)"""
+    id: str
+    timestamp: datetime
+    symbol: str
+    entry_price: float
+    exit_price: float
+    profit: float
+    profit_percent: float
+    signal_type: str
+    indicator: str
+    status: TradeStatus
+    notes: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class TradePattern:
     """Represents a discovered trading pattern"""
     description: str
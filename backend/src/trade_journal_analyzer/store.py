@@ -0,0 +1,338 @@
+"""
+Columnar Journal Store
+
+Keeps journal entries as parallel NumPy columns instead of a list of
+objects: int64 nanosecond timestamps, float64 prices and profits, int8
+status codes and dictionary-encoded symbol / signal / indicator ids.
+Timezone-aware timestamps are stored as UTC instants plus their UTC
+offset, so they sort and filter like the datetimes themselves, group by
+their local hour and decode back to aware datetimes.
+Columns grow by amortized doubling, aggregations become bincount
+group-bys over the code columns. Secondary indexes are maintained as
+rows arrive: a TimestampIndex keeps the rows in time order (for range
+queries by searchsorted) and RowPostings lists the rows of each symbol.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+
+from .models import JournalEntry, TradeStatus
+from .timeline import TimestampIndex
+
+# Status column codes (index into STATUSES)
+STATUSES = (TradeStatus.OPEN, TradeStatus.CLOSED, TradeStatus.CANCELLED)
+STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+OPEN_CODE = STATUS_CODES[TradeStatus.OPEN]
+CLOSED_CODE = STATUS_CODES[TradeStatus.CLOSED]
+
+NS_PER_MICROSECOND = 1_000
+NS_PER_SECOND = 1_000_000_000
+NS_PER_HOUR = 3600 * NS_PER_SECOND
+NS_PER_DAY = 24 * NS_PER_HOUR
+
+# utc_offset column value of naive timestamps
+NAIVE_OFFSET = np.iinfo(np.int32).min
+
+_EPOCH = datetime(1970, 1, 1)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+_INITIAL_CAPACITY = 1024
+
+_COLUMN_DTYPES = {
+    "timestamp": np.int64,
+    "utc_offset": np.int32,
+    "entry_price": np.float64,
+    "exit_price": np.float64,
+    "profit": np.float64,
+    "profit_percent": np.float64,
+    "status": np.int8,
+    "symbol": np.int32,
+    "signal_type": np.int32,
+    "indicator": np.int32,
+    "id": object,
+    "notes": object,
+}
+
+
+def datetime_to_ns(timestamp: datetime) -> int:
+    """Convert a datetime to nanoseconds since 1970-01-01
+
+    Naive datetimes count wall-clock time; timezone-aware ones count UTC
+    time, so aware timestamps with different offsets order by instant.
+    """
+    offset = timestamp.utcoffset()
+    if offset is not None:
+        timestamp = timestamp.replace(tzinfo=None) - offset
+    return (timestamp - _EPOCH) // _ONE_MICROSECOND * NS_PER_MICROSECOND
+
+
+def utc_offset_seconds(timestamp: datetime) -> int:
+    """UTC offset of a datetime in seconds, or NAIVE_OFFSET if it is naive"""
+    offset = timestamp.utcoffset()
+    return NAIVE_OFFSET if offset is None else int(offset.total_seconds())
+
+
+def ns_to_datetime(ns: int, utc_offset: int = NAIVE_OFFSET) -> datetime:
+    """Convert nanoseconds back to a datetime
+
+    With a utc_offset (seconds) the result is aware, in a fixed-offset
+    timezone; otherwise it is naive.
+    """
+    timestamp = _EPOCH + timedelta(microseconds=int(ns) // NS_PER_MICROSECOND)
+    if utc_offset == NAIVE_OFFSET:
+        return timestamp
+    offset = timedelta(seconds=int(utc_offset))
+    return (timestamp + offset).replace(tzinfo=timezone(offset))
+
+
+def local_ns(timestamps: np.ndarray, utc_offsets: np.ndarray) -> np.ndarray:
+    """Wall-clock nanoseconds (UTC time plus offset for aware rows)"""
+    aware = utc_offsets != NAIVE_OFFSET
+    if not aware.any():
+        return timestamps
+    return timestamps + np.where(aware, utc_offsets, 0).astype(np.int64) * NS_PER_SECOND
+
+
+class StringDictionary:
+    """Dictionary encoding of strings to dense integer codes"""
+
+    def __init__(self):
+        self.values: List[str] = []
+        self._codes: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def encode(self, value: str) -> int:
+        """Return the code of a value, adding it if new"""
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def encode_many(self, values: Sequence[str]) -> np.ndarray:
+        """Encode a batch with one dict lookup per value (no sorting)"""
+        codes = self._codes
+        try:
+            return np.fromiter(map(codes.__getitem__, values), dtype=np.int32, count=len(values))
+        except KeyError:
+            for value in dict.fromkeys(values):
+                self.encode(value)
+            return np.fromiter(map(codes.__getitem__, values), dtype=np.int32, count=len(values))
+
+    def code_of(self, value: str) -> int:
+        """Return the code of a known value, or -1"""
+        return self._codes.get(value, -1)
+
+
+class RowPostings:
+    """Posting lists: ascending row numbers per dictionary code"""
+
+    def __init__(self):
+        self._rows: List[np.ndarray] = []
+        self._sizes: List[int] = []
+
+    def _ensure(self, code: int, extra: int) -> np.ndarray:
+        """Return the posting buffer of code with room for extra more rows"""
+        while len(self._rows) <= code:
+            self._rows.append(np.empty(16, dtype=np.int64))
+            self._sizes.append(0)
+        buffer = self._rows[code]
+        needed = self._sizes[code] + extra
+        if needed > len(buffer):
+            grown = np.empty(max(2 * len(buffer), needed), dtype=np.int64)
+            grown[:self._sizes[code]] = buffer[:self._sizes[code]]
+            buffer = self._rows[code] = grown
+        return buffer
+
+    def add(self, code: int, row: int) -> None:
+        """Append one row to a code's postings"""
+        buffer = self._ensure(code, 1)
+        buffer[self._sizes[code]] = row
+        self._sizes[code] += 1
+
+    def extend(self, codes: np.ndarray, first_row: int) -> None:
+        """Append a batch of consecutive rows starting at first_row"""
+        if len(codes) == 0:
+            return
+        order = np.argsort(codes, kind="stable")
+        sorted_codes = codes[order]
+        bounds = np.flatnonzero(np.diff(sorted_codes)) + 1
+        for group in np.split(order, bounds):
+            code = int(codes[group[0]])
+            buffer = self._ensure(code, len(group))
+            size = self._sizes[code]
+            buffer[size:size + len(group)] = group + first_row
+            self._sizes[code] = size + len(group)
+
+    def rows(self, code: int) -> np.ndarray:
+        """Ascending rows of one code (a view)"""
+        if not 0 <= code < len(self._rows):
+            return np.empty(0, dtype=np.int64)
+        return self._rows[code][:self._sizes[code]]
+
+    def rows_for(self, codes: Sequence[int]) -> np.ndarray:
+        """Ascending rows of several codes"""
+        parts = [self.rows(code) for code in codes]
+        if len(parts) == 1:
+            return parts[0]
+        return np.sort(np.concatenate(parts)) if parts else np.empty(0, dtype=np.int64)
+
+
+class JournalStore:
+    """Append-only columnar storage of journal entries"""
+
+    def __init__(self):
+        self._columns = {name: np.empty(_INITIAL_CAPACITY, dtype=dtype) for name, dtype in _COLUMN_DTYPES.items()}
+        self._size = 0
+        self.symbols = StringDictionary()
+        self.signal_types = StringDictionary()
+        self.indicators = StringDictionary()
+        self.time_index = TimestampIndex()
+        self.symbol_rows = RowPostings()
+        self._dictionaries = {"symbol": self.symbols, "signal_type": self.signal_types, "indicator": self.indicators}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _reserve(self, extra: int) -> None:
+        """Grow every column (doubling) to hold extra more rows"""
+        needed = self._size + extra
+        capacity = len(self._columns["timestamp"])
+        if needed <= capacity:
+            return
+        capacity = max(2 * capacity, needed)
+        for name, column in self._columns.items():
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            self._columns[name] = grown
+
+    def append(self, entry: JournalEntry) -> int:
+        """Append one entry and return its row number"""
+        self._reserve(1)
+        row = self._size
+        columns = self._columns
+        columns["timestamp"][row] = datetime_to_ns(entry.timestamp)
+        columns["utc_offset"][row] = utc_offset_seconds(entry.timestamp)
+        columns["entry_price"][row] = entry.entry_price
+        columns["exit_price"][row] = entry.exit_price
+        columns["profit"][row] = entry.profit
+        columns["profit_percent"][row] = entry.profit_percent
+        columns["status"][row] = STATUS_CODES[entry.status]
+        columns["symbol"][row] = self.symbols.encode(entry.symbol)
+        columns["signal_type"][row] = self.signal_types.encode(entry.signal_type)
+        columns["indicator"][row] = self.indicators.encode(entry.indicator)
+        columns["id"][row] = entry.id
+        columns["notes"][row] = entry.notes
+        self._size = row + 1
+        self.time_index.add(int(columns["timestamp"][row]), row)
+        self.symbol_rows.add(int(columns["symbol"][row]), row)
+        return row
+
+    def extend(self, columns: Dict[str, Any]) -> int:
+        """Append a batch of rows given as columns
+
+        Args:
+            columns: Arrays keyed by column name: int64 nanosecond
+                "timestamp", optional int32 "utc_offset" seconds
+                (default: naive), float "entry_price", "exit_price", "profit"
+                and "profit_percent", int8 "status" codes, string
+                "symbol", "signal_type" and "indicator" (dictionary
+                encoded here, or integer codes the dictionaries already
+                hold), and "id" / "notes"
+
+        Returns:
+            Row number of the first appended row
+        """
+        n = len(columns["timestamp"])
+        self._reserve(n)
+        start = self._size
+        stop = start + n
+        for name in _COLUMN_DTYPES:
+            if name == "utc_offset" and name not in columns:
+                self._columns[name][start:stop] = NAIVE_OFFSET
+                continue
+            values = columns[name]
+            if name in self._dictionaries and getattr(values, "dtype", np.dtype(object)).kind not in "iu":
+                values = self._dictionaries[name].encode_many(values) if n else ()
+            self._columns[name][start:stop] = values
+        self._size = stop
+        self.time_index.extend(self._columns["timestamp"][start:stop], start)
+        self.symbol_rows.extend(self._columns["symbol"][start:stop], start)
+        return start
+
+    def take(self, rows: np.ndarray) -> Dict[str, Any]:
+        """Copy rows out as columns in the layout extend() accepts"""
+        columns = {name: self._columns[name][rows] for name in _COLUMN_DTYPES}
+        for name, dictionary in self._dictionaries.items():
+            columns[name] = np.asarray(dictionary.values, dtype=object)[columns[name]]
+        return columns
+
+    def column(self, name: str) -> np.ndarray:
+        """Return a view of the filled part of a column"""
+        return self._columns[name][:self._size]
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Entry times in nanoseconds (UTC time for timezone-aware entries)"""
+        return self.column("timestamp")
+
+    @property
+    def utc_offsets(self) -> np.ndarray:
+        """UTC offsets in seconds (NAIVE_OFFSET for naive timestamps)"""
+        return self.column("utc_offset")
+
+    @property
+    def local_timestamps(self) -> np.ndarray:
+        """Entry times in wall-clock nanoseconds, for hour / weekday grouping"""
+        return local_ns(self.timestamps, self.utc_offsets)
+
+    @property
+    def profits(self) -> np.ndarray:
+        return self.column("profit")
+
+    @property
+    def profit_percents(self) -> np.ndarray:
+        return self.column("profit_percent")
+
+    @property
+    def statuses(self) -> np.ndarray:
+        """Status codes (see STATUSES)"""
+        return self.column("status")
+
+    @property
+    def symbol_codes(self) -> np.ndarray:
+        return self.column("symbol")
+
+    @property
+    def signal_codes(self) -> np.ndarray:
+        return self.column("signal_type")
+
+    @property
+    def indicator_codes(self) -> np.ndarray:
+        return self.column("indicator")
+
+    def entry(self, row: int) -> JournalEntry:
+        """Materialize one row as a JournalEntry"""
+        if not 0 <= row < self._size:
+            raise IndexError(f"Row {row} out of range for {self._size} entries")
+        columns = self._columns
+        return JournalEntry(
+            id=columns["id"][row],
+            timestamp=ns_to_datetime(columns["timestamp"][row], columns["utc_offset"][row]),
+            symbol=self.symbols.values[columns["symbol"][row]],
+            entry_price=float(columns["entry_price"][row]),
+            exit_price=float(columns["exit_price"][row]),
+            profit=float(columns["profit"][row]),
+            profit_percent=float(columns["profit_percent"][row]),
+            signal_type=self.signal_types.values[columns["signal_type"][row]],
+            indicator=self.indicators.values[columns["indicator"][row]],
+            status=STATUSES[columns["status"][row]],
+            notes=columns["notes"][row],
+        )
+
+    def entries(self, rows: Sequence[int]) -> List[JournalEntry]:
+        """Materialize several rows"""
+        return [self.entry(int(row)) for row in rows]
@@ -0,0 +1,139 @@
+"""
+Streaming Bias Detector
+
+Live counterpart of TradeJournalAnalyzer.detect_biases: fed one closed
+trade at a time, it keeps a sliding-window deque of recent trade times
+and the current loss streak, and returns a BiasAlert on the trade that
+crosses a threshold. Each update is O(1) amortized, so alerts arrive
+with the fill instead of on the next batch recompute.
+"""
+
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Deque, List, Optional
+
+from .analyzer import (
+    CHASING_LOSSES_RECOMMENDATIONS,
+    LOSS_SEQUENCE_MIN_LENGTH,
+    LOSS_SEQUENCE_TIME_WINDOW_SECONDS,
+    OVERTRADING_MAX_TIME_SPAN_DAYS,
+    OVERTRADING_RECOMMENDATIONS,
+    OVERTRADING_THRESHOLD_TRADES_PER_DAY,
+)
+from .models import BiasAlert, JournalEntry
+
+
+class StreamingBiasDetector:
+    """Per-trade overtrading and loss-chasing alerts
+
+    Each bias alerts once per episode: overtrading re-arms when the window
+    count drops back to the threshold, and loss chasing re-arms when the
+    streak is broken by a win or a gap longer than loss_gap. Trades are
+    expected in time order.
+
+    Example:
+        detector = StreamingBiasDetector()
+        for entry in fills:
+            for alert in detector.update(entry):
+                notify(alert)
+    """
+
+    def __init__(
+        self,
+        max_trades: int = OVERTRADING_THRESHOLD_TRADES_PER_DAY,
+        window: timedelta = timedelta(days=OVERTRADING_MAX_TIME_SPAN_DAYS),
+        loss_streak: int = LOSS_SEQUENCE_MIN_LENGTH,
+        loss_gap: timedelta = timedelta(seconds=LOSS_SEQUENCE_TIME_WINDOW_SECONDS)
+    ):
+        """Initialize the detector
+
+        Args:
+            max_trades: Trades allowed within window before overtrading alerts
+            window: Length of the sliding overtrading window
+            loss_streak: Consecutive losses that trigger a loss-chasing alert
+            loss_gap: Largest time between losses of one streak
+        """
+        if max_trades < 1:
+            raise ValueError(f"max_trades must be positive, got {max_trades}")
+        if loss_streak < 1:
+            raise ValueError(f"loss_streak must be positive, got {loss_streak}")
+        if window <= timedelta(0):
+            raise ValueError(f"window must be positive, got {window}")
+        self.max_trades = max_trades
+        self.window = window
+        self.loss_streak_threshold = loss_streak
+        self.loss_gap = loss_gap
+        self._recent: Deque[datetime] = deque()
+        self._overtrading = False
+        self._loss_streak = 0
+        self._last_loss: Optional[datetime] = None
+
+    @property
+    def trades_in_window(self) -> int:
+        """Closed trades within the window ending at the latest trade"""
+        return len(self._recent)
+
+    @property
+    def loss_streak(self) -> int:
+        """Length of the current loss streak"""
+        return self._loss_streak
+
+    def update(self, entry: JournalEntry) -> List[BiasAlert]:
+        """Feed one trade and return the alerts it triggers
+
+        Trades that are not closed are ignored.
+
+        Args:
+            entry: Journal entry of a filled trade
+
+        Returns:
+            Alerts raised by this trade (usually none)
+        """
+        if not entry.is_closed:
+            return []
+        alerts = []
+        timestamp = entry.timestamp
+
+        # Sliding overtrading window
+        recent = self._recent
+        recent.append(timestamp)
+        horizon = timestamp - self.window
+        while recent[0] <= horizon:
+            recent.popleft()
+        if len(recent) > self.max_trades:
+            if not self._overtrading:
+                self._overtrading = True
+                alerts.append(BiasAlert(
+                    bias_type="overtrading",
+                    severity="high",
+                    message=f"Overtrading detected: {len(recent)} trades within {self.window}",
+                    recommendations=list(OVERTRADING_RECOMMENDATIONS),
+                ))
+        else:
+            self._overtrading = False
+
+        # Loss streak
+        if entry.is_profitable:
+            self._loss_streak = 0
+            self._last_loss = None
+        else:
+            if self._last_loss is None or timestamp - self._last_loss > self.loss_gap:
+                self._loss_streak = 0
+            self._loss_streak += 1
+            self._last_loss = timestamp
+            if self._loss_streak == self.loss_streak_threshold:
+                alerts.append(BiasAlert(
+                    bias_type="chasing_losses",
+                    severity="medium",
+                    message=f"Chasing losses detected: {self._loss_streak} losses in a row",
+                    recommendations=list(CHASING_LOSSES_RECOMMENDATIONS),
+                ))
+
+        return alerts
+
+    def reset(self) -> None:
+        """Forget all state (e.g. at the start of a session)"""
+        self._recent.clear()
+        self._overtrading = False
+        self._loss_streak = 0
+        self._last_loss = None
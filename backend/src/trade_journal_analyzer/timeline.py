@@ -0,0 +1,202 @@
+"""
+Journal Timeline
+
+Keeps the rows of a JournalStore ordered by timestamp as they arrive, so
+time-ordered analyses never sort the journal. In-order arrivals (the
+common case for a live journal) are appended; late arrivals are inserted
+at their bisected position. Loss sequences are found with a vectorized
+run-length pass over the ordered rows, which can also resume from where
+the previous scan stopped.
+"""
+
+from typing import Callable, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+_INITIAL_CAPACITY = 1024
+
+
+class TimestampIndex:
+    """Row numbers sorted by timestamp (ties keep insertion order)"""
+
+    def __init__(self):
+        self._times = np.empty(_INITIAL_CAPACITY, dtype=np.int64)
+        self._rows = np.empty(_INITIAL_CAPACITY, dtype=np.int64)
+        self._size = 0
+        # Incremented whenever a row lands before the end of the order
+        self.reorders = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def times(self) -> np.ndarray:
+        """Timestamps in ascending order"""
+        return self._times[:self._size]
+
+    @property
+    def rows(self) -> np.ndarray:
+        """Row numbers in timestamp order"""
+        return self._rows[:self._size]
+
+    @property
+    def first(self) -> int:
+        """Earliest timestamp in O(1)"""
+        return int(self._times[0])
+
+    @property
+    def last(self) -> int:
+        """Latest timestamp in O(1)"""
+        return int(self._times[self._size - 1])
+
+    def _reserve(self, extra: int) -> None:
+        """Grow both arrays (doubling) to hold extra more rows"""
+        needed = self._size + extra
+        if needed <= len(self._times):
+            return
+        capacity = max(2 * len(self._times), needed)
+        for name in ("_times", "_rows"):
+            grown = np.empty(capacity, dtype=np.int64)
+            grown[:self._size] = getattr(self, name)[:self._size]
+            setattr(self, name, grown)
+
+    def add(self, timestamp: int, row: int) -> None:
+        """Index one row: append if in order, otherwise insert after equal times"""
+        self._reserve(1)
+        size = self._size
+        if size and timestamp < self._times[size - 1]:
+            pos = int(np.searchsorted(self._times[:size], timestamp, side="right"))
+            self._times[pos + 1:size + 1] = self._times[pos:size]
+            self._rows[pos + 1:size + 1] = self._rows[pos:size]
+            self.reorders += 1
+        else:
+            pos = size
+        self._times[pos] = timestamp
+        self._rows[pos] = row
+        self._size = size + 1
+
+    def extend(self, timestamps: np.ndarray, first_row: int) -> None:
+        """Index a batch of consecutive rows starting at first_row
+
+        A batch that is sorted and starts at or after the current last
+        timestamp is appended; otherwise it is sorted and merged in O(n + m).
+        """
+        n = len(timestamps)
+        if n == 0:
+            return
+        rows = np.arange(first_row, first_row + n, dtype=np.int64)
+        if n > 1 and np.any(timestamps[1:] < timestamps[:-1]):
+            order = np.argsort(timestamps, kind="stable")
+            timestamps, rows = timestamps[order], rows[order]
+            in_order = False
+        else:
+            in_order = True
+
+        size = self._size
+        if in_order and (size == 0 or timestamps[0] >= self._times[size - 1]):
+            self._reserve(n)
+            self._times[size:size + n] = timestamps
+            self._rows[size:size + n] = rows
+            self._size = size + n
+            return
+
+        positions = np.searchsorted(self._times[:size], timestamps, side="right")
+        times = np.insert(self._times[:size], positions, timestamps)
+        merged_rows = np.insert(self._rows[:size], positions, rows)
+        capacity = max(len(self._times), len(times))
+        self._times = np.empty(capacity, dtype=np.int64)
+        self._rows = np.empty(capacity, dtype=np.int64)
+        self._times[:len(times)] = times
+        self._rows[:len(times)] = merged_rows
+        self._size = len(times)
+        self.reorders += 1
+
+    def between(self, start: Optional[int] = None, end: Optional[int] = None) -> Tuple[int, int]:
+        """Positions [lo, hi) of timestamps in [start, end) via searchsorted"""
+        times = self.times
+        lo = 0 if start is None else int(np.searchsorted(times, start, side="left"))
+        hi = len(times) if end is None else int(np.searchsorted(times, end, side="left"))
+        return lo, max(lo, hi)
+
+
+def loss_runs(times: np.ndarray, losses: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Find runs of consecutive losses with gaps of at most window
+
+    Args:
+        times: Timestamps in ascending order
+        losses: Whether each (time-ordered) trade is a closed loss
+        window: Largest gap between consecutive losses of one run
+
+    Returns:
+        (starts, stops) positions of each run, stops exclusive
+    """
+    if len(times) == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+    continues = np.zeros(len(times), dtype=bool)
+    continues[1:] = losses[1:] & losses[:-1] & (np.diff(times) <= window)
+    starts = np.flatnonzero(losses & ~continues)
+    # A run ends at the last loss before the next non-continuation
+    ends = np.flatnonzero(losses & ~np.append(continues[1:], False))
+    return starts, ends + 1
+
+
+class LossScan(NamedTuple):
+    """Resumable state of a loss-run scan over a TimestampIndex"""
+    position: int = 0
+    reorders: int = 0
+    completed: int = 0     # finished runs with at least min_length losses
+    run_length: int = 0    # losses in the run still open at position
+    last_loss: int = 0     # time of the last loss of the open run
+
+
+def scan_loss_runs(
+    state: LossScan,
+    index: TimestampIndex,
+    is_loss: Callable[[np.ndarray], np.ndarray],
+    window: int,
+    min_length: int
+) -> LossScan:
+    """Advance a loss-run scan over rows added since state was taken
+
+    Only the new tail of the index is read when every row since the last
+    scan arrived in order; after an out-of-order insert the scan restarts.
+
+    Args:
+        state: Previous scan state (LossScan() to start)
+        index: Timestamp index of the journal
+        is_loss: Returns the closed-loss flag of each given row number
+        window: Largest gap between consecutive losses of one run
+        min_length: Losses a run needs to be counted
+
+    Returns:
+        New state; completed plus (run_length >= min_length) is the
+        number of runs
+    """
+    if state.reorders != index.reorders:
+        state = LossScan(reorders=index.reorders)
+    times = index.times[state.position:]
+    if len(times) == 0:
+        return state
+    tail_losses = is_loss(index.rows[state.position:])
+
+    starts, stops = loss_runs(times, tail_losses, window)
+    lengths = stops - starts
+    completed = state.completed
+    if state.run_length and len(starts):
+        # Merge the carried run with a run that continues it
+        if starts[0] == 0 and times[0] - state.last_loss <= window:
+            lengths[0] += state.run_length
+        elif state.run_length >= min_length:
+            completed += 1
+    elif state.run_length and state.run_length >= min_length:
+        completed += 1
+
+    open_length = 0
+    last_loss = 0
+    if len(starts) and stops[-1] == len(times):
+        open_length = int(lengths[-1])
+        last_loss = int(times[-1])
+        lengths = lengths[:-1]
+    completed += int(np.count_nonzero(lengths >= min_length))
+    return LossScan(len(index), index.reorders, completed, open_length, last_loss)
@@ -6,5 +6,15 @@ A module for managing stock universes with TDD.
 
 from .universe import StockUniverse
 
-__all__ = ["StockUniverse"]
+__all__ = ["StockUniverse", "UniverseAnalyticsRunner", "run_universe_analytics"]
 __version__ = "0.1.0"
+
+_ANALYTICS_EXPORTS = ("UniverseAnalyticsRunner", "run_universe_analytics")
+
+
+def __getattr__(name):
+    # analytics needs numpy and every analyzer; only load it on first use
+    if name in _ANALYTICS_EXPORTS:
+        from . import analytics
+        return getattr(analytics, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
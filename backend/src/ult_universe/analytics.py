@@ -0,0 +1,262 @@
+"""
+Universe Analytics Runner
+
+Runs trend, correlation, beta and supply/demand analysis for every symbol in
+a StockUniverse. Price and volume histories are packed into shared-memory
+matrices once; worker processes attach to them by name and analyze batches
+of rows with the vectorized analyzer paths, so no large arrays are pickled
+per task.
+"""
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Callable, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from market_correlation import MarketCorrelation
+from supply_demand import SupplyDemandAnalyzer
+from .universe import StockUniverse
+
+logger = logging.getLogger(__name__)
+
+# Symbols per task
+DEFAULT_BATCH_SIZE = 256
+
+# (prices, volumes) for one symbol, oldest bar first
+PriceVolume = Tuple[Sequence[float], Sequence[float]]
+PriceVolumeSource = Union[Mapping[str, PriceVolume], Callable[[str], Optional[PriceVolume]]]
+
+RESULT_FIELDS = [
+    ("trend", np.int8),
+    ("correlation", np.float64),
+    ("beta", np.float64),
+    ("last_price", np.float64),
+    ("nearest_support", np.float64),
+    ("nearest_resistance", np.float64),
+    ("zone_count", np.int64),
+]
+
+
+class _SharedMatrix(NamedTuple):
+    """Picklable handle to a shared-memory array"""
+    name: str
+    shape: Tuple[int, ...]
+
+
+def _analyze_rows(prices: np.ndarray, volumes: np.ndarray, index_prices: np.ndarray) -> np.ndarray:
+    """Analyze a block of symbols (rows of the price/volume matrices)"""
+    correlation = MarketCorrelation()
+    supply_demand = SupplyDemandAnalyzer()
+
+    result = np.empty(len(prices), dtype=RESULT_FIELDS)
+    result["trend"] = correlation.detect_trends(prices)
+    result["correlation"] = correlation.calculate_correlations(prices, index_prices)
+    result["beta"] = correlation.calculate_betas(prices, index_prices)
+    result["last_price"] = prices[:, -1]
+
+    n_rows, n_bars = prices.shape
+    zones = supply_demand.analyze_universe(
+        np.repeat(np.arange(n_rows), n_bars), prices.ravel(), volumes.ravel(),
+        current_prices=result["last_price"]
+    )
+    result["nearest_support"] = zones.nearest_support
+    result["nearest_resistance"] = zones.nearest_resistance
+    result["zone_count"] = zones.zone_counts
+
+    return result
+
+
+def _analyze_shared_batch(
+    prices_handle: _SharedMatrix,
+    volumes_handle: _SharedMatrix,
+    index_handle: _SharedMatrix,
+    start: int,
+    stop: int
+) -> np.ndarray:
+    """Worker entry point: attach to shared matrices and analyze rows [start, stop)"""
+    handles = (prices_handle, volumes_handle, index_handle)
+    blocks = [shared_memory.SharedMemory(name=h.name) for h in handles]
+    try:
+        return _analyze_attached(handles, blocks, start, stop)
+    finally:
+        for block in blocks:
+            block.close()
+
+
+def _analyze_attached(
+    handles: Tuple[_SharedMatrix, ...],
+    blocks: List[shared_memory.SharedMemory],
+    start: int,
+    stop: int
+) -> np.ndarray:
+    """Analyze rows of attached blocks; views die with this frame"""
+    prices, volumes, index_prices = (
+        np.ndarray(h.shape, dtype=np.float64, buffer=b.buf) for h, b in zip(handles, blocks)
+    )
+    return _analyze_rows(prices[start:stop], volumes[start:stop], index_prices)
+
+
+class UniverseAnalyticsRunner:
+    """Runs the analyzers over a whole StockUniverse in parallel batches"""
+
+    def __init__(self, max_workers: Optional[int] = None, batch_size: int = DEFAULT_BATCH_SIZE):
+        """Initialize the runner
+
+        Args:
+            max_workers: Worker processes (default: CPU count); 1 runs inline
+            batch_size: Symbols per task
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+
+    def run(
+        self,
+        universe: StockUniverse,
+        source: PriceVolumeSource,
+        index_prices: Sequence[float],
+        lookback: Optional[int] = None
+    ) -> np.ndarray:
+        """Analyze every symbol in the universe
+
+        Each symbol's last `lookback` bars are aligned with the last
+        `lookback` index bars. Symbols missing from the source or with
+        fewer bars are left out of the result.
+
+        Args:
+            universe: Symbols to analyze
+            source: Mapping or callable returning (prices, volumes) per symbol
+            index_prices: Market index prices, oldest first
+            lookback: Number of trailing bars to analyze (default: all index bars)
+
+        Returns:
+            Structured array with one row per analyzed symbol: symbol, trend,
+            correlation, beta, last_price, nearest_support, nearest_resistance
+            and zone_count
+        """
+        index = np.asarray(index_prices, dtype=np.float64)
+        if lookback is None:
+            lookback = len(index)
+        if lookback < 2 or lookback > len(index):
+            raise ValueError(f"lookback must be between 2 and {len(index)}, got {lookback}")
+
+        symbols, histories = self._collect(universe, source, lookback)
+        if not symbols:
+            return self._empty_result()
+
+        n_symbols = len(symbols)
+        bounds = [(start, min(start + self.batch_size, n_symbols))
+                  for start in range(0, n_symbols, self.batch_size)]
+
+        if self.max_workers == 1 or len(bounds) == 1:
+            prices, volumes = self._pack(histories, lookback)
+            stats = _analyze_rows(prices, volumes, index[-lookback:])
+        else:
+            stats = self._run_parallel(histories, index[-lookback:], lookback, bounds)
+
+        result = np.empty(n_symbols, dtype=[("symbol", f"U{max(len(s) for s in symbols)}")] + RESULT_FIELDS)
+        result["symbol"] = symbols
+        for field, _ in RESULT_FIELDS:
+            result[field] = stats[field]
+        return result
+
+    def _collect(
+        self,
+        universe: StockUniverse,
+        source: PriceVolumeSource,
+        lookback: int
+    ) -> Tuple[List[str], List[PriceVolume]]:
+        """Fetch histories for every symbol that has enough bars"""
+        fetch = source.get if isinstance(source, Mapping) else source
+        symbols: List[str] = []
+        histories: List[PriceVolume] = []
+        for symbol in universe.list_symbols():
+            history = fetch(symbol)
+            if history is None or len(history[0]) < lookback or len(history[1]) < lookback:
+                logger.debug("Skipping %s: fewer than %d bars", symbol, lookback)
+                continue
+            symbols.append(symbol)
+            histories.append(history)
+        return symbols, histories
+
+    @staticmethod
+    def _pack(
+        histories: List[PriceVolume],
+        lookback: int,
+        out: Optional[Tuple[np.ndarray, np.ndarray]] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Copy the trailing window of each history into (N, lookback) matrices"""
+        if out is None:
+            out = (np.empty((len(histories), lookback)), np.empty((len(histories), lookback)))
+        prices, volumes = out
+        for row, (row_prices, row_volumes) in enumerate(histories):
+            prices[row] = np.asarray(row_prices, dtype=np.float64)[-lookback:]
+            volumes[row] = np.asarray(row_volumes, dtype=np.float64)[-lookback:]
+        return prices, volumes
+
+    def _run_parallel(
+        self,
+        histories: List[PriceVolume],
+        index: np.ndarray,
+        lookback: int,
+        bounds: List[Tuple[int, int]]
+    ) -> np.ndarray:
+        """Pack histories into shared memory and fan batches out to a process pool"""
+        matrix_shape = (len(histories), lookback)
+        nbytes = int(np.prod(matrix_shape)) * 8
+        blocks: List[shared_memory.SharedMemory] = []
+        try:
+            for size in (nbytes, nbytes, index.nbytes):
+                blocks.append(shared_memory.SharedMemory(create=True, size=max(size, 1)))
+            handles = self._fill_shared(blocks, histories, index, lookback)
+
+            with ProcessPoolExecutor(max_workers=min(self.max_workers, len(bounds))) as pool:
+                futures = [pool.submit(_analyze_shared_batch, *handles, start, stop) for start, stop in bounds]
+                return np.concatenate([f.result() for f in futures])
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+    def _fill_shared(
+        self,
+        blocks: List[shared_memory.SharedMemory],
+        histories: List[PriceVolume],
+        index: np.ndarray,
+        lookback: int
+    ) -> Tuple[_SharedMatrix, _SharedMatrix, _SharedMatrix]:
+        """Write histories and index into the shared blocks
+
+        Views are local to this method so the blocks can be closed afterwards.
+        """
+        matrix_shape = (len(histories), lookback)
+        prices = np.ndarray(matrix_shape, dtype=np.float64, buffer=blocks[0].buf)
+        volumes = np.ndarray(matrix_shape, dtype=np.float64, buffer=blocks[1].buf)
+        np.ndarray(index.shape, dtype=np.float64, buffer=blocks[2].buf)[:] = index
+        self._pack(histories, lookback, out=(prices, volumes))
+        return (
+            _SharedMatrix(blocks[0].name, matrix_shape),
+            _SharedMatrix(blocks[1].name, matrix_shape),
+            _SharedMatrix(blocks[2].name, index.shape),
+        )
+
+    @staticmethod
+    def _empty_result() -> np.ndarray:
+        """Return an empty result table"""
+        return np.empty(0, dtype=[("symbol", "U1")] + RESULT_FIELDS)
+
+
+def run_universe_analytics(
+    universe: StockUniverse,
+    source: PriceVolumeSource,
+    index_prices: Sequence[float],
+    lookback: Optional[int] = None,
+    max_workers: Optional[int] = None
+) -> np.ndarray:
+    """Convenience wrapper around UniverseAnalyticsRunner.run"""
+    return UniverseAnalyticsRunner(max_workers=max_workers).run(universe, source, index_prices, lookback)
+
@@ -5,7 +5,9 @@ Common base class and utilities for all analyzers.
 """
 
 import math
-from typing import List, Any
+from typing import List, Any, Sequence
+
+from .validators import as_finite_float_array
 
 try:
     import numpy as np
@@ -56,15 +58,12 @@ class BaseAnalyzer:
         if math.isnan(value) or math.isinf(value):
             raise ValueError(f"{name} must be finite, got {value}")
     
-    def _validate_list_of_finite_numbers(self, lst: List[Any], name: str = "list") -> None:
-        """Validate that a list contains only finite numbers"""
-        if not isinstance(lst, list):
-            raise ValueError(f"{name} must be a list")
-        for i, value in enumerate(lst):
-            if not isinstance(value, (int, float)):
-                raise ValueError(f"{name}[{i}] must be a number, got {type(value).__name__}")
-            if math.isnan(value) or math.isinf(value):
-                raise ValueError(f"{name}[{i}] must be finite, got {value}")
+    def _validate_list_of_finite_numbers(self, lst: Sequence[Any], name: str = "list") -> None:
+        """Validate that a list or array-like contains only finite numbers"""
+        try:
+            as_finite_float_array(lst, name)
+        except TypeError as e:
+            raise ValueError(str(e)) from None
     
     def _validate_list_length_match(self, list1: List[Any], list2: List[Any], 
                                     name1: str = "list1", name2: str = "list2") -> None:
@@ -0,0 +1,69 @@
+"""
+Durable File Utilities
+
+Crash-safe file primitives shared by the on-disk stores (PriceHistoryStore,
+JournalLog): fsynced appends that drop uncommitted trailing bytes, atomic
+JSON replacement, and read-only memory-mapped column views. Data files
+are always synced before the JSON that counts their rows is replaced, so
+readers only ever see committed rows.
+"""
+
+import json
+import mmap
+import os
+from pathlib import Path
+from typing import Any, Dict, Union
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+PathLike = Union[str, Path]
+
+
+def map_column(path: PathLike, dtype: "np.dtype", rows: int) -> "np.ndarray":
+    """Map the first rows values of a column file as a read-only array
+
+    Uses mmap + np.frombuffer directly; np.memmap resolves paths on every
+    call, which dominates when many columns are opened at once.
+    """
+    with open(path, "rb") as f:
+        buffer = mmap.mmap(f.fileno(), rows * dtype.itemsize, access=mmap.ACCESS_READ)
+    return np.frombuffer(buffer, dtype=dtype, count=rows)
+
+
+def append_file(path: PathLike, committed: int, data: bytes) -> None:
+    """Append data after the first committed bytes of a file, then fsync
+
+    Bytes past committed were left by a write that never reached the
+    index/manifest and are truncated first.
+    """
+    with open(path, "ab") as f:
+        f.truncate(committed)
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def write_json(path: Path, data: Dict[str, Any]) -> None:
+    """Durably replace a JSON file (write, fsync, rename, fsync directory)"""
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    fsync_directory(path.parent)
+
+
+def fsync_directory(path: PathLike) -> None:
+    """Persist a rename or new entry (no-op where directories cannot be opened)"""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
@@ -5,7 +5,103 @@ Common validation functions for input data.
 """
 
 import math
-from typing import List, Any
+from typing import List, Any, Sequence
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+class NonNumericValueError(TypeError):
+    """Raised when an element of a numeric sequence is not a number"""
+
+    def __init__(self, name: str, index: int, value: Any):
+        self.name = name
+        self.index = index
+        self.value = value
+        super().__init__(f"{name}[{index}] must be a number, got {type(value).__name__}")
+
+
+class NonFiniteValueError(ValueError):
+    """Raised when an element of a numeric sequence is NaN or Inf"""
+
+    def __init__(self, name: str, index: int, value: Any):
+        self.name = name
+        self.index = index
+        self.value = value
+        super().__init__(f"{name}[{index}] must be finite, got {value}")
+
+
+def _is_number(value: Any) -> bool:
+    """Check whether a single element counts as a number"""
+    if isinstance(value, (int, float)):
+        return True
+    return HAS_NUMPY and isinstance(value, (np.integer, np.floating, np.bool_))
+
+
+def _check_elements(values: Any, name: str) -> None:
+    """Element-wise check used when values cannot be converted in bulk"""
+    for i, value in enumerate(values):
+        if not _is_number(value):
+            raise NonNumericValueError(name, i, value)
+        if math.isnan(value) or math.isinf(value):
+            raise NonFiniteValueError(name, i, value)
+
+
+def as_finite_float_array(values: Any, name: str = "values") -> Any:
+    """Convert a numeric sequence to a contiguous float64 array of finite values
+
+    Any one-dimensional array-like (list, tuple, array.array, ndarray, pandas
+    Series, buffer-protocol objects) is converted once; float64 buffers that
+    are already contiguous are returned as zero-copy views. Finiteness is
+    checked with a single vectorized call.
+
+    Args:
+        values: One-dimensional numeric sequence
+        name: Name of the sequence for error messages
+
+    Returns:
+        float64 ndarray (or a list when NumPy is unavailable)
+
+    Raises:
+        TypeError: If values is not a sequence
+        NonNumericValueError: If an element is not a number (first offending index)
+        NonFiniteValueError: If an element is NaN or Inf (first offending index)
+    """
+    if isinstance(values, (str, bytes)):
+        raise TypeError(f"{name} must be a sequence of numbers, got {type(values).__name__}")
+
+    if not HAS_NUMPY:
+        if not hasattr(values, "__len__"):
+            raise TypeError(f"{name} must be a sequence of numbers, got {type(values).__name__}")
+        _check_elements(values, name)
+        return list(values)
+
+    try:
+        arr = np.asarray(values)
+    except ValueError:
+        # Ragged or nested content (NumPy rejects the inhomogeneous shape):
+        # report the first element that is not a number instead
+        if not hasattr(values, "__len__"):
+            raise TypeError(f"{name} must be a sequence of numbers, got {type(values).__name__}") from None
+        _check_elements(values, name)
+        raise
+    if arr.ndim == 0:
+        raise TypeError(f"{name} must be a sequence of numbers, got {type(values).__name__}")
+    if arr.ndim != 1:
+        raise ValueError(f"{name} must be one-dimensional, got {arr.ndim} dimensions")
+    if arr.dtype.kind not in "biuf":
+        # Mixed or non-numeric content: locate the offending element
+        _check_elements(arr if isinstance(values, np.ndarray) else values, name)
+    arr = np.ascontiguousarray(arr, dtype=np.float64)
+
+    finite = np.isfinite(arr)
+    if not finite.all():
+        index = int(np.argmin(finite))
+        raise NonFiniteValueError(name, index, float(arr[index]))
+    return arr
 
 
 def validate_finite_number(value: Any, name: str = "value") -> None:
@@ -25,24 +121,18 @@ def validate_finite_number(value: Any, name: str = "value") -> None:
         raise ValueError(f"{name} must be finite, got {value}")
 
 
-def validate_list_of_finite_numbers(lst: List[Any], name: str = "list") -> None:
-    """Validate that a list contains only finite numbers
+def validate_list_of_finite_numbers(lst: Sequence[Any], name: str = "list") -> None:
+    """Validate that a sequence contains only finite numbers
     
     Args:
-        lst: The list to validate
+        lst: The list, ndarray, pandas Series or other array-like to validate
         name: Name of the list for error messages
         
     Raises:
-        TypeError: If list is not a list or contains non-numbers
+        TypeError: If lst is not a sequence or contains non-numbers
         ValueError: If any element is NaN or Inf
     """
-    if not isinstance(lst, list):
-        raise TypeError(f"{name} must be a list, got {type(lst).__name__}")
-    for i, value in enumerate(lst):
-        if not isinstance(value, (int, float)):
-            raise TypeError(f"{name}[{i}] must be a number, got {type(value).__name__}")
-        if math.isnan(value) or math.isinf(value):
-            raise ValueError(f"{name}[{i}] must be finite, got {value}")
+    as_finite_float_array(lst, name)
 
 
 def validate_list_length_match(list1: List[Any], list2: List[Any], 
@@ -0,0 +1,117 @@
+"""
+Tests for the streaming BreakoutDetector
+
+Run with: pytest tests/test_breakout_detector.py -v
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+from supply_demand import BreakoutDetector, SupplyDemandAnalyzer, Zone, ZoneType
+from supply_demand.breakout import RollingWindow
+
+
+def _zones():
+    return [
+        Zone(price=101.0, volume=1000, zone_type=ZoneType.RESISTANCE, strength=0.4),
+        Zone(price=102.0, volume=3000, zone_type=ZoneType.RESISTANCE, strength=0.9),
+        Zone(price=110.0, volume=2000, zone_type=ZoneType.RESISTANCE, strength=1.0),
+        Zone(price=95.0, volume=2000, zone_type=ZoneType.SUPPORT, strength=0.7),
+    ]
+
+
+def _warm_up(detector, symbol="7203", bars=20, price=100.0, volume=1000):
+    for i in range(bars):
+        detector.update(symbol, price + (0.1 if i % 2 else -0.1), volume)
+
+
+class TestRollingWindow:
+    """Test cases for the O(1) rolling statistics"""
+
+    def test_matches_numpy_over_sliding_window(self):
+        """Test mean/std equal a recomputation over the last n values"""
+        rng = np.random.default_rng(0)
+        values = rng.normal(1000, 50, 200)
+        window = RollingWindow(15)
+
+        for i, value in enumerate(values):
+            window.push(value)
+            recent = values[max(0, i - 14):i + 1]
+            assert window.mean == pytest.approx(recent.mean())
+            assert window.std == pytest.approx(recent.std())
+
+    def test_invalid_size(self):
+        """Test a non-positive window is rejected"""
+        with pytest.raises(ValueError):
+            RollingWindow(0)
+
+
+class TestBreakoutDetector:
+    """Test cases for volume-confirmed breakout detection"""
+
+    def test_all_crossed_zones_ranked_by_strength(self):
+        """Test a gap through two resistances reports both, strongest first"""
+        detector = BreakoutDetector(window=20)
+        detector.set_zones("7203", _zones())
+        _warm_up(detector)
+
+        events = detector.update("7203", 103.0, 5000)
+
+        assert [e.zone.price for e in events] == [102.0, 101.0]
+        assert all(e.direction == "bullish" and e.is_confirmed for e in events)
+        assert detector.average_volume("7203") == pytest.approx((19 * 1000 + 5000) / 20)
+
+    def test_low_volume_crossing_is_not_confirmed(self):
+        """Test crossings without a volume surge are dropped unless requested"""
+        detector = BreakoutDetector(window=20)
+        detector.set_zones("7203", _zones())
+        _warm_up(detector)
+
+        assert detector.update("7203", 94.0, 1200) == []
+        detector.update("7203", 96.0, 1000)
+        events = detector.update("7203", 94.0, 1200, include_unconfirmed=True)
+
+        assert len(events) == 1
+        assert events[0].direction == "bearish"
+        assert not events[0].is_confirmed
+
+    def test_only_new_crossings_are_reported(self):
+        """Test a zone already above the previous close is not reported again"""
+        detector = BreakoutDetector(window=5)
+        detector.set_zones("7203", _zones())
+        _warm_up(detector, bars=5)
+
+        assert len(detector.update("7203", 101.5, 5000)) == 1
+        events = detector.update("7203", 102.5, 20000)
+
+        assert [e.zone.price for e in events] == [102.0]
+
+    def test_min_penetration_uses_volatility(self):
+        """Test small moves relative to volatility are not confirmed"""
+        detector = BreakoutDetector(window=20, min_penetration=5.0)
+        detector.set_zones("7203", _zones())
+        _warm_up(detector)
+
+        assert detector.update("7203", 101.05, 5000) == []
+        assert detector.volatility("7203") > 0
+
+    def test_uses_supplied_timestamp_and_zone_table(self):
+        """Test ZoneTable input and event timestamps"""
+        analyzer = SupplyDemandAnalyzer()
+        table = analyzer.identify_zones({98.0: 8000, 105.0: 6000}, current_price=100.0)
+        detector = BreakoutDetector(window=3)
+        detector.set_zones("6758", table)
+        stamp = datetime(2024, 1, 4, 15, 0)
+        for _ in range(3):
+            detector.update("6758", 100.0, 100)
+
+        events = detector.update("6758", 106.0, 1000, timestamp=stamp)
+
+        assert len(events) == 1
+        assert events[0].zone.price == 105.0
+        assert events[0].timestamp == stamp
@@ -249,3 +249,73 @@ class TestMarketCorrelation:
         
         result = analyzer.calculate_beta([100], [1000])
         assert result == 1.0  # Default fallback
+
+    def test_generate_composite_signals_matches_single(self):
+        """Test batch composite signals agree with the per-symbol API"""
+        analyzer = MarketCorrelation()
+
+        trends, signals, correlations = [], [], []
+        for trend in MarketTrend:
+            for signal in ["buy", "SELL", "Hold"]:
+                for correlation in [0.1, 0.8]:
+                    trends.append(trend)
+                    signals.append(signal)
+                    correlations.append(correlation)
+
+        result = analyzer.generate_composite_signals(trends, signals, correlations)
+
+        assert len(result) == len(signals)
+        for row, trend, signal, correlation in zip(result, trends, signals, correlations):
+            expected = analyzer.generate_composite_signal(trend, signal, correlation)
+            assert row["recommendation"] == expected["recommendation"]
+            assert row["confidence"] == expected["confidence"]
+            assert row["reasoning"] == expected["reasoning"]
+            assert row["market_trend"] == expected["market_trend"]
+            assert row["individual_signal"] == expected["individual_signal"]
+
+    def test_generate_composite_signals_integer_trends(self):
+        """Test batch composite signals accept encoded trend values"""
+        import numpy as np
+        analyzer = MarketCorrelation()
+
+        result = analyzer.generate_composite_signals(
+            np.array([1, -1]), np.array(["buy", "buy"]), np.array([0.8, 0.3])
+        )
+
+        assert result["recommendation"].tolist() == ["buy", "cautious_buy"]
+
+    def test_generate_composite_signals_length_mismatch(self):
+        """Test batch composite signals reject mismatched inputs"""
+        analyzer = MarketCorrelation()
+
+        with pytest.raises(ValueError, match="same length"):
+            analyzer.generate_composite_signals([MarketTrend.BULLISH], ["buy", "sell"], [0.5])
+
+    def test_correlation_reports_offending_index(self):
+        """Test that validation errors report the index in the combined series"""
+        analyzer = MarketCorrelation()
+
+        with pytest.raises(ValueError, match="at index 4"):
+            analyzer.calculate_correlation([100, 102, 104], [1000, float('nan'), 1040])
+        with pytest.raises(ValueError, match="got str at index 1"):
+            analyzer.calculate_correlation([100, "102", 104], [1000, 1020, 1040])
+
+    def test_correlation_accepts_ndarray_and_series(self):
+        """Test that ndarrays and pandas Series are accepted without tolist()"""
+        import numpy as np
+        import pandas as pd
+        analyzer = MarketCorrelation()
+
+        stock_prices = np.array([100.0, 102.0, 104.0, 106.0, 108.0])
+        index_prices = pd.Series([1000.0, 1020.0, 1040.0, 1060.0, 1080.0])
+
+        assert analyzer.calculate_correlation(stock_prices, index_prices) == pytest.approx(1.0)
+        assert analyzer.calculate_beta(stock_prices, pd.Series([100.0, 101.0, 102.0, 103.0, 104.0])) > 1.0
+        assert analyzer.detect_trend(index_prices) == MarketTrend.BULLISH
+
+    def test_correlation_rejects_non_sequences(self):
+        """Test that scalars and strings are rejected"""
+        analyzer = MarketCorrelation()
+
+        with pytest.raises(ValueError, match="array-like"):
+            analyzer.calculate_correlation("100", [1000])
@@ -0,0 +1,50 @@
+"""
+Durable File Utilities Tests
+
+This module tests the crash-safe file primitives shared by the stores:
+- Appends that drop uncommitted trailing bytes
+- Atomic JSON replacement
+- Read-only memory-mapped column views
+"""
+
+import json
+
+import numpy as np
+import pytest
+from utils.durable_files import append_file, map_column, write_json
+
+
+class TestDurableFiles:
+    """Test cases for the durable file helpers"""
+
+    def test_append_truncates_uncommitted_bytes(self, tmp_path):
+        """Test bytes past the committed length are replaced by the new data"""
+        path = tmp_path / "close.bin"
+        append_file(path, 0, np.arange(3, dtype=np.float64).tobytes())
+        # A torn write: half a value that never reached the index
+        with open(path, "ab") as f:
+            f.write(b"\x00" * 4)
+
+        append_file(path, 3 * 8, np.array([3.0]).tobytes())
+
+        assert map_column(path, np.dtype(np.float64), 4).tolist() == [0.0, 1.0, 2.0, 3.0]
+
+    def test_map_column_is_read_only_prefix(self, tmp_path):
+        """Test only the requested rows are mapped, as a read-only view"""
+        path = tmp_path / "timestamp.bin"
+        append_file(path, 0, np.arange(10, dtype=np.int64).tobytes())
+
+        column = map_column(path, np.dtype(np.int64), 4)
+
+        assert column.tolist() == [0, 1, 2, 3]
+        with pytest.raises(ValueError):
+            column[0] = 99
+
+    def test_write_json_replaces_without_leftovers(self, tmp_path):
+        """Test JSON is replaced in place and the tmp file is renamed away"""
+        path = tmp_path / "index.json"
+        write_json(path, {"rows": 1})
+        write_json(path, {"rows": 2, "name": "日本語"})
+
+        assert json.loads(path.read_text(encoding="utf-8")) == {"rows": 2, "name": "日本語"}
+        assert [p.name for p in tmp_path.iterdir()] == ["index.json"]
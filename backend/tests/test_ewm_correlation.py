@@ -0,0 +1,116 @@
+"""
+Exponentially Weighted Correlation Tests
+
+This module tests EwmCorrelation which handles:
+- Recursive EW correlation and beta updates
+- Vectorized history fitting against several indices
+- Feeding EW correlation into composite signals
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from market_correlation import EwmCorrelation, MarketCorrelation, MarketTrend, simple_returns
+
+
+def _random_returns(rows: int, cols: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return rng.normal(0, 0.01, size=(rows, cols))
+
+
+class TestEwmCorrelation:
+    """Test cases for EwmCorrelation class"""
+
+    def test_matches_pandas_ewm(self):
+        """Test EW correlation and beta agree with pandas' ewm statistics"""
+        stock = _random_returns(200, 1, seed=1)[:, 0]
+        index = 0.5 * stock + _random_returns(200, 1, seed=2)[:, 0]
+
+        tracker = EwmCorrelation(half_life=10).fit(stock, index)
+
+        s, i = pd.Series(stock), pd.Series(index)
+        expected_corr = s.ewm(halflife=10).corr(i).iloc[-1]
+        expected_beta = s.ewm(halflife=10).cov(i).iloc[-1] / i.ewm(halflife=10).var().iloc[-1]
+        assert tracker.correlation[0, 0] == pytest.approx(expected_corr)
+        assert tracker.beta[0, 0] == pytest.approx(expected_beta)
+
+    def test_fit_equals_sequential_updates(self):
+        """Test that fitting a history equals updating bar by bar"""
+        stocks = _random_returns(50, 4, seed=3)
+        indices = _random_returns(50, 3, seed=4)
+
+        fitted = EwmCorrelation(half_life=5).fit(stocks[:30], indices[:30]).fit(stocks[30:], indices[30:])
+        streamed = EwmCorrelation(half_life=5)
+        for x, y in zip(stocks, indices):
+            streamed.update(x, y)
+
+        assert fitted.count == streamed.count == 50
+        np.testing.assert_allclose(fitted.correlation, streamed.correlation)
+        np.testing.assert_allclose(fitted.beta, streamed.beta)
+
+    def test_multi_index_shapes_and_names(self):
+        """Test correlation against several named indices at once"""
+        tracker = EwmCorrelation(half_life=10, index_names=["TOPIX", "N225", "SPX"])
+        tracker.fit(_random_returns(100, 6), _random_returns(100, 3, seed=5))
+
+        assert tracker.correlation.shape == (6, 3)
+        assert tracker.correlation_with("N225").shape == (6,)
+        with pytest.raises(KeyError):
+            tracker.beta_with("DAX")
+
+    def test_shape_mismatch_raises(self):
+        """Test that changing the universe shape is rejected"""
+        tracker = EwmCorrelation().fit(_random_returns(10, 2), _random_returns(10, 1))
+
+        with pytest.raises(ValueError, match="Expected 2 stocks"):
+            tracker.update(np.zeros(3), np.zeros(1))
+
+    def test_recent_regime_dominates(self):
+        """Test that EW correlation follows a regime change faster than Pearson"""
+        rng = np.random.default_rng(7)
+        index = 1000 * np.cumprod(1 + rng.normal(0, 0.01, 300))
+        noise = 100 * np.cumprod(1 + rng.normal(0, 0.01, 300))
+        index_returns = simple_returns(index)
+        # Independent for 250 bars, then tracks the index closely
+        stock_returns = np.concatenate([simple_returns(noise)[:250], index_returns[250:]])
+        stock = 100 * np.concatenate([[1.0], np.cumprod(1 + stock_returns)])
+
+        analyzer = MarketCorrelation()
+        ew_corr = analyzer.calculate_ewm_correlation(stock, index, half_life=10)
+        full_tracker = EwmCorrelation(half_life=1e9).fit(stock_returns, index_returns)
+
+        assert ew_corr > 0.9
+        assert ew_corr > full_tracker.correlation[0, 0]
+
+    def test_fit_ewm_from_named_index_prices(self):
+        """Test fitting from prices with a mapping of index names"""
+        analyzer = MarketCorrelation()
+        stock = [100.0, 101.0, 103.0, 102.0, 104.0, 106.0]
+        indices = {
+            "TOPIX": [2000.0, 2010.0, 2030.0, 2020.0, 2040.0, 2060.0],
+            "SPX": [5000.0, 4990.0, 5000.0, 5010.0, 4995.0, 5005.0],
+        }
+
+        tracker = analyzer.fit_ewm(stock, indices, half_life=3)
+
+        assert tracker.index_names == ["TOPIX", "SPX"]
+        assert tracker.correlation_with("TOPIX")[0] > tracker.correlation_with("SPX")[0]
+
+    def test_ewm_correlation_feeds_composite_signals(self):
+        """Test composite signals driven by EW correlation"""
+        tracker = EwmCorrelation(half_life=10).fit(_random_returns(100, 3), _random_returns(100, 1, seed=9))
+        analyzer = MarketCorrelation()
+
+        result = analyzer.generate_composite_signals(
+            [MarketTrend.BEARISH] * 3, ["buy"] * 3, tracker.correlation_with(0)
+        )
+
+        # Independent series have low correlation -> individual strength
+        assert set(result["recommendation"]) == {"cautious_buy"}
+
+    def test_ewm_fallbacks_for_short_series(self):
+        """Test defaults for series that are too short"""
+        analyzer = MarketCorrelation()
+
+        assert analyzer.calculate_ewm_correlation([100, 101], [1000, 1010]) == 0.0
+        assert analyzer.calculate_ewm_beta([100], [1000]) == 1.0
@@ -170,6 +170,24 @@ class TestTradeJournalAnalyzer:
         assert len(patterns) == 0
         assert len(biases) == 0
 
+    def test_frozen_entries_are_analyzed_like_entries(self):
+        """Test FrozenJournalEntry is accepted and hashable"""
+        from trade_journal_analyzer import FrozenJournalEntry
+        from trade_journal_analyzer.models import TradeStatus
+        analyzer = TradeJournalAnalyzer()
+        entry = FrozenJournalEntry(
+            id="f1", timestamp=datetime(2026, 1, 5, 10, 0), symbol="7203",
+            entry_price=100.0, exit_price=105.0, profit=5.0, profit_percent=5.0,
+            signal_type="RSI", indicator="RSI", status=TradeStatus.CLOSED
+        )
+
+        analyzer.add_entry(entry)
+
+        assert entry in {entry}
+        assert not hasattr(entry, "__dict__")
+        assert entry.is_closed and entry.is_profitable
+        assert analyzer.calculate_win_rate() == 100.0
+
     def _create_entry(
         self,
         timestamp: datetime = None,
@@ -204,3 +222,702 @@ class TestTradeJournalAnalyzer:
             indicator=indicator,
             status=status_enum
         )
+
+
+def _random_entries(n: int, seed: int = 0):
+    """Random closed/open entries across a few symbols, hours and signals"""
+    import random
+    from trade_journal_analyzer.models import TradeStatus
+    rng = random.Random(seed)
+    base = datetime(2026, 1, 5, 8, 0)
+    entries = []
+    for i in range(n):
+        profit = rng.choice([-1, 1]) * rng.randint(1, 500)
+        entries.append(JournalEntry(
+            id=f"e{i}",
+            timestamp=base + timedelta(minutes=rng.randint(0, 60 * 24 * 20)),
+            symbol=rng.choice(["7203", "6758", "9984", "AAPL"]),
+            entry_price=100.0,
+            exit_price=100.0 + profit / 100,
+            profit=float(profit),
+            profit_percent=profit / 100,
+            signal_type=rng.choice(["RSI", "MACD", "MANUAL"]),
+            indicator=rng.choice(["RSI", "SMA", "PRICE"]),
+            status=rng.choice([TradeStatus.CLOSED, TradeStatus.CLOSED, TradeStatus.OPEN]),
+            notes="",
+        ))
+    return entries
+
+
+class TestColumnarJournal:
+    """Test cases for the columnar journal backend"""
+
+    def test_matches_list_backend(self):
+        """Test every aggregate equals the list-of-entries implementation"""
+        columnar = TradeJournalAnalyzer(columnar=True)
+        plain = TradeJournalAnalyzer(columnar=False)
+        for entry in _random_entries(500):
+            columnar.add_entry(entry)
+            plain.add_entry(entry)
+
+        assert columnar.calculate_win_rate() == pytest.approx(plain.calculate_win_rate())
+        expected_stats = plain.get_performance_by_symbol()
+        actual_stats = columnar.get_performance_by_symbol()
+        assert list(actual_stats) == list(expected_stats)
+        for symbol, stats in expected_stats.items():
+            assert actual_stats[symbol] == pytest.approx(stats)
+        # Order among equal win rates is unspecified, so compare by description
+        expected = {p.description: (p.win_rate, p.total_trades, p.avg_profit_percent)
+                    for p in plain.extract_patterns()}
+        actual_patterns = columnar.extract_patterns()
+        actual = {p.description: (p.win_rate, p.total_trades, p.avg_profit_percent)
+                  for p in actual_patterns}
+        assert actual.keys() == expected.keys()
+        for description, values in expected.items():
+            assert actual[description] == pytest.approx(values)
+        win_rates = [p.win_rate for p in actual_patterns]
+        assert win_rates == sorted(win_rates, reverse=True)
+        assert [b.message for b in columnar.detect_biases()] == [b.message for b in plain.detect_biases()]
+
+    def test_entries_round_trip(self):
+        """Test entries materialized from columns equal the originals"""
+        analyzer = TradeJournalAnalyzer(columnar=True)
+        entries = _random_entries(50, seed=1)
+        for entry in entries:
+            analyzer.add_entry(entry)
+
+        assert len(analyzer) == 50
+        assert analyzer.get_entries() == entries
+
+    def test_columns_grow_past_initial_capacity(self):
+        """Test appending beyond the initial column capacity keeps all rows"""
+        from trade_journal_analyzer.store import JournalStore
+        store = JournalStore()
+        entries = _random_entries(3000, seed=2)
+        for entry in entries:
+            store.append(entry)
+
+        assert len(store) == 3000
+        assert store.entry(2999) == entries[2999]
+        assert len(store.symbols) == 4
+
+
+class TestJournalAggregates:
+    """Test cases for incrementally maintained journal totals"""
+
+    def test_totals_follow_each_added_entry(self):
+        """Test win rate and per-group totals update as entries stream in"""
+        from trade_journal_analyzer.models import TradeStatus
+        analyzer = TradeJournalAnalyzer()
+        entries = _random_entries(200, seed=3)
+
+        for i, entry in enumerate(entries, start=1):
+            analyzer.add_entry(entry)
+            closed = [e for e in entries[:i] if e.status == TradeStatus.CLOSED]
+            wins = sum(1 for e in closed if e.profit > 0)
+            expected = wins / len(closed) * 100 if closed else 0.0
+            assert analyzer.calculate_win_rate() == pytest.approx(expected)
+
+        stats = analyzer.get_performance_by_symbol()
+        closed = [e for e in entries if e.status == TradeStatus.CLOSED]
+        for symbol, row in stats.items():
+            trades = [e for e in closed if e.symbol == symbol]
+            assert row["total_trades"] == len(trades)
+            assert row["total_profit"] == pytest.approx(sum(e.profit for e in trades))
+            assert row["wins"] + row["losses"] == len(trades)
+
+    def test_add_columns_matches_per_entry_updates(self):
+        """Test the vectorized batch update equals adding entries one by one"""
+        import json
+        import numpy as np
+        from trade_journal_analyzer.aggregates import DIMENSIONS, JournalAggregates
+        from trade_journal_analyzer.models import TradeStatus
+        entries = _random_entries(300, seed=4)
+        keys = [(e.timestamp.hour, e.symbol, e.signal_type, e.indicator) for e in entries]
+        one_by_one = JournalAggregates()
+        for e, key in zip(entries, keys):
+            one_by_one.add(key, e.is_closed, e.profit, e.profit_percent)
+
+        columns = {}
+        for dimension, values in zip(DIMENSIONS, zip(*keys)):
+            labels = sorted(set(values))
+            columns[dimension] = (np.array([labels.index(v) for v in values]), labels)
+        batch = JournalAggregates()
+        batch.add_columns(
+            columns,
+            np.array([e.status == TradeStatus.CLOSED for e in entries]),
+            np.array([e.profit for e in entries]),
+            np.array([e.profit_percent for e in entries]),
+        )
+
+        assert (batch.closed, batch.wins) == (one_by_one.closed, one_by_one.wins)
+        for dimension in DIMENSIONS:
+            expected = one_by_one.groups[dimension]
+            assert list(batch.groups[dimension]) == list(expected)
+            for key, stats in expected.items():
+                assert batch.groups[dimension][key] == pytest.approx(stats)
+        # Both paths hold plain Python numbers, so snapshots encode as JSON
+        json.dumps(batch.to_state())
+        json.dumps(one_by_one.to_state())
+
+    def test_patterns_cover_signal_and_indicator(self):
+        """Test winning signal types and indicators become patterns"""
+        analyzer = TradeJournalAnalyzer()
+        entries = _random_entries(400, seed=12)
+        for entry in entries:
+            if entry.signal_type == "MACD":
+                entry.profit = abs(entry.profit)
+        analyzer.add_entries(entries)
+
+        patterns = {p.description: p for p in analyzer.extract_patterns()}
+
+        macd = patterns["MACD signal trades"]
+        assert macd.win_rate == 100.0
+        assert macd.factors == {"signal_type": "MACD"}
+        closed_macd = [e for e in entries if e.signal_type == "MACD" and e.is_closed]
+        assert macd.total_trades == len(closed_macd)
+        assert all(p.win_rate > 50 for p in patterns.values() if "indicator" in p.factors)
+
+
+def _as_record(entry):
+    """CSV-style record of an entry (all values strings)"""
+    return {
+        "id": entry.id,
+        "timestamp": entry.timestamp.isoformat(),
+        "symbol": entry.symbol,
+        "entry_price": str(entry.entry_price),
+        "exit_price": str(entry.exit_price),
+        "profit": str(entry.profit),
+        "profit_percent": str(entry.profit_percent),
+        "signal_type": entry.signal_type,
+        "indicator": entry.indicator,
+        "status": entry.status.value,
+        "notes": entry.notes,
+    }
+
+
+class TestBulkIngestion:
+    """Test cases for the bulk loading APIs"""
+
+    @pytest.mark.parametrize("columnar", [True, False])
+    def test_add_entries_matches_add_entry(self, columnar):
+        """Test a chunked bulk load equals adding entries one by one"""
+        entries = _random_entries(700, seed=5)
+        one_by_one = TradeJournalAnalyzer(columnar=columnar)
+        for entry in entries:
+            one_by_one.add_entry(entry)
+        bulk = TradeJournalAnalyzer(columnar=columnar)
+
+        assert bulk.add_entries(iter(entries), chunk_size=256) == 700
+        assert bulk.get_entries() == entries
+        assert bulk.calculate_win_rate() == pytest.approx(one_by_one.calculate_win_rate())
+        expected_stats = one_by_one.get_performance_by_symbol()
+        actual_stats = bulk.get_performance_by_symbol()
+        assert list(actual_stats) == list(expected_stats)
+        for symbol, stats in expected_stats.items():
+            assert actual_stats[symbol] == pytest.approx(stats)
+        assert ({p.description for p in bulk.extract_patterns()}
+                == {p.description for p in one_by_one.extract_patterns()})
+
+    def test_batch_invalidates_cache_once(self):
+        """Test the entries version is bumped once per bulk call"""
+        analyzer = TradeJournalAnalyzer()
+        analyzer.add_entries(_random_entries(100, seed=6), chunk_size=10)
+        assert analyzer._entries_version == 1
+        first = analyzer.extract_patterns()
+
+        analyzer.add_entries(_random_entries(100, seed=7))
+        assert analyzer._entries_version == 2
+        assert analyzer.extract_patterns() is not first
+        assert analyzer.add_entries([]) == 0
+        assert analyzer._entries_version == 2
+
+    @pytest.mark.parametrize("columnar", [True, False])
+    def test_load_from_csv(self, tmp_path, columnar):
+        """Test CSV rows (strings) are parsed into typed entries"""
+        import csv
+        entries = _random_entries(120, seed=8)
+        path = tmp_path / "journal.csv"
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=list(_as_record(entries[0])))
+            writer.writeheader()
+            writer.writerows(_as_record(entry) for entry in entries)
+
+        analyzer = TradeJournalAnalyzer(columnar=columnar)
+        assert analyzer.load_from_csv(str(path), chunk_size=50) == 120
+        assert analyzer.get_entries() == entries
+
+    def test_records_keep_aware_timestamps(self):
+        """Test timezone-aware timestamps keep their offset and local hour"""
+        from datetime import timezone
+        record = _as_record(_random_entries(1, seed=9)[0])
+        record["timestamp"] = "2026-01-05T10:30:00+09:00"
+        del record["notes"]
+        analyzer = TradeJournalAnalyzer(columnar=True)
+
+        analyzer.load_from_records([record, dict(record, timestamp=datetime(2026, 1, 5, 11, tzinfo=timezone.utc))])
+
+        entries = analyzer.get_entries()
+        tokyo = timezone(timedelta(hours=9))
+        assert [e.timestamp for e in entries] == [
+            datetime(2026, 1, 5, 10, 30, tzinfo=tokyo), datetime(2026, 1, 5, 11, tzinfo=timezone.utc)
+        ]
+        assert [e.timestamp.utcoffset() for e in entries] == [timedelta(hours=9), timedelta(0)]
+        assert entries[0].notes == ""
+
+    @pytest.mark.parametrize("columnar", [True, False])
+    def test_mixed_offsets_order_by_instant(self, columnar):
+        """Test aware timestamps with different offsets sort, filter and group like datetimes"""
+        from datetime import timezone
+        from trade_journal_analyzer.models import TradeStatus
+        new_york = timezone(timedelta(hours=-5))
+        tokyo = timezone(timedelta(hours=9))
+        entries = _random_entries(6, seed=26)
+        # Tokyo 09:00 is 00:00 UTC; New York 20:00 the previous day is 01:00 UTC
+        times = [
+            datetime(2026, 1, 6, 9, 0, tzinfo=tokyo),
+            datetime(2026, 1, 5, 20, 0, tzinfo=new_york),
+            datetime(2026, 1, 6, 0, 30, tzinfo=timezone.utc),
+            datetime(2026, 1, 6, 10, 0, tzinfo=tokyo),
+            datetime(2026, 1, 5, 19, 0, tzinfo=new_york),
+            datetime(2026, 1, 6, 2, 0, tzinfo=timezone.utc),
+        ]
+        for entry, timestamp in zip(entries, times):
+            entry.timestamp = timestamp
+            entry.status = TradeStatus.CLOSED
+        analyzer = TradeJournalAnalyzer(columnar=columnar)
+        analyzer.add_entries(entries[:3])
+        for entry in entries[3:]:
+            analyzer.add_entry(entry)
+
+        assert analyzer.get_entries() == entries
+        assert [e.timestamp.utcoffset() for e in analyzer.get_entries()] == [t.utcoffset() for t in times]
+        start = datetime(2026, 1, 6, 0, 15, tzinfo=timezone.utc)
+        end = datetime(2026, 1, 6, 1, 30, tzinfo=timezone.utc)
+        assert analyzer.get_entries(start, end) == [entries[1], entries[2], entries[3]]
+        # Hours and weekdays are local wall-clock time, as in timestamp.hour
+        assert set(analyzer._aggregates.by_hour) == {t.hour for t in times}
+        weekdays = {p.factors["weekday"] for p in analyzer.mine_patterns(min_trades=1, min_win_rate=-1)
+                    if set(p.factors) == {"weekday"}}
+        assert weekdays == {t.strftime("%A") for t in times}
+
+    def test_invalid_records_raise(self):
+        """Test missing fields and unknown statuses are rejected"""
+        record = _as_record(_random_entries(1, seed=10)[0])
+        analyzer = TradeJournalAnalyzer(columnar=True)
+        with pytest.raises(ValueError, match="status"):
+            analyzer.load_from_records([dict(record, status="DONE")])
+        with pytest.raises(ValueError, match="symbol"):
+            analyzer.load_from_records([{k: v for k, v in record.items() if k != "symbol"}])
+        assert len(analyzer) == 0
+
+    def test_load_from_arrow(self):
+        """Test an Arrow table loads through record batches"""
+        pa = pytest.importorskip("pyarrow")
+        entries = _random_entries(80, seed=11)
+        records = [_as_record(entry) for entry in entries]
+        for record, entry in zip(records, entries):
+            record["timestamp"] = entry.timestamp
+        analyzer = TradeJournalAnalyzer(columnar=True)
+
+        assert analyzer.load_from_arrow(pa.Table.from_pylist(records), chunk_size=30) == 80
+        assert analyzer.get_entries() == entries
+
+
+class TestPatternMining:
+    """Test cases for multi-dimensional pattern mining"""
+
+    @staticmethod
+    def _brute_force(entries, dimensions, min_trades):
+        """Count every combination of dimension values directly"""
+        from itertools import combinations
+        days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+        values = {
+            "symbol": lambda e: e.symbol,
+            "signal_type": lambda e: e.signal_type,
+            "indicator": lambda e: e.indicator,
+            "weekday": lambda e: days[e.timestamp.weekday()],
+            "hour": lambda e: e.timestamp.hour,
+        }
+        totals = {}
+        for e in entries:
+            if not e.is_closed:
+                continue
+            for size in range(1, dimensions + 1):
+                for combo in combinations(values, size):
+                    key = tuple((name, values[name](e)) for name in combo)
+                    trades, wins = totals.get(key, (0, 0))
+                    totals[key] = (trades + 1, wins + (e.profit > 0))
+        return {key: counts for key, counts in totals.items() if counts[0] >= min_trades}
+
+    @pytest.mark.parametrize("columnar", [True, False])
+    def test_matches_brute_force_counts(self, columnar):
+        """Test every frequent cell is found with exact counts"""
+        entries = _random_entries(600, seed=13)
+        analyzer = TradeJournalAnalyzer(columnar=columnar)
+        analyzer.add_entries(entries)
+
+        patterns = analyzer.mine_patterns(min_trades=8, max_dimensions=3, min_win_rate=0)
+
+        expected = self._brute_force(entries, 3, 8)
+        actual = {tuple(p.factors.items()): (p.total_trades, round(p.win_rate * p.total_trades / 100))
+                  for p in patterns}
+        assert actual == {key: counts for key, counts in expected.items() if counts[1] > 0}
+
+    def test_patterns_are_ranked_and_filtered(self):
+        """Test win-rate filtering, ranking and readable descriptions"""
+        analyzer = TradeJournalAnalyzer()
+        entries = _random_entries(1500, seed=14)
+        for entry in entries:
+            if entry.symbol == "7203" and entry.timestamp.hour == 9:
+                entry.profit = abs(entry.profit)
+        analyzer.add_entries(entries)
+
+        patterns = analyzer.mine_patterns(min_trades=3)
+
+        assert all(p.win_rate > 50 and p.total_trades >= 3 for p in patterns)
+        assert [p.win_rate for p in patterns] == sorted((p.win_rate for p in patterns), reverse=True)
+        cell = next(p for p in patterns if p.factors == {"symbol": "7203", "hour": 9})
+        assert cell.description == "7203 + 09:00-10"
+        assert cell.win_rate == 100.0
+        assert max(len(p.factors) for p in patterns) == 2
+
+    def test_sparse_key_space_is_grouped(self):
+        """Test cells are found when the key space exceeds the dense limit"""
+        import numpy as np
+        from trade_journal_analyzer.cube import mine_cube
+        symbols = np.array([0, 0, 0, 4999, 4999, 4999, 7])
+        signals = np.array([0, 0, 0, 999, 999, 999, 1])
+        cells = mine_cube(
+            {"symbol": (symbols, list(range(5000))), "signal_type": (signals, list(range(1000)))},
+            np.array([True, True, False, True, True, True, False]),
+            np.ones(7),
+            min_trades=3,
+        )
+        pairs = {cell.values: (cell.trades, cell.wins) for cell in cells if len(cell.dimensions) == 2}
+        assert pairs == {(0, 0): (3, 2), (4999, 999): (3, 3)}
+
+
+class TestPatternCache:
+    """Test cases for the version-keyed pattern cache"""
+
+    def test_cached_until_journal_changes(self):
+        """Test results are reused for one version and recomputed after a change"""
+        analyzer = TradeJournalAnalyzer()
+        analyzer.add_entries(_random_entries(200, seed=15))
+
+        first = analyzer.extract_patterns()
+        assert analyzer.extract_patterns() is first
+        assert analyzer.extract_patterns(min_trades=5) is not first
+
+        analyzer.add_entry(_random_entries(1, seed=16)[0])
+        assert analyzer.extract_patterns() is not first
+
+    def test_cache_is_bounded(self):
+        """Test stale versions are dropped and the LRU size is capped"""
+        from trade_journal_analyzer.memo import VersionedCache
+        cache = VersionedCache(max_size=2)
+        cache.put("a", 1, [1])
+        cache.put("b", 1, [2])
+        assert cache.get("a", 1) == [1]
+        cache.put("c", 1, [3])
+
+        assert cache.get("b", 1) is None  # least recently used
+        assert cache.get("a", 1) == [1]
+        assert cache.get("a", 2) is None  # new version clears the cache
+        assert len(cache) == 0
+
+    def test_iter_patterns_yields_partial_results(self):
+        """Test patterns can be pulled one analysis at a time and are reused"""
+        analyzer = TradeJournalAnalyzer()
+        analyzer.add_entries(_random_entries(300, seed=17))
+        patterns = analyzer.iter_patterns()
+
+        first = next(patterns)
+        assert "hour_range" in first.factors
+        assert len(analyzer._patterns_cache) == 1  # only the time analysis ran
+
+        ranked = analyzer.extract_patterns()
+        assert {p.description for p in ranked} == {p.description for p in analyzer.iter_patterns()}
+        assert first in ranked
+
+
+class TestTimeOrder:
+    """Test cases for the insertion-time ordering and loss-run detection"""
+
+    def test_index_matches_stable_sort(self):
+        """Test in-order, late and batched arrivals keep a stable time order"""
+        import numpy as np
+        from trade_journal_analyzer.timeline import TimestampIndex
+        rng = np.random.default_rng(0)
+        times = np.concatenate([np.arange(0, 500, 5), rng.integers(0, 600, 200)])
+        index = TimestampIndex()
+        for row, t in enumerate(times[:150].tolist()):
+            index.add(t, row)
+        index.extend(times[150:250], 150)
+        index.extend(np.sort(times[250:]) + 10_000, 250)
+        expected = np.concatenate([times[:250], np.sort(times[250:]) + 10_000])
+
+        assert index.rows.tolist() == np.argsort(expected, kind="stable").tolist()
+        assert (index.first, index.last) == (int(expected.min()), int(expected.max()))
+        assert index.reorders > 0
+
+    def test_incremental_loss_scan_matches_full_scan(self):
+        """Test resumed scans count the same sequences as a full rescan"""
+        from trade_journal_analyzer.models import TradeStatus
+        columnar = TradeJournalAnalyzer(columnar=True)
+        plain = TradeJournalAnalyzer(columnar=False)
+        base = datetime(2026, 1, 5, 9, 0)
+        entries = []
+        for i, minutes in enumerate([0, 10, 20, 100, 105, 300, 310, 315, 320, 500, 510, 900, 905, 2000]):
+            entries.append(self._loss(f"l{i}", base + timedelta(minutes=minutes), TradeStatus.CLOSED))
+        entries.insert(6, self._loss("w", base + timedelta(minutes=309), TradeStatus.CLOSED, profit=5.0))
+        late = self._loss("late", base + timedelta(minutes=101), TradeStatus.CLOSED)
+
+        for start in range(0, len(entries), 3):
+            batch = entries[start:start + 3]
+            columnar.add_entries(batch)
+            plain.add_entries(batch)
+            assert columnar._count_loss_sequences() == len(plain._find_loss_sequences())
+            assert columnar._count_loss_sequences() == len(columnar._find_loss_sequences())
+        columnar.add_entry(late)
+        plain.add_entry(late)
+
+        expected = [[e.id for e in run] for run in plain._find_loss_sequences()]
+        assert [[e.id for e in run] for run in columnar._find_loss_sequences()] == expected
+        assert columnar._count_loss_sequences() == len(expected) == 5
+
+    def test_time_span_tracks_out_of_order_entries(self):
+        """Test the time span reads the first and last entries in time order"""
+        for columnar in (True, False):
+            analyzer = TradeJournalAnalyzer(columnar=columnar)
+            for day in (5, 2, 9, 3):
+                analyzer.add_entry(self._loss(str(day), datetime(2026, 1, day), None))
+            assert analyzer._get_time_span() == timedelta(days=7)
+
+    @staticmethod
+    def _loss(entry_id, timestamp, status, profit=-5.0):
+        from trade_journal_analyzer.models import TradeStatus
+        return JournalEntry(
+            id=entry_id, timestamp=timestamp, symbol="7203", entry_price=100.0, exit_price=99.0,
+            profit=profit, profit_percent=profit / 100, signal_type="MANUAL", indicator="PRICE",
+            status=status or TradeStatus.CLOSED,
+        )
+
+
+class TestStreamingBiasDetector:
+    """Test cases for the per-trade bias detector"""
+
+    @staticmethod
+    def _trade(minutes, profit):
+        from trade_journal_analyzer.models import TradeStatus
+        return JournalEntry(
+            id=str(minutes), timestamp=datetime(2026, 1, 5, 9, 0) + timedelta(minutes=minutes),
+            symbol="7203", entry_price=100.0, exit_price=100.0 + profit, profit=profit,
+            profit_percent=profit, signal_type="MANUAL", indicator="PRICE", status=TradeStatus.CLOSED,
+        )
+
+    def test_overtrading_alerts_once_per_episode(self):
+        """Test the alert fires on the trade crossing the window limit and re-arms"""
+        from trade_journal_analyzer import StreamingBiasDetector
+        detector = StreamingBiasDetector(max_trades=3, window=timedelta(minutes=10))
+
+        fired = [[a.bias_type for a in detector.update(self._trade(m, 1.0))] for m in (0, 1, 2, 3, 4, 30, 31, 32, 33)]
+
+        assert fired == [[], [], [], ["overtrading"], [], [], [], [], ["overtrading"]]
+        assert detector.trades_in_window == 4
+
+    def test_loss_streak_alerts_and_resets(self):
+        """Test consecutive losses alert once; wins and long gaps break the streak"""
+        from trade_journal_analyzer import StreamingBiasDetector
+        detector = StreamingBiasDetector(max_trades=100, loss_streak=2, loss_gap=timedelta(minutes=30))
+
+        fired = [
+            [a.bias_type for a in detector.update(self._trade(m, p))]
+            for m, p in ((0, -1), (10, -1), (20, -1), (25, 1), (30, -1), (100, -1), (110, -1))
+        ]
+
+        assert fired == [[], ["chasing_losses"], [], [], [], [], ["chasing_losses"]]
+        assert detector.loss_streak == 2
+
+    def test_open_trades_are_ignored(self):
+        """Test only closed trades are counted"""
+        from trade_journal_analyzer import StreamingBiasDetector
+        from trade_journal_analyzer.models import TradeStatus
+        detector = StreamingBiasDetector(max_trades=1)
+        open_trade = self._trade(0, -1.0)
+        open_trade.status = TradeStatus.OPEN
+
+        assert detector.update(open_trade) == []
+        assert detector.trades_in_window == 0
+
+
+class TestScopedQueries:
+    """Test cases for start / end / symbols filters"""
+
+    @pytest.mark.parametrize("columnar", [True, False])
+    @pytest.mark.parametrize("symbols", [None, ["7203"], "AAPL", ["6758", "9984", "XXXX"]])
+    @pytest.mark.parametrize("window", [(None, None), (3, None), (None, 8), (2, 15), (40, 50)])
+    def test_filters_match_a_filtered_journal(self, columnar, symbols, window):
+        """Test scoped analyses equal analyses of a journal built from the matching entries"""
+        base = datetime(2026, 1, 5)
+        start, end = (None if days is None else base + timedelta(days=days) for days in window)
+        entries = _random_entries(600, seed=18)
+        analyzer = TradeJournalAnalyzer(columnar=columnar)
+        analyzer.add_entries(entries[:300])
+        for entry in entries[300:]:
+            analyzer.add_entry(entry)
+
+        wanted = None if symbols is None else ({symbols} if isinstance(symbols, str) else set(symbols))
+        matching = [
+            e for e in entries
+            if (start is None or e.timestamp >= start) and (end is None or e.timestamp < end)
+            and (wanted is None or e.symbol in wanted)
+        ]
+        reference = TradeJournalAnalyzer(columnar=columnar)
+        reference.add_entries(matching)
+
+        assert analyzer.get_entries(start, end, symbols) == matching
+        assert analyzer.calculate_win_rate(start, end, symbols) == pytest.approx(reference.calculate_win_rate())
+        performance = analyzer.get_performance_by_symbol(start, end, symbols)
+        expected_performance = reference.get_performance_by_symbol()
+        assert performance.keys() == expected_performance.keys()
+        for symbol, stats in expected_performance.items():
+            assert performance[symbol] == pytest.approx(stats)
+        assert ({p.description for p in analyzer.extract_patterns(3, start, end, symbols)}
+                == {p.description for p in reference.extract_patterns(3)})
+        assert ([b.message for b in analyzer.detect_biases(start, end, symbols)]
+                == [b.message for b in reference.detect_biases()])
+
+    def test_symbol_postings_follow_appends(self):
+        """Test posting lists hold each symbol's rows in insertion order"""
+        import numpy as np
+        from trade_journal_analyzer.store import JournalStore
+        from trade_journal_analyzer.ingest import entries_to_columns
+        entries = _random_entries(200, seed=19)
+        store = JournalStore()
+        for entry in entries[:50]:
+            store.append(entry)
+        store.extend(entries_to_columns(entries[50:]))
+
+        for symbol in {e.symbol for e in entries}:
+            expected = [i for i, e in enumerate(entries) if e.symbol == symbol]
+            assert store.symbol_rows.rows(store.symbols.code_of(symbol)).tolist() == expected
+        assert store.symbol_rows.rows(99).tolist() == []
+        assert isinstance(store.symbol_rows.rows_for([0, 1]), np.ndarray)
+
+
+class TestJournalLog:
+    """Test cases for the persistent journal log and warm start"""
+
+    @staticmethod
+    def _assert_same_analysis(analyzer, reference):
+        assert analyzer.get_entries() == reference.get_entries()
+        assert analyzer.calculate_win_rate() == pytest.approx(reference.calculate_win_rate())
+        performance = analyzer.get_performance_by_symbol()
+        expected_performance = reference.get_performance_by_symbol()
+        assert performance.keys() == expected_performance.keys()
+        for symbol, stats in expected_performance.items():
+            assert performance[symbol] == pytest.approx(stats)
+        assert ([p.description for p in analyzer.extract_patterns(3)]
+                == [p.description for p in reference.extract_patterns(3)])
+        assert ([b.message for b in analyzer.detect_biases()]
+                == [b.message for b in reference.detect_biases()])
+
+    def test_reopen_restores_entries_and_analyses(self, tmp_path):
+        """Test a reopened journal matches an in-memory analyzer of the same entries"""
+        entries = _random_entries(700, seed=21)
+        entries[5].notes = "日本語のメモ"
+        with TradeJournalAnalyzer.open(tmp_path / "journal", sync_rows=64, segment_rows=250) as analyzer:
+            analyzer.add_entries(entries[:400])
+            for entry in entries[400:]:
+                analyzer.add_entry(entry)
+
+        reference = TradeJournalAnalyzer()
+        reference.add_entries(entries)
+        reopened = TradeJournalAnalyzer.open(tmp_path / "journal")
+        assert len(reopened) == 700
+        assert len(list((tmp_path / "journal").glob("segment-*"))) == 3
+        self._assert_same_analysis(reopened, reference)
+
+        # The reopened journal keeps appending
+        more = _random_entries(50, seed=22)
+        for entry in more:
+            reopened.add_entry(entry)
+        reopened.close()
+        reference.add_entries(more)
+        self._assert_same_analysis(TradeJournalAnalyzer.open(tmp_path / "journal"), reference)
+
+    def test_aggregates_come_from_snapshot(self, tmp_path):
+        """Test warm start uses the snapshot and folds in only the rows after it"""
+        import json
+        from trade_journal_analyzer.journal_log import JournalLog
+        entries = _random_entries(300, seed=23)
+        analyzer = TradeJournalAnalyzer.open(tmp_path, sync_rows=50, snapshot_rows=100)
+        analyzer.add_entries(entries[:120])
+        for entry in entries[120:]:
+            analyzer.add_entry(entry)
+        analyzer.flush()
+
+        log = JournalLog(tmp_path)
+        covered, _ = log.read_snapshot()
+        assert log.rows == 300
+        assert 100 <= covered < 300
+        # Tamper with the snapshot: a warm start must trust it rather than recompute
+        path = tmp_path / "aggregates.json"
+        snapshot = json.loads(path.read_text(encoding="utf-8"))
+        snapshot["aggregates"]["closed"] += 1000
+        path.write_text(json.dumps(snapshot), encoding="utf-8")
+        restored = TradeJournalAnalyzer.open(tmp_path)
+        assert restored._aggregates.closed == analyzer._aggregates.closed + 1000
+
+    def test_unflushed_rows_are_not_visible(self, tmp_path):
+        """Test only flushed rows survive, and torn writes are truncated"""
+        entries = _random_entries(30, seed=24)
+        analyzer = TradeJournalAnalyzer.open(tmp_path, sync_rows=10)
+        for entry in entries[:25]:
+            analyzer.add_entry(entry)
+        # Simulate a crash mid-flush: bytes past the committed rows
+        with open(tmp_path / "segment-000000" / "timestamp.bin", "ab") as f:
+            f.write(b"\x00" * 12)
+
+        reopened = TradeJournalAnalyzer.open(tmp_path, sync_rows=10)
+        assert reopened.get_entries() == entries[:20]
+        for entry in entries[20:]:
+            reopened.add_entry(entry)
+        reopened.close()
+        assert TradeJournalAnalyzer.open(tmp_path).get_entries() == entries[:20] + entries[20:]
+
+    def test_snapshot_round_trip(self):
+        """Test aggregates survive to_state / from_state through JSON"""
+        import json
+        from trade_journal_analyzer.aggregates import JournalAggregates
+        analyzer = TradeJournalAnalyzer()
+        analyzer.add_entries(_random_entries(200, seed=25))
+        state = json.loads(json.dumps(analyzer._aggregates.to_state()))
+        restored = JournalAggregates.from_state(state)
+        assert restored.groups == analyzer._aggregates.groups
+        assert restored.win_rate == analyzer._aggregates.win_rate
+
+    def test_numpy_profits_survive_snapshot(self, tmp_path):
+        """Test entries with NumPy scalar profits can be snapshotted and reopened"""
+        import numpy as np
+        entries = _random_entries(120, seed=26)
+        for entry in entries:
+            entry.profit = np.float64(entry.profit)
+            entry.profit_percent = np.float64(entry.profit_percent)
+        analyzer = TradeJournalAnalyzer.open(tmp_path)
+        for entry in entries:
+            analyzer.add_entry(entry)
+        analyzer.close()
+
+        reference = TradeJournalAnalyzer()
+        reference.add_entries(_random_entries(120, seed=26))
+        reopened = TradeJournalAnalyzer.open(tmp_path)
+        assert type(reopened._aggregates.wins) is int
+        self._assert_same_analysis(reopened, reference)
+
+    def test_invalid_options(self, tmp_path):
+        """Test non-positive log sizes are rejected"""
+        with pytest.raises(ValueError):
+            TradeJournalAnalyzer.open(tmp_path, sync_rows=0)
@@ -0,0 +1,242 @@
+"""
+Tests for OHLCV bars and resampling
+
+Run with: pytest tests/test_market_data.py -v
+"""
+
+import os
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import numpy as np
+import pytest
+from market_correlation import MarketCorrelation
+from market_data import Bars, OhlcvResampler, PriceHistoryStore, resample_bars
+from ult_universe import StockUniverse, run_universe_analytics
+
+
+def _minute_bars(n: int, start: int = 1_700_000_000, seed: int = 0) -> Bars:
+    """Random-walk one-minute bars"""
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.normal(0, 0.1, n).cumsum()
+    open_ = np.concatenate([[100.0], close[:-1]])
+    spread = rng.random(n) * 0.2
+    return Bars(
+        start + 60 * np.arange(n),
+        open_,
+        np.maximum(open_, close) + spread,
+        np.minimum(open_, close) - spread,
+        close,
+        rng.integers(100, 1000, n),
+    )
+
+
+class TestResampleBars:
+    """Test cases for one-shot resampling"""
+
+    def test_ticks_to_five_minute_bars(self):
+        """Test OHLCV of each bucket from raw ticks"""
+        ticks = Bars.from_ticks(
+            [0, 30, 299.5, 300, 420, 900],
+            [10.0, 12.0, 9.0, 11.0, 13.0, 8.0],
+            [1, 2, 3, 4, 5, 6],
+        )
+
+        bars = resample_bars(ticks, "5m")
+
+        assert bars.timestamp.tolist() == [0, 300, 900]
+        assert bars.open.tolist() == [10.0, 11.0, 8.0]
+        assert bars.high.tolist() == [12.0, 13.0, 8.0]
+        assert bars.low.tolist() == [9.0, 11.0, 8.0]
+        assert bars.close.tolist() == [9.0, 13.0, 8.0]
+        assert bars.volume.tolist() == [6.0, 9.0, 6.0]
+
+    def test_utc_offset_aligns_daily_bars(self):
+        """Test daily buckets start at local midnight"""
+        jst = 9 * 3600
+        midnight_jst = 1_700_006_400 - jst  # 2023-11-15 00:00 JST
+        ticks = Bars.from_ticks([midnight_jst - 1, midnight_jst], [1.0, 2.0], [1, 1])
+
+        bars = resample_bars(ticks, "1d", utc_offset=jst)
+
+        assert bars.timestamp.tolist() == [midnight_jst - 86400, midnight_jst]
+
+    def test_unsorted_timestamps_rejected(self):
+        """Test timestamps must be non-decreasing"""
+        with pytest.raises(ValueError):
+            resample_bars(Bars.from_ticks([60, 0], [1.0, 1.0], [1, 1]), "1m")
+
+
+class TestOhlcvResampler:
+    """Test cases for incremental multi-timeframe resampling"""
+
+    def test_incremental_matches_one_shot(self):
+        """Test chunked updates produce the same bars as one pass"""
+        minutes = _minute_bars(3000)
+        resampler = OhlcvResampler(("5m", "1h", "1d"))
+
+        for start in range(0, len(minutes), 97):
+            resampler.add_bars(minutes[start:start + 97])
+
+        for timeframe in ("5m", "1h", "1d"):
+            expected = resample_bars(minutes, timeframe)
+            actual = resampler.bars(timeframe, include_partial=True)
+            for field, column in expected.columns().items():
+                np.testing.assert_allclose(getattr(actual, field), column)
+            assert len(resampler.bars(timeframe)) == len(expected) - 1
+
+    def test_reports_closed_bars(self):
+        """Test add_bars and advance return bars as they close"""
+        resampler = OhlcvResampler(("5m",))
+
+        closed = resampler.add_bars(_minute_bars(7, start=0))
+        assert closed["5m"].timestamp.tolist() == [0]
+
+        closed = resampler.advance(600)
+        assert closed["5m"].timestamp.tolist() == [300]
+        assert len(resampler.bars("5m")) == 2
+
+    def test_out_of_order_batch_rejected(self):
+        """Test a batch older than earlier input is rejected"""
+        resampler = OhlcvResampler(("5m",))
+        resampler.add_bars(_minute_bars(10, start=600))
+
+        with pytest.raises(ValueError):
+            resampler.add_bars(_minute_bars(1, start=0))
+
+    def test_late_bar_after_advance_rejected(self):
+        """Test data inside a bucket closed by advance cannot reopen it"""
+        resampler = OhlcvResampler(("5m",))
+        resampler.add_bars(_minute_bars(2, start=0))
+        resampler.advance(400)
+
+        with pytest.raises(ValueError, match="advance"):
+            resampler.add_bars(_minute_bars(1, start=240))
+
+        resampler.add_bars(_minute_bars(1, start=420))
+        resampler.advance(600)
+        timestamps = resampler.bars("5m").timestamp.tolist()
+        assert timestamps == [0, 300]
+
+    def test_bars_feed_analyzers(self):
+        """Test cached closes can be passed straight to the analyzers"""
+        resampler = OhlcvResampler(("1h",))
+        resampler.add_bars(_minute_bars(600, start=0))
+
+        hourly = resampler.bars("1h")
+        trend = MarketCorrelation().detect_trend(hourly.close)
+
+        assert len(hourly) == 9
+        assert trend is not None
+
+
+class TestPriceHistoryStore:
+    """Test cases for the memory-mapped price history store"""
+
+    def test_append_and_load_range(self, tmp_path):
+        """Test appended batches read back as one history and by date range"""
+        store = PriceHistoryStore(tmp_path)
+        bars = _minute_bars(100, start=0)
+        store.append("7203", bars[:60])
+        store.append("7203", bars[60:])
+
+        loaded = store.load("7203")
+        window = store.load("7203", start=600, end=1200)
+
+        assert store.row_count("7203") == 100
+        assert store.time_range("7203") == (0, 99 * 60)
+        np.testing.assert_array_equal(loaded.close, bars.close)
+        assert window.timestamp.tolist() == list(range(600, 1200, 60))
+        assert np.shares_memory(window.close, loaded.close)  # zero-copy view
+
+    def test_reopen_reads_index(self, tmp_path):
+        """Test a new store instance sees previously written symbols"""
+        PriceHistoryStore(tmp_path).append("6758", _minute_bars(10))
+
+        store = PriceHistoryStore(tmp_path)
+
+        assert store.symbols() == ["6758"]
+        assert len(store.load("6758")) == 10
+        with pytest.raises(KeyError):
+            store.load("9984")
+
+    def test_rejects_older_bars_and_ignores_torn_rows(self, tmp_path):
+        """Test appends stay ordered and unindexed trailing rows are dropped"""
+        store = PriceHistoryStore(tmp_path)
+        store.append("7203", _minute_bars(10, start=600))
+        with pytest.raises(ValueError):
+            store.append("7203", _minute_bars(1, start=0))
+
+        # Simulate a crash after writing column data but before the index
+        with open(tmp_path / "7203" / "close.bin", "ab") as f:
+            f.write(b"\x00" * 8 * 3)
+        reopened = PriceHistoryStore(tmp_path)
+        assert len(reopened.load("7203")) == 10
+        reopened.append("7203", _minute_bars(5, start=600 + 60 * 10))
+        assert len(reopened.load("7203").close) == 15
+
+    @pytest.mark.parametrize("symbol", ["", "..", "a/b", "index.json", "index.tmp"])
+    def test_rejects_reserved_symbol_names(self, tmp_path, symbol):
+        """Test symbols that would clash with paths or the index are refused"""
+        store = PriceHistoryStore(tmp_path)
+
+        with pytest.raises(ValueError):
+            store.append(symbol, _minute_bars(3))
+        assert not (tmp_path / "index.json").exists()
+
+    def test_append_fsyncs_columns_before_index(self, tmp_path, monkeypatch):
+        """Test column data and the tmp index reach disk before the rename"""
+        events = []
+        real_fsync, real_replace = os.fsync, os.replace
+        monkeypatch.setattr(os, "fsync", lambda fd: events.append("fsync") or real_fsync(fd))
+        monkeypatch.setattr(os, "replace", lambda src, dst: events.append("replace") or real_replace(src, dst))
+
+        PriceHistoryStore(tmp_path).append("7203", _minute_bars(5))
+
+        replace_at = events.index("replace")
+        # One fsync per OHLCV column plus the tmp index, all before the rename
+        assert events[:replace_at].count("fsync") >= 7
+
+    def test_append_many_commits_index_once(self, tmp_path, monkeypatch):
+        """Test a universe update replaces the index once for all symbols"""
+        store = PriceHistoryStore(tmp_path)
+        store.append("7203", _minute_bars(10, start=0))
+        replaces = []
+        real_replace = os.replace
+        monkeypatch.setattr(os, "replace", lambda src, dst: replaces.append(dst) or real_replace(src, dst))
+
+        store.append_many({symbol: _minute_bars(5, start=600, seed=seed)
+                           for seed, symbol in enumerate(["7203", "6758", "9984", "AAPL"])})
+
+        assert len(replaces) == 1
+        reopened = PriceHistoryStore(tmp_path)
+        assert reopened.symbols() == ["6758", "7203", "9984", "AAPL"]
+        assert reopened.row_count("7203") == 15
+        assert reopened.row_count("AAPL") == 5
+
+    def test_append_many_rejects_whole_batch(self, tmp_path):
+        """Test one invalid symbol batch leaves every symbol untouched"""
+        store = PriceHistoryStore(tmp_path)
+        store.append("7203", _minute_bars(10, start=600))
+
+        with pytest.raises(ValueError):
+            store.append_many({"6758": _minute_bars(5), "7203": _minute_bars(5, start=0)})
+
+        assert store.symbols() == ["7203"]
+        assert PriceHistoryStore(tmp_path).row_count("7203") == 10
+        assert not (tmp_path / "6758").exists()
+
+    def test_feeds_universe_runner(self, tmp_path):
+        """Test the store can be used as the analytics runner's source"""
+        store = PriceHistoryStore(tmp_path)
+        index = _minute_bars(50, seed=9)
+        for seed, symbol in enumerate(["7203", "6758"]):
+            store.append(symbol, _minute_bars(50, seed=seed))
+        universe = StockUniverse()
+        universe.add("7203")
+        universe.add("6758")
+
+        result = run_universe_analytics(universe, store.price_volume_source(), index.close, max_workers=1)
+
+        assert sorted(result["symbol"].tolist()) == ["6758", "7203"]
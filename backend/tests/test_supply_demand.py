@@ -8,6 +8,9 @@ This module tests the Supply/Demand Analysis which handles:
 - Zone strength identification
 """
 
+from datetime import datetime
+
+import pytest
 from supply_demand import SupplyDemandAnalyzer, Zone, ZoneType
 
 
@@ -38,6 +41,80 @@ class TestSupplyDemandAnalyzer:
         assert volume_by_price[102.0] == 5000
         assert len(volume_by_price) == 5
 
+    def test_calculate_volume_by_price_from_array(self):
+        """Test volume by price from an (n, 2) ndarray"""
+        import numpy as np
+        analyzer = SupplyDemandAnalyzer()
+
+        data = np.array([[100.0, 1000], [101.0, 2000], [100.0, 500]])
+
+        volume_by_price = analyzer.calculate_volume_by_price(data)
+
+        assert volume_by_price == {100.0: 1500.0, 101.0: 2000.0}
+
+    def test_calculate_volume_profile_tick_size(self):
+        """Test binning tick prices into tick-size buckets"""
+        analyzer = SupplyDemandAnalyzer()
+
+        data = [(100.01, 100), (100.04, 200), (100.1, 300), (100.19, 400), (100.5, 50)]
+
+        levels, volumes = analyzer.calculate_volume_profile(data, tick_size=0.1)
+
+        assert levels.tolist() == [100.0, 100.1, 100.5]
+        assert volumes.tolist() == [300.0, 700.0, 50.0]
+
+    def test_calculate_volume_profile_sparse_outlier(self):
+        """Test a far outlier price does not allocate the whole price range"""
+        analyzer = SupplyDemandAnalyzer()
+
+        # Dense bins from 100.00 to 1e12 at a 0.01 tick would need ~1e14 slots
+        data = [(100.01, 100), (100.04, 200), (1e12, 5), (100.1, 300)]
+
+        levels, volumes = analyzer.calculate_volume_profile(data, tick_size=0.01)
+
+        assert levels.tolist() == pytest.approx([100.01, 100.04, 100.1, 1e12])
+        assert volumes.tolist() == [100.0, 200.0, 300.0, 5.0]
+
+    def test_calculate_volume_profile_bin_count(self):
+        """Test binning into a fixed number of equal-width bins"""
+        analyzer = SupplyDemandAnalyzer()
+
+        data = [(100.0, 10), (101.0, 20), (104.9, 30), (110.0, 40)]
+
+        levels, volumes = analyzer.calculate_volume_profile(data, bins=2)
+
+        assert levels.tolist() == [100.0, 105.0]
+        assert volumes.tolist() == [60.0, 40.0]
+
+    def test_calculate_volume_profile_exact_matches_dict(self):
+        """Test the unbinned array profile matches calculate_volume_by_price"""
+        analyzer = SupplyDemandAnalyzer()
+
+        data = [(100.0, 1000), (101.0, 2000), (100.0, 500), (99.5, 700)]
+
+        levels, volumes = analyzer.calculate_volume_profile(data)
+
+        assert dict(zip(levels.tolist(), volumes.tolist())) == analyzer.calculate_volume_by_price(data)
+
+    def test_calculate_volume_profile_requires_one_mode(self):
+        """Test that tick_size and bins are mutually exclusive"""
+        analyzer = SupplyDemandAnalyzer()
+
+        with pytest.raises(ValueError, match="exactly one"):
+            analyzer.calculate_volume_profile([(100.0, 1)], tick_size=0.1, bins=10)
+
+    def test_identify_levels_from_profile_arrays(self):
+        """Test identify_levels consumes (levels, volumes) arrays directly"""
+        analyzer = SupplyDemandAnalyzer()
+
+        volume_by_price = {98.0: 8000, 99.0: 3000, 100.0: 5000, 101.0: 2000, 102.0: 1000}
+        profile = analyzer.calculate_volume_profile(list(volume_by_price.items()))
+
+        from_arrays = analyzer.identify_levels(profile, current_price=102.0)
+        from_dict = analyzer.identify_levels(volume_by_price, current_price=102.0)
+
+        assert from_arrays == from_dict
+
     def test_identify_support_levels(self):
         """Test identifying support levels from volume profile"""
         analyzer = SupplyDemandAnalyzer()
@@ -215,3 +292,327 @@ class TestSupplyDemandAnalyzer:
 
         assert nearest is not None
         assert nearest.price == 100.0
+
+
+class TestZoneTable:
+    """Test cases for the columnar ZoneTable"""
+
+    def _profile(self):
+        import numpy as np
+        rng = np.random.default_rng(3)
+        levels = np.round(np.arange(90.0, 110.0, 0.01), 2)
+        volumes = rng.integers(1, 10_000, len(levels)).astype(float)
+        return levels, volumes
+
+    def test_identify_zones_matches_identify_levels(self):
+        """Test the table holds the same zones in the same order"""
+        analyzer = SupplyDemandAnalyzer()
+        profile = self._profile()
+
+        table = analyzer.identify_zones(profile, current_price=100.0)
+        zones = analyzer.identify_levels(profile, current_price=100.0)
+
+        assert len(table) == len(zones)
+        assert table.to_zones() == zones
+
+    def test_top_k_selects_strongest(self):
+        """Test top-k selection returns the k strongest, sorted"""
+        analyzer = SupplyDemandAnalyzer()
+        profile = self._profile()
+
+        top5 = analyzer.identify_zones(profile, current_price=100.0, top_k=5)
+        full = analyzer.identify_zones(profile, current_price=100.0)
+
+        assert len(top5) == 5
+        assert top5.strengths.tolist() == full.strengths[:5].tolist()
+        assert list(top5.strengths) == sorted(top5.strengths, reverse=True)
+
+    def test_lazy_zone_view(self):
+        """Test indexing yields Zone objects and slicing yields tables"""
+        analyzer = SupplyDemandAnalyzer()
+        table = analyzer.identify_zones({98.0: 8000, 100.0: 5000, 102.0: 3000}, current_price=101.0)
+
+        first = table[0]
+        assert isinstance(first, Zone)
+        assert first.price == 98.0 and first.zone_type == ZoneType.SUPPORT
+        assert len(table[:2]) == 2
+        assert [z.price for z in table.resistances()] == [102.0]
+
+    def test_zone_table_works_with_list_apis(self):
+        """Test a ZoneTable can be passed where List[Zone] is expected"""
+        analyzer = SupplyDemandAnalyzer()
+        table = analyzer.identify_zones({95.0: 3000, 98.0: 5000, 100.0: 2000}, current_price=99.0)
+
+        assert analyzer.get_nearest_support(table, 99.0).price == 98.0
+        assert analyzer.get_nearest_resistance(table, 99.0).price == 100.0
+
+    def test_from_zones_round_trip(self):
+        """Test building a table from Zone objects"""
+        from supply_demand import ZoneTable
+        zones = [
+            Zone(price=100.0, volume=5000, zone_type=ZoneType.RESISTANCE, strength=0.8),
+            Zone(price=95.0, volume=3000, zone_type=ZoneType.SUPPORT, strength=0.5),
+        ]
+
+        assert ZoneTable.from_zones(zones).to_zones() == zones
+
+
+class TestZoneIndex:
+    """Test cases for ZoneIndex nearest-level and breakout queries"""
+
+    def _zones(self, seed=0, count=40):
+        import random
+        rng = random.Random(seed)
+        return [
+            Zone(
+                price=float(rng.randint(90, 110)),  # repeated prices exercise ties
+                volume=rng.randint(100, 5000),
+                zone_type=rng.choice([ZoneType.SUPPORT, ZoneType.RESISTANCE]),
+                strength=rng.random(),
+            )
+            for _ in range(count)
+        ]
+
+    def test_matches_linear_scans(self):
+        """Test indexed queries agree with the list-based analyzer methods"""
+        analyzer = SupplyDemandAnalyzer()
+        for seed in range(5):
+            zones = self._zones(seed)
+            index = analyzer.build_zone_index(zones)
+            for price in [85.0, 90.0, 95.5, 100.0, 104.0, 110.0, 115.0]:
+                assert index.nearest_support(price) == analyzer.get_nearest_support(zones, price)
+                assert index.nearest_resistance(price) == analyzer.get_nearest_resistance(zones, price)
+
+                bar_time = datetime(2026, 1, 5, 10, 0)
+                expected = analyzer.detect_breakout(zones, price, 9000, 5000, timestamp=bar_time)
+                actual = analyzer.detect_breakout(index, price, 9000, 5000, timestamp=bar_time)
+                if expected is None:
+                    assert actual is None
+                else:
+                    assert (actual.direction, actual.zone, actual.is_confirmed) == \
+                        (expected.direction, expected.zone, expected.is_confirmed)
+                    assert actual.timestamp == expected.timestamp == bar_time
+
+    def test_batch_breakouts(self):
+        """Test checking many prices in one call"""
+        import numpy as np
+        analyzer = SupplyDemandAnalyzer()
+        zones = [
+            Zone(price=105.0, volume=5000, zone_type=ZoneType.RESISTANCE, strength=0.9),
+            Zone(price=95.0, volume=3000, zone_type=ZoneType.SUPPORT, strength=0.7),
+        ]
+        index = analyzer.build_zone_index(zones)
+
+        result = index.detect_breakouts([100.0, 106.0, 94.0], [10000, 10000, 1000], 5000)
+
+        assert result["direction"].tolist() == [0, 1, -1]
+        assert result["zone_row"].tolist() == [-1, 0, 1]
+        assert result["is_confirmed"].tolist() == [False, True, False]
+        assert np.isnan(result["zone_price"][0])
+        assert result["zone_price"][1:].tolist() == [105.0, 95.0]
+
+    def test_nearest_levels_batch(self):
+        """Test nearest support/resistance prices for a batch of prices"""
+        import numpy as np
+        analyzer = SupplyDemandAnalyzer()
+        table = analyzer.identify_zones({95.0: 3000, 98.0: 5000, 100.0: 2000, 103.0: 4000}, current_price=99.0)
+        index = analyzer.build_zone_index(table)
+
+        supports, resistances = index.nearest_levels([99.0, 96.0, 90.0])
+
+        assert supports[:2].tolist() == [98.0, 95.0] and np.isnan(supports[2])
+        assert resistances.tolist() == [100.0, 100.0, 100.0]
+
+    def test_empty_index(self):
+        """Test queries against an empty index"""
+        index = SupplyDemandAnalyzer().build_zone_index([])
+
+        assert index.nearest_support(100.0) is None
+        assert index.nearest_resistance(100.0) is None
+        assert index.detect_breakouts([100.0], [1], 1)["direction"].tolist() == [0]
+
+
+class TestMergeZones:
+    """Test cases for zone clustering/merging"""
+
+    def test_adjacent_levels_merge_into_one_range(self):
+        """Test that neighbouring high-volume bins become one zone"""
+        analyzer = SupplyDemandAnalyzer()
+        volume_by_price = {
+            100.0: 3000, 100.1: 4000, 100.2: 3000,  # one cluster
+            100.3: 10,                              # low volume gap
+            100.4: 2000, 100.5: 2000,               # second cluster
+            101.0: 5000,                            # isolated level
+        }
+
+        zones = analyzer.merge_zones(volume_by_price, current_price=100.35)
+
+        assert len(zones) == 3
+        strongest = zones[0]
+        assert strongest.price == pytest.approx(100.1)
+        assert strongest.volume == 10000
+        assert strongest.zone_type == ZoneType.SUPPORT
+        assert (zones.lows[0], zones.highs[0]) == (100.0, 100.2)
+        assert zones.strengths.tolist() == pytest.approx([1.0, 0.5, 0.4])
+
+    def test_max_gap_controls_bridging(self):
+        """Test a wider max_gap bridges sparse levels"""
+        analyzer = SupplyDemandAnalyzer()
+        volume_by_price = {100.0: 1000, 101.0: 1000, 103.0: 1000}
+
+        assert len(analyzer.merge_zones(volume_by_price, 102.0)) == 2
+        assert len(analyzer.merge_zones(volume_by_price, 102.0, max_gap=2.0)) == 1
+
+    def test_merged_output_is_much_smaller(self):
+        """Test clustering a fine-grained profile shrinks the zone count"""
+        import numpy as np
+        analyzer = SupplyDemandAnalyzer()
+        rng = np.random.default_rng(1)
+        prices = np.concatenate([rng.normal(95, 0.3, 5000), rng.normal(105, 0.3, 5000)])
+        profile = analyzer.calculate_volume_profile(np.column_stack([prices, np.ones(len(prices))]), tick_size=0.01)
+
+        levels = analyzer.identify_zones(profile, current_price=100.0)
+        merged = analyzer.merge_zones(profile, current_price=100.0, max_gap=0.5)
+
+        assert len(merged) <= 4 < len(levels)
+        assert merged.volumes.sum() <= levels.volumes.sum()
+        assert {z.zone_type for z in merged} == {ZoneType.SUPPORT, ZoneType.RESISTANCE}
+
+    def test_unmerged_zones_have_point_ranges(self):
+        """Test identify_zones ranges collapse to the level price"""
+        table = SupplyDemandAnalyzer().identify_zones({98.0: 8000, 100.0: 5000}, current_price=99.0)
+
+        assert table.lows.tolist() == table.prices.tolist() == table.highs.tolist()
+
+
+class TestAnalyzeUniverse:
+    """Test cases for batch multi-symbol analysis"""
+
+    def test_matches_per_symbol_analysis(self):
+        """Test every symbol gets the same zones as identify_zones"""
+        import numpy as np
+        analyzer = SupplyDemandAnalyzer()
+        rng = np.random.default_rng(3)
+        symbols = ["7203", "6758", "9984"]
+        ids = np.repeat(symbols, 200)
+        prices = np.round(100 + rng.normal(0, 0.2, len(ids)).cumsum(), 1)
+        volumes = rng.integers(1, 1000, len(ids)).astype(float)
+
+        universe = analyzer.analyze_universe(ids, prices, volumes, tick_size=0.5)
+
+        assert len(universe) == 3
+        for symbol in symbols:
+            rows = ids == symbol
+            profile = analyzer.calculate_volume_profile(
+                np.column_stack([prices[rows], volumes[rows]]), tick_size=0.5
+            )
+            expected = analyzer.identify_zones(profile, current_price=prices[rows][-1])
+            actual = universe.zones_for(symbol)
+            assert actual.prices.tolist() == expected.prices.tolist()
+            assert actual.strengths.tolist() == pytest.approx(expected.strengths.tolist())
+            assert actual.zone_types.tolist() == expected.zone_types.tolist()
+
+    def test_nearest_levels_and_counts(self):
+        """Test nearest support/resistance per symbol with integer ids"""
+        analyzer = SupplyDemandAnalyzer()
+        ids = [0, 0, 0, 2, 2]
+        prices = [95.0, 100.0, 105.0, 50.0, 50.0]
+        volumes = [1000, 10, 1000, 500, 500]
+
+        universe = analyzer.analyze_universe(ids, prices, volumes, current_prices=[101.0, 0.0, 49.0])
+
+        assert universe.symbols.tolist() == [0, 1, 2]
+        assert universe.zone_counts.tolist() == [2, 0, 1]
+        assert universe.nearest_support[0] == 95.0
+        assert universe.nearest_resistance[0] == 105.0
+        assert universe.nearest_resistance[2] == 50.0
+        assert universe.nearest_support[1] != universe.nearest_support[1]  # NaN
+        assert len(universe.zones_for(1)) == 0
+
+    def test_outlier_price_uses_sparse_bins(self):
+        """Test a far outlier in one symbol gives the same levels without dense bins"""
+        from supply_demand.profile import grouped_volume_profile
+        import numpy as np
+        codes = np.array([0, 0, 1, 1, 1])
+        prices = np.array([100.0, 100.01, 50.0, 1e12, 50.0])
+        volumes = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+
+        level_codes, levels, totals = grouped_volume_profile(codes, 3, prices, volumes, tick_size=0.01)
+
+        assert level_codes.tolist() == [0, 0, 1, 1]
+        assert levels.tolist() == pytest.approx([100.0, 100.01, 50.0, 1e12])
+        assert totals.tolist() == [1.0, 2.0, 8.0, 4.0]
+
+    def test_top_k_per_symbol(self):
+        """Test top_k keeps the k strongest zones of each symbol"""
+        analyzer = SupplyDemandAnalyzer()
+        ids = ["A"] * 4 + ["B"] * 3
+        prices = [1.0, 2.0, 3.0, 4.0, 10.0, 11.0, 12.0]
+        volumes = [400, 300, 200, 100, 50, 60, 70]
+
+        universe = analyzer.analyze_universe(ids, prices, volumes, top_k=2)
+
+        assert universe.zones_for("A").prices.tolist() == [1.0, 2.0]
+        assert universe.zones_for("B").prices.tolist() == [12.0, 11.0]
+        with pytest.raises(KeyError):
+            universe.zones_for("C")
+
+
+class TestSlottedModels:
+    """Test cases for the slotted zone/breakout models"""
+
+    def test_models_have_no_instance_dict(self):
+        """Test slotted models keep attribute access without __dict__"""
+        from supply_demand import BreakoutEvent
+        zone = Zone(price=100.0, volume=5000, zone_type=ZoneType.SUPPORT, strength=0.8)
+        event = BreakoutEvent(direction="bearish", price=99.0, zone=zone, volume=9000, is_confirmed=True)
+
+        assert not hasattr(zone, "__dict__")
+        assert not hasattr(event, "__dict__")
+        assert str(zone) == "support @ 100.00 (strength: 0.80)"
+        assert str(event) == "bearish breakout at 99.00 (confirmed)"
+
+    def test_breakout_timestamp_defaults_to_creation_time(self):
+        """Test the default timestamp is the construction time"""
+        from datetime import timedelta
+        from supply_demand import BreakoutEvent
+        zone = Zone(price=100.0, volume=5000, zone_type=ZoneType.RESISTANCE, strength=0.8)
+        before = datetime.now()
+
+        event = BreakoutEvent("bullish", 101.0, zone, 9000, True)
+        stamp = event.timestamp
+
+        assert isinstance(stamp, datetime)
+        assert before - timedelta(seconds=1) <= stamp <= datetime.now()
+        assert event.timestamp is stamp
+        explicit = datetime(2024, 1, 4, 9, 0)
+        assert BreakoutEvent("bullish", 101.0, zone, 9000, True, timestamp=explicit).timestamp == explicit
+
+    def test_breakout_supports_dataclass_helpers(self):
+        """Test replace() and asdict() work with default and explicit timestamps"""
+        import dataclasses
+        from supply_demand import BreakoutEvent
+        zone = Zone(price=100.0, volume=5000, zone_type=ZoneType.RESISTANCE, strength=0.8)
+        explicit = datetime(2024, 1, 4, 9, 0)
+
+        for event in (BreakoutEvent("bullish", 101.0, zone, 9000, True),
+                      BreakoutEvent("bullish", 101.0, zone, 9000, True, timestamp=explicit)):
+            moved = dataclasses.replace(event, price=102.0)
+            assert moved.price == 102.0
+            assert moved.timestamp == event.timestamp
+
+            data = dataclasses.asdict(event)
+            assert set(data) == {"direction", "price", "zone", "volume", "is_confirmed", "timestamp"}
+            assert data["timestamp"] == event.timestamp
+            assert data["zone"]["price"] == 100.0
+
+    def test_frozen_zone_is_hashable_and_immutable(self):
+        """Test FrozenZone works as a set member and rejects assignment"""
+        import dataclasses
+        from supply_demand import FrozenZone
+        zone = FrozenZone(price=100.0, volume=5000, zone_type=ZoneType.SUPPORT, strength=0.8)
+
+        assert len({zone, FrozenZone(100.0, 5000, ZoneType.SUPPORT, 0.8)}) == 1
+        assert str(zone) == str(Zone(100.0, 5000, ZoneType.SUPPORT, 0.8))
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            zone.price = 101.0
@@ -0,0 +1,111 @@
+"""
+Universe Analytics Runner Tests
+
+This module tests the UniverseAnalyticsRunner which handles:
+- Fetching price/volume histories for every universe symbol
+- Batched, vectorized trend/correlation/beta/zone analysis
+- Shared-memory fan-out across worker processes
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from market_correlation import MarketCorrelation
+from ult_universe import StockUniverse, UniverseAnalyticsRunner
+
+
+def _make_source(symbols, bars=60, seed=0):
+    rng = np.random.default_rng(seed)
+    source = {}
+    for symbol in symbols:
+        prices = np.round(100 * np.cumprod(1 + rng.normal(0, 0.01, bars)), 1)
+        volumes = rng.integers(100, 1000, bars).astype(float)
+        source[symbol] = (prices, volumes)
+    return source
+
+
+class TestUniverseAnalyticsRunner:
+    """Test cases for UniverseAnalyticsRunner class"""
+
+    def setup_method(self):
+        self.universe = StockUniverse()
+        for symbol in ["AAPL", "MSFT", "7203", "6758", "NVDA"]:
+            self.universe.add(symbol)
+        self.source = _make_source(self.universe.list_symbols())
+        self.index = 1000 * np.cumprod(1 + np.random.default_rng(99).normal(0, 0.01, 60))
+
+    def test_results_match_per_symbol_analysis(self):
+        """Test the combined table agrees with the single-symbol analyzers"""
+        result = UniverseAnalyticsRunner(max_workers=1).run(self.universe, self.source, self.index)
+        analyzer = MarketCorrelation()
+
+        assert result["symbol"].tolist() == self.universe.list_symbols()
+        for row in result:
+            prices, _ = self.source[row["symbol"]]
+            assert row["trend"] == analyzer.detect_trend(prices).value
+            assert row["correlation"] == pytest.approx(analyzer.calculate_correlation(prices, self.index))
+            assert row["beta"] == pytest.approx(analyzer.calculate_beta(prices, self.index))
+            assert row["zone_count"] > 0
+
+    def test_parallel_matches_inline(self):
+        """Test that the process pool path produces the same table"""
+        inline = UniverseAnalyticsRunner(max_workers=1).run(self.universe, self.source, self.index)
+        parallel = UniverseAnalyticsRunner(max_workers=2, batch_size=2).run(self.universe, self.source, self.index)
+
+        for field in inline.dtype.names:
+            if field == "symbol":
+                assert inline[field].tolist() == parallel[field].tolist()
+            else:
+                np.testing.assert_allclose(inline[field], parallel[field])
+
+    def test_skips_symbols_without_enough_history(self):
+        """Test that missing or short histories are left out"""
+        self.source["MSFT"] = (self.source["MSFT"][0][:10], self.source["MSFT"][1][:10])
+        del self.source["NVDA"]
+
+        result = UniverseAnalyticsRunner(max_workers=1).run(self.universe, self.source, self.index)
+
+        assert result["symbol"].tolist() == ["6758", "7203", "AAPL"]
+
+    def test_callable_source_and_lookback(self):
+        """Test a callable source with a trailing lookback window"""
+        result = UniverseAnalyticsRunner(max_workers=1).run(
+            self.universe, self.source.get, self.index, lookback=20
+        )
+
+        prices, _ = self.source["AAPL"]
+        row = result[result["symbol"] == "AAPL"][0]
+        assert row["last_price"] == prices[-1]
+        assert row["correlation"] == pytest.approx(
+            MarketCorrelation().calculate_correlation(prices[-20:], self.index[-20:])
+        )
+
+    def test_empty_universe(self):
+        """Test that an empty universe yields an empty table"""
+        result = UniverseAnalyticsRunner().run(StockUniverse(), {}, self.index)
+
+        assert len(result) == 0
+
+    @pytest.mark.parametrize("lookback", [0, -5, 1])
+    def test_rejects_non_positive_lookback(self, lookback):
+        """Test that lookback=0 or below is an error, not 'all history'"""
+        with pytest.raises(ValueError, match="lookback"):
+            UniverseAnalyticsRunner(max_workers=1).run(
+                self.universe, self.source, self.index, lookback=lookback
+            )
+
+
+def test_package_import_does_not_load_analytics():
+    """Test that importing StockUniverse leaves numpy-backed analytics unloaded"""
+    src = Path(__file__).parent.parent / "src"
+    code = (
+        "import sys\n"
+        "from ult_universe import StockUniverse\n"
+        "assert 'ult_universe.analytics' not in sys.modules\n"
+        "from ult_universe import UniverseAnalyticsRunner\n"
+        "assert 'ult_universe.analytics' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=src, check=True)
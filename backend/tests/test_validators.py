@@ -0,0 +1,99 @@
+"""
+Validator Utilities Tests
+
+This module tests the shared input validation layer which handles:
+- Conversion of lists, array.array and ndarrays to float64 arrays
+- Vectorized finiteness checks
+- Reporting the first offending index
+"""
+
+import array
+
+import numpy as np
+import pytest
+from utils.validators import (
+    as_finite_float_array,
+    validate_list_of_finite_numbers,
+    NonNumericValueError,
+    NonFiniteValueError,
+)
+
+
+class TestAsFiniteFloatArray:
+    """Test cases for as_finite_float_array"""
+
+    def test_converts_list(self):
+        """Test converting a list of ints and floats"""
+        result = as_finite_float_array([1, 2.5, 3])
+
+        assert result.dtype == np.float64
+        assert result.tolist() == [1.0, 2.5, 3.0]
+
+    def test_float64_ndarray_is_not_copied(self):
+        """Test that contiguous float64 arrays are returned as-is"""
+        values = np.array([1.0, 2.0, 3.0])
+
+        assert np.shares_memory(as_finite_float_array(values), values)
+
+    def test_array_array_is_not_copied(self):
+        """Test that array.array('d') buffers are viewed without copying"""
+        values = array.array("d", [1.0, 2.0, 3.0])
+
+        result = as_finite_float_array(values)
+
+        values[0] = 9.0
+        assert result[0] == 9.0
+
+    def test_reports_first_non_finite_index(self):
+        """Test that the first NaN/Inf index is reported"""
+        with pytest.raises(NonFiniteValueError, match=r"prices\[2\] must be finite") as exc_info:
+            as_finite_float_array(np.array([1.0, 2.0, np.inf, np.nan]), "prices")
+
+        assert exc_info.value.index == 2
+
+    def test_reports_first_non_numeric_index(self):
+        """Test that the first non-number is reported with its type"""
+        with pytest.raises(NonNumericValueError, match=r"prices\[1\] must be a number, got str"):
+            as_finite_float_array([1.0, "x", None], "prices")
+
+    def test_none_is_not_a_number(self):
+        """Test that None is rejected as a type error rather than NaN"""
+        with pytest.raises(NonNumericValueError, match="NoneType"):
+            as_finite_float_array([1.0, None])
+
+    def test_ragged_list_reports_non_numeric_index(self):
+        """Test that nested or ragged lists raise the per-index TypeError"""
+        with pytest.raises(NonNumericValueError, match=r"prices\[1\] must be a number, got list"):
+            as_finite_float_array([1.0, [2.0, 3.0], 4.0], "prices")
+        with pytest.raises(NonNumericValueError, match=r"values\[0\] must be a number, got list"):
+            as_finite_float_array([[1.0], [2.0, 3.0]])
+
+    def test_rejects_multidimensional_input(self):
+        """Test that 2-D input is rejected"""
+        with pytest.raises(ValueError, match="one-dimensional"):
+            as_finite_float_array(np.ones((2, 2)))
+
+
+class TestValidateListOfFiniteNumbers:
+    """Test cases for validate_list_of_finite_numbers"""
+
+    def test_error_types_are_backward_compatible(self):
+        """Test that the legacy TypeError/ValueError contract still holds"""
+        with pytest.raises(TypeError):
+            validate_list_of_finite_numbers([1, "a"])
+        with pytest.raises(ValueError, match=r"list\[0\] must be finite"):
+            validate_list_of_finite_numbers([float("nan")])
+
+    def test_accepts_array_likes(self):
+        """Test that ndarrays and pandas Series pass validation"""
+        import pandas as pd
+
+        validate_list_of_finite_numbers(np.array([1.0, 2.0]))
+        validate_list_of_finite_numbers(pd.Series([1.0, 2.0]))
+
+    def test_rejects_non_sequences(self):
+        """Test that scalars and strings raise TypeError"""
+        with pytest.raises(TypeError, match="sequence of numbers"):
+            validate_list_of_finite_numbers(5)
+        with pytest.raises(TypeError, match="sequence of numbers"):
+            validate_list_of_finite_numbers("123")
@@ -0,0 +1,123 @@
+"""
+Volume Profile Tests
+
+This module tests the incremental VolumeProfile which handles:
+- O(1) tick updates into price bins
+- Sliding-window expiry and exponential decay of old volume
+- Feeding the live profile to identify_levels
+"""
+
+import numpy as np
+import pytest
+from supply_demand import SupplyDemandAnalyzer, VolumeProfile
+
+
+class TestVolumeProfile:
+    """Test cases for VolumeProfile class"""
+
+    def test_incremental_matches_batch_profile(self):
+        """Test that tick-by-tick updates equal the batch binned profile"""
+        rng = np.random.default_rng(0)
+        prices = np.round(100 + rng.normal(0, 2, 500), 2)
+        volumes = rng.integers(1, 100, 500).astype(float)
+
+        profile = VolumeProfile(tick_size=0.5)
+        for i, (price, volume) in enumerate(zip(prices, volumes)):
+            profile.add(price, volume, timestamp=float(i))
+
+        levels, totals = profile.levels()
+        expected_levels, expected_totals = SupplyDemandAnalyzer().calculate_volume_profile(
+            np.column_stack([prices, volumes]), tick_size=0.5
+        )
+        np.testing.assert_allclose(levels, expected_levels)
+        np.testing.assert_allclose(totals, expected_totals)
+
+    def test_window_expires_old_volume(self):
+        """Test that volume older than the window is removed"""
+        profile = VolumeProfile(tick_size=1.0, window=60)
+        profile.add(100.0, 500, timestamp=0)
+        profile.add(105.0, 200, timestamp=30)
+        profile.add(100.0, 100, timestamp=70)
+
+        levels, totals = profile.levels()
+
+        assert levels.tolist() == [100.0, 105.0]
+        assert totals.tolist() == [100.0, 200.0]
+
+        profile.advance(200)
+        assert profile.total_volume == 0.0
+        assert len(profile.levels()[0]) == 0
+
+    def test_half_life_decay(self):
+        """Test exponential decay of old volume"""
+        profile = VolumeProfile(tick_size=1.0, half_life=10)
+        profile.add(100.0, 800, timestamp=0)
+        profile.add(101.0, 100, timestamp=20)
+
+        _, totals = profile.levels()
+
+        assert totals.tolist() == pytest.approx([200.0, 100.0])
+
+    def test_decay_stays_finite_over_long_runs(self):
+        """Test that rebasing keeps stored volumes bounded"""
+        profile = VolumeProfile(tick_size=1.0, half_life=1)
+        for t in range(0, 10_000, 10):
+            profile.add(100.0, 1.0, timestamp=float(t))
+
+        assert np.isfinite(profile.levels()[1]).all()
+        assert profile.total_volume == pytest.approx(1.0 / (1 - 0.5 ** 10))
+
+    def test_bins_grow_in_both_directions(self):
+        """Test prices far from the first tick"""
+        profile = VolumeProfile(tick_size=0.01)
+        profile.add(100.0, 1, timestamp=0)
+        profile.add(50.0, 2, timestamp=1)
+        profile.add(250.0, 3, timestamp=2)
+
+        levels, totals = profile.levels()
+
+        assert levels.tolist() == [50.0, 100.0, 250.0]
+        assert totals.tolist() == [2.0, 1.0, 3.0]
+
+    def test_outlier_tick_keeps_memory_bounded(self):
+        """Test a far-off bad tick adds one bin instead of the whole price range"""
+        profile = VolumeProfile(tick_size=0.0001)
+        profile.add(100.0, 1, timestamp=0)
+        profile.add(1e12, 2, timestamp=1)
+        profile.add_many([100.0, 1e-3], [3, 4], timestamps=[2, 3])
+
+        levels, totals = profile.levels()
+
+        assert levels.tolist() == pytest.approx([1e-3, 100.0, 1e12])
+        assert totals.tolist() == [4.0, 4.0, 2.0]
+        assert len(profile._bins) == 3
+
+    def test_expired_bins_are_dropped(self):
+        """Test bins emptied by the window do not accumulate as the price drifts"""
+        profile = VolumeProfile(tick_size=1.0, window=10)
+        for t in range(1000):
+            profile.add(100.0 + t, 1.0, timestamp=float(t))
+
+        assert len(profile._bins) <= 11
+        assert profile.total_volume == pytest.approx(11.0)
+
+    def test_add_many_with_window(self):
+        """Test batch ingestion honours the window"""
+        profile = VolumeProfile(tick_size=1.0, window=10)
+        profile.add_many([100.0, 101.0, 100.0], [5, 6, 7], timestamps=[0, 5, 15])
+
+        levels, totals = profile.levels()
+
+        assert levels.tolist() == [100.0, 101.0]
+        assert totals.tolist() == [7.0, 6.0]
+
+    def test_identify_levels_reads_live_profile(self):
+        """Test identify_levels accepts a VolumeProfile"""
+        profile = VolumeProfile(tick_size=1.0)
+        for price, volume in [(98.0, 8000), (99.0, 3000), (100.0, 5000), (102.0, 1000)]:
+            profile.add(price, volume, timestamp=0)
+
+        zones = SupplyDemandAnalyzer().identify_levels(profile, current_price=101.0)
+
+        assert zones[0].price == 98.0
+        assert all(z.price != 102.0 for z in zones)